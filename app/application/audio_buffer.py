@@ -0,0 +1,226 @@
+from threading import Lock
+
+import numpy as np
+
+
+class _SlabLease:
+    """Reference count shared by every ``AudioBuffer`` handle backed by one slab."""
+
+    __slots__ = ("_pool", "_slab", "_refs", "_lock")
+
+    def __init__(self, pool: "AudioSlabPool | None", slab: np.ndarray) -> None:
+        self._pool = pool
+        self._slab = slab
+        self._refs = 1
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._refs <= 0:
+                raise RuntimeError("Cannot retain an audio buffer that was already released")
+            self._refs += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._refs -= 1
+            if self._refs != 0:
+                return
+        if self._pool is not None:
+            self._pool._recycle(self._slab)
+
+
+class AudioBuffer:
+    """Read-only PCM audio with explicit sample-rate metadata.
+
+    Buffers published by ``AudioSlabWriter`` are views into a pooled slab; the
+    slab goes back to its pool once every handle has called ``release()``.
+    Buffers created directly (e.g. by TTS adapters) own their samples, so
+    ``release()`` is a no-op and consumers can release unconditionally.
+    """
+
+    __slots__ = ("_samples", "_sample_rate", "_lease", "_released")
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        *,
+        sample_rate: int,
+        _lease: _SlabLease | None = None,
+    ) -> None:
+        if sample_rate <= 0:
+            raise ValueError(f"sample_rate must be positive. Got: {sample_rate!r}")
+
+        view = samples.view()
+        view.flags.writeable = False
+
+        self._samples = view
+        self._sample_rate = int(sample_rate)
+        self._lease = _lease
+        self._released = False
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._samples
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._samples.dtype
+
+    @property
+    def channels(self) -> int:
+        return 1 if self._samples.ndim == 1 else int(self._samples.shape[1])
+
+    @property
+    def frames(self) -> int:
+        return int(self._samples.shape[0])
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self._sample_rate
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._samples.nbytes)
+
+    def __len__(self) -> int:
+        return self.frames
+
+    def retain(self) -> "AudioBuffer":
+        """Return an additional handle that keeps the underlying slab alive."""
+        if self._released:
+            raise RuntimeError("Cannot retain an audio buffer that was already released")
+        if self._lease is not None:
+            self._lease.acquire()
+        return AudioBuffer(self._samples, sample_rate=self._sample_rate, _lease=self._lease)
+
+    def release(self) -> None:
+        """Drop this handle's reference.  Calling it more than once is harmless."""
+        if self._released:
+            return
+        self._released = True
+        if self._lease is not None:
+            self._lease.release()
+
+
+def as_audio_buffer(audio: AudioBuffer | np.ndarray, *, sample_rate: int) -> AudioBuffer:
+    """Wrap a bare ndarray (assumed to be at ``sample_rate``) without copying."""
+    if isinstance(audio, AudioBuffer):
+        return audio
+    return AudioBuffer(np.asarray(audio), sample_rate=sample_rate)
+
+
+class AudioSlabWriter:
+    """Accumulates captured chunks into a pooled slab without per-chunk lists.
+
+    If an utterance outgrows the slab, the writer moves to a larger private
+    array and hands the pooled slab back immediately.
+    """
+
+    def __init__(self, pool: "AudioSlabPool", *, sample_rate: int) -> None:
+        self._pool = pool
+        self._sample_rate = sample_rate
+        self._slab: np.ndarray | None = pool._take()
+        self._pooled = True
+        self._frames = 0
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    def view(self) -> np.ndarray:
+        """Return a read-only view of the frames written so far."""
+        slab = self._require_slab()
+        view = slab[: self._frames]
+        view.flags.writeable = False
+        return view
+
+    def append(self, chunk: np.ndarray) -> None:
+        slab = self._require_slab()
+        n = int(chunk.shape[0])
+        if self._frames + n > slab.shape[0]:
+            slab = self._grow(self._frames + n)
+        slab[self._frames : self._frames + n] = chunk.reshape(slab[:n].shape)
+        self._frames += n
+
+    def publish(self) -> AudioBuffer:
+        """Hand the written frames over as an ``AudioBuffer`` (the writer is spent)."""
+        slab = self._require_slab()
+        lease = _SlabLease(self._pool if self._pooled else None, slab)
+        buffer = AudioBuffer(slab[: self._frames], sample_rate=self._sample_rate, _lease=lease)
+        self._slab = None
+        return buffer
+
+    def discard(self) -> None:
+        """Return the slab to the pool without publishing anything."""
+        if self._slab is None:
+            return
+        if self._pooled:
+            self._pool._recycle(self._slab)
+        self._slab = None
+
+    def _require_slab(self) -> np.ndarray:
+        if self._slab is None:
+            raise RuntimeError("AudioSlabWriter was already published or discarded")
+        return self._slab
+
+    def _grow(self, min_frames: int) -> np.ndarray:
+        old = self._require_slab()
+        new_frames = max(min_frames, old.shape[0] * 2)
+        grown = np.empty((new_frames, *old.shape[1:]), dtype=old.dtype)
+        grown[: self._frames] = old[: self._frames]
+        if self._pooled:
+            self._pool._recycle(old)
+            self._pooled = False
+        self._slab = grown
+        return grown
+
+
+class AudioSlabPool:
+    """Pool of preallocated PCM slabs reused across utterances.
+
+    Slabs are allocated lazily and at most ``max_free_slabs`` idle slabs are
+    kept around, so steady-state capture does not allocate per utterance.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity_frames: int,
+        channels: int = 1,
+        dtype: np.dtype | type = np.float32,
+        max_free_slabs: int = 6,
+    ) -> None:
+        if capacity_frames <= 0:
+            raise ValueError(f"capacity_frames must be positive. Got: {capacity_frames!r}")
+
+        self.capacity_frames = int(capacity_frames)
+        self.channels = int(channels)
+        self.dtype = np.dtype(dtype)
+        self.max_free_slabs = int(max_free_slabs)
+
+        self._lock = Lock()
+        self._free: list[np.ndarray] = []
+
+    @property
+    def free_slabs(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+    def writer(self, *, sample_rate: int) -> AudioSlabWriter:
+        return AudioSlabWriter(self, sample_rate=sample_rate)
+
+    def _take(self) -> np.ndarray:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        shape = (self.capacity_frames,) if self.channels == 1 else (self.capacity_frames, self.channels)
+        return np.empty(shape, dtype=self.dtype)
+
+    def _recycle(self, slab: np.ndarray) -> None:
+        with self._lock:
+            if len(self._free) < self.max_free_slabs:
+                self._free.append(slab)
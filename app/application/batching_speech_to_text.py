@@ -0,0 +1,105 @@
+from collections import deque
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.port.speech_to_text import BatchSpeechToText
+
+
+class _PendingTranscription:
+    __slots__ = ("audio", "done", "text", "error")
+
+    def __init__(self, audio: AudioBuffer) -> None:
+        self.audio = audio
+        self.done = Event()
+        self.text = ""
+        self.error: Exception | None = None
+
+
+class BatchingSpeechToText:
+    """Coalesces concurrent ``transcribe()`` calls into batched inference.
+
+    Each caller blocks until its own result is ready.  A dispatcher thread
+    waits up to ``window`` seconds after the first pending utterance (or until
+    ``max_batch_size`` are queued) and hands the batch to
+    ``stt.transcribe_batch``.  A lone utterance goes through the regular
+    ``transcribe`` path so the common case pays no batching overhead beyond
+    the window.
+    """
+
+    def __init__(
+        self,
+        *,
+        stt: BatchSpeechToText,
+        window: float = 0.05,
+        max_batch_size: int = 4,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1. Got: {max_batch_size!r}")
+
+        self._stt = stt
+        self._window = max(0.0, float(window))
+        self._max_batch_size = int(max_batch_size)
+
+        self._cond = Condition(Lock())
+        self._pending: deque[_PendingTranscription] = deque()
+        self._thread: Thread | None = None
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        request = _PendingTranscription(audio)
+        with self._cond:
+            self._ensure_dispatcher_unsafe()
+            self._pending.append(request)
+            self._cond.notify()
+
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.text
+
+    def _ensure_dispatcher_unsafe(self) -> None:
+        # Assumes _cond is already held by the caller.
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = Thread(target=self._dispatch_loop, daemon=True)
+        self._thread.start()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            self._run_batch(batch)
+
+    def _next_batch(self) -> list[_PendingTranscription]:
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+
+            deadline = monotonic() + self._window
+            while len(self._pending) < self._max_batch_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+
+            count = min(len(self._pending), self._max_batch_size)
+            return [self._pending.popleft() for _ in range(count)]
+
+    def _run_batch(self, batch: list[_PendingTranscription]) -> None:
+        try:
+            if len(batch) == 1:
+                texts = [self._stt.transcribe(batch[0].audio)]
+            else:
+                texts = self._stt.transcribe_batch([request.audio for request in batch])
+            if len(texts) != len(batch):
+                raise RuntimeError(
+                    f"Batched STT returned {len(texts)} results for {len(batch)} utterances"
+                )
+        except Exception as e:  # Deliver the failure to every waiting caller.
+            for request in batch:
+                request.error = e
+                request.done.set()
+            return
+
+        for request, text in zip(batch, texts):
+            request.text = text
+            request.done.set()
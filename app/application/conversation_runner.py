@@ -1,13 +1,22 @@
 from collections.abc import Callable
-from queue import Queue
+from contextlib import suppress
+from dataclasses import replace
+from itertools import count
+from queue import Empty, Full, Queue
 from threading import BoundedSemaphore, Event, Lock, Thread
-from time import monotonic
+from time import monotonic, perf_counter
 
 import numpy as np
 
+from app.application.audio_buffer import AudioBuffer
 from app.application.conversation_service import ConversationService
 from app.application.errors import ExternalServiceError
 from app.application.interruption_context import build_interruption_prompt
+from app.application.pipeline_status import (
+    PipelineStage,
+    PipelineStatus,
+    PipelineStatusTracker,
+)
 from app.application.port.listener import Listener
 from app.application.port.speaker import Speaker
 from app.application.port.speech_to_text import SpeechToText
@@ -16,14 +25,16 @@ from app.application.reply_queue import LatestReplyQueue
 from app.application.sleep_watchdog import SleepWatchdog
 from app.application.speaker_loop import SpeakerLoop
 from app.application.wake_word_detector import WakeWordDetector
+from app.utils.event_log import EventLog, EventType, elapsed_ms
 from app.utils.logger import Logger
 
 
 class ConversationRunner:
     SLEEP_TIMEOUT_SECONDS = 180.0
-    SLEEP_POLL_INTERVAL_SECONDS = 0.5
     _MAX_INFLIGHT_REQUESTS: int = 2
     _UTTERANCE_QUEUE_SIZE: int = 3
+    # Queued by stop() to wake run(); never produced by a listener.
+    _STOP_SENTINEL = AudioBuffer(np.zeros(0, dtype=np.float32), sample_rate=16_000)
 
     def __init__(
         self,
@@ -33,6 +44,7 @@ class ConversationRunner:
         tts: TextToSpeech,
         speaker: Speaker,
         logger: Logger,
+        event_log: EventLog | None = None,
     ) -> None:
         self.listener = listener
         self.stt = stt
@@ -40,22 +52,33 @@ class ConversationRunner:
         self.tts = tts
         self.speaker = speaker
         self.logger = logger
+        self.event_log = event_log or EventLog()
         self._wake_word_detector = WakeWordDetector()
         self._is_awake = False
-        self.utterance_queue: Queue[np.ndarray] = Queue(maxsize=self._UTTERANCE_QUEUE_SIZE)
+        self.utterance_queue: Queue[AudioBuffer] = Queue(maxsize=self._UTTERANCE_QUEUE_SIZE)
         self.stop_listening_event = Event()
         self.reply_queue = LatestReplyQueue()
+        self.pipeline_status = PipelineStatusTracker()
         self._speaker_loop = SpeakerLoop(
             tts=tts,
             speaker=speaker,
             reply_queue=self.reply_queue,
             on_reply_completed=self._on_reply_completed,
+            on_speaking_end=self._on_speaking_end,
             logger=logger,
+            event_log=self.event_log,
+            pipeline_status=self.pipeline_status,
         )
         self._state_lock = Lock()
         self._inflight_semaphore = BoundedSemaphore(value=self._MAX_INFLIGHT_REQUESTS)
         self._listener_thread: Thread | None = None
+        self._utterance_ids = count(1)
+        self._calibration_started_at: float | None = None
 
+        self._sleep_watchdog = SleepWatchdog(
+            attempt_sleep=self._try_go_to_sleep,
+            logger=logger,
+        )
         self._sleep_watchdog_thread: Thread | None = None
         self._last_activity_at: float = monotonic()
         self._inflight_workers = 0
@@ -64,12 +87,22 @@ class ConversationRunner:
         self.on_calibration_start: Callable[[], None] | None = None
         self.on_calibration_end: Callable[[float], None] | None = None
         self.on_calibration_error: Callable[[Exception], None] | None = None
+        self.on_sleep: Callable[[], None] | None = None
+        self.on_wake: Callable[[], None] | None = None
 
     @property
     def is_awake(self) -> bool:
         with self._state_lock:
             return self._is_awake
 
+    def status_snapshot(self) -> PipelineStatus:
+        """Current stage, input level and last-turn latencies, without blocking the pipeline."""
+        return replace(
+            self.pipeline_status.snapshot(),
+            input_level=self.listener.get_input_level(),
+            threshold=self.listener.get_last_threshold(),
+        )
+
     def request_noise_recalibration(self) -> None:
         self.listener.request_recalibration()
         self._log("Noise calibration requested.")
@@ -82,31 +115,58 @@ class ConversationRunner:
         self._log("Ready. Say 'Buddy' to start.")
 
         while True:
-            audio: np.ndarray = self.utterance_queue.get()
+            audio: AudioBuffer = self.utterance_queue.get()
+            if audio is self._STOP_SENTINEL or self.stop_listening_event.is_set():
+                if audio is not self._STOP_SENTINEL:
+                    audio.release()
+                return
+            utterance_id = next(self._utterance_ids)
+            self.event_log.emit(
+                EventType.UTTERANCE_CAPTURED,
+                utterance_id=utterance_id,
+                audio_seconds=round(audio.duration, 3),
+                bytes=audio.nbytes,
+            )
 
             # Limit concurrent OpenAI calls.
             self._inflight_semaphore.acquire()
             worker = Thread(
                 target=self._process_utterance,
-                args=(audio,),
+                args=(audio, utterance_id),
                 daemon=True,
             )
             try:
                 worker.start()
             except RuntimeError as e:
                 self._log(f"Error starting worker thread: {e}")
+                audio.release()
                 self._inflight_semaphore.release()
                 continue
 
-    def _process_utterance(self, audio: np.ndarray) -> None:
+    def _process_utterance(self, audio: AudioBuffer, utterance_id: int = 0) -> None:
         with self._state_lock:
             self._inflight_workers += 1
+            self._reschedule_sleep_unsafe()
         try:
             # Snapshot speaking state before STT so we don't miss an interruption
             # due to STT latency.
             was_speaking, speaking_text = self._speaker_loop.snapshot_speaking_state()
 
-            user_text = self.stt.transcribe(audio)
+            audio_seconds = round(audio.duration, 3)
+            started = turn_started = perf_counter()
+            try:
+                with self.pipeline_status.stage(PipelineStage.TRANSCRIBING):
+                    user_text = self.stt.transcribe(audio)
+            finally:
+                # The captured slab can be reused as soon as STT is done with it.
+                audio.release()
+            self.event_log.emit(
+                EventType.TRANSCRIBED,
+                utterance_id=utterance_id,
+                duration_ms=elapsed_ms(started),
+                audio_seconds=audio_seconds,
+                chars=len(user_text),
+            )
             if not user_text:
                 return
 
@@ -123,6 +183,11 @@ class ConversationRunner:
                     with self._state_lock:
                         self._is_awake = True
                         self._last_activity_at = monotonic()
+                        self._reschedule_sleep_unsafe()
+                        self.listener.set_low_power(False)
+                    self.pipeline_status.set_awake(True)
+                    if self.on_wake:
+                        self.on_wake()
                 else:
                     return
 
@@ -134,9 +199,21 @@ class ConversationRunner:
             )
 
             request_id = self.reply_queue.next_request_id()
-            reply = self.conversation_service.prepare_reply(
-                user_text,
-                ephemeral_system_prompt=ephemeral_system_prompt,
+            self.pipeline_status.turn_captured(request_id, turn_started)
+            started = perf_counter()
+            with self.pipeline_status.stage(PipelineStage.THINKING):
+                reply = self.conversation_service.prepare_reply(
+                    user_text,
+                    ephemeral_system_prompt=ephemeral_system_prompt,
+                )
+            self.event_log.emit(
+                EventType.REPLY_GENERATED,
+                utterance_id=utterance_id,
+                request_id=request_id,
+                duration_ms=elapsed_ms(started),
+                prompt_chars=len(user_text),
+                chars=len(reply or ""),
+                barge_in=was_speaking or None,
             )
             if not reply or not reply.strip():
                 return
@@ -145,17 +222,44 @@ class ConversationRunner:
             self.reply_queue.publish(request_id=request_id, text=reply)
         except ExternalServiceError as e:
             self._log(f"External service error: {e}")
+            self.event_log.emit(EventType.ERROR, utterance_id=utterance_id, stage="utterance", error=str(e))
         except (OSError, RuntimeError, ValueError) as e:
             self._log(f"Error processing utterance: {e}")
+            self.event_log.emit(EventType.ERROR, utterance_id=utterance_id, stage="utterance", error=str(e))
         finally:
             with self._state_lock:
                 self._inflight_workers -= 1
+                self._reschedule_sleep_unsafe()
             self._inflight_semaphore.release()
 
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop listening, playback and the sleep watchdog, and wait for their threads.
+
+        ``run()`` returns soon after; the caller joins the thread it runs on.
+        """
+        self.stop_listening_event.set()
+        self._sleep_watchdog.stop()
+        self._speaker_loop.stop(timeout)
+        for thread in (self._listener_thread, self._sleep_watchdog_thread):
+            if thread is not None:
+                thread.join(timeout)
+
+        # Unprocessed utterances are dropped (handing their slabs back), then run() is woken.
+        while True:
+            try:
+                self.utterance_queue.get_nowait().release()
+            except Empty:
+                break
+        with suppress(Full):
+            self.utterance_queue.put_nowait(self._STOP_SENTINEL)
+
     def _start_listener_thread(self) -> None:
         if self._listener_thread and self._listener_thread.is_alive():
             return
 
+        with self._state_lock:
+            # Until the wake word is heard, only it matters.
+            self.listener.set_low_power(not self._is_awake)
         self._listener_thread = self.listener.listen(
             utterance_queue=self.utterance_queue,
             stop_event=self.stop_listening_event,
@@ -167,20 +271,36 @@ class ConversationRunner:
         )
 
     def _on_calibration_start(self) -> None:
+        self._calibration_started_at = perf_counter()
+        self.event_log.emit(EventType.CALIBRATION_STARTED)
         self._log("Calibrating noise level...")
         if self.on_calibration_start:
             self.on_calibration_start()
 
     def _on_calibration_end(self, threshold: float) -> None:
+        self.event_log.emit(
+            EventType.CALIBRATION_ENDED,
+            duration_ms=self._calibration_elapsed_ms(),
+            threshold=threshold,
+        )
         self._log(f"Noise calibration complete. threshold={threshold:.6f}")
         if self.on_calibration_end:
             self.on_calibration_end(threshold)
 
     def _on_calibration_error(self, error: Exception) -> None:
+        self.event_log.emit(
+            EventType.CALIBRATION_FAILED,
+            duration_ms=self._calibration_elapsed_ms(),
+            error=str(error),
+        )
         self._log(f"Noise calibration failed: {error}")
         if self.on_calibration_error:
             self.on_calibration_error(error)
 
+    def _calibration_elapsed_ms(self) -> float | None:
+        started, self._calibration_started_at = self._calibration_started_at, None
+        return elapsed_ms(started) if started is not None else None
+
     def _log(self, message: str) -> None:
         self.logger.log(message)
 
@@ -191,17 +311,7 @@ class ConversationRunner:
         if self._sleep_watchdog_thread and self._sleep_watchdog_thread.is_alive():
             return
 
-        watchdog = SleepWatchdog(
-            poll_interval=self.SLEEP_POLL_INTERVAL_SECONDS,
-            should_sleep=self._should_sleep,
-            attempt_sleep=self._try_go_to_sleep,
-            logger=self.logger,
-        )
-        self._sleep_watchdog_thread = watchdog.start()
-
-    def _should_sleep(self) -> bool:
-        with self._state_lock:
-            return self._should_sleep_unsafe(now=monotonic())
+        self._sleep_watchdog_thread = self._sleep_watchdog.start()
 
     def _try_go_to_sleep(self) -> bool:
         """Atomically transition to sleep if the condition still holds.
@@ -212,6 +322,11 @@ class ConversationRunner:
             if not self._should_sleep_unsafe(now=monotonic()):
                 return False
             self._is_awake = False
+            self._reschedule_sleep_unsafe()
+            self.listener.set_low_power(True)
+        self.pipeline_status.set_awake(False)
+        if self.on_sleep:
+            self.on_sleep()
         return True
 
     def _should_sleep_unsafe(self, *, now: float) -> bool:
@@ -227,8 +342,24 @@ class ConversationRunner:
 
         return (now - self._last_activity_at) >= self.SLEEP_TIMEOUT_SECONDS
 
+    def _reschedule_sleep_unsafe(self) -> None:
+        # Assumes _state_lock is already held by the caller, so deadlines reach
+        # the watchdog in the same order as the state changes behind them.
+        busy = self._inflight_workers > 0 or self._speaker_loop.is_speaking
+        if not self._is_awake or busy:
+            # Whatever ends the busy period schedules again.
+            self._sleep_watchdog.schedule(None)
+        else:
+            self._sleep_watchdog.schedule(self._last_activity_at + self.SLEEP_TIMEOUT_SECONDS)
+
     def _on_reply_completed(self, text: str) -> None:
         """Called by SpeakerLoop when a reply has been played back in full."""
         self.conversation_service.commit_assistant_reply(text)
         with self._state_lock:
             self._last_activity_at = monotonic()
+            self._reschedule_sleep_unsafe()
+
+    def _on_speaking_end(self) -> None:
+        """Called by SpeakerLoop whenever playback stops (completed, interrupted or failed)."""
+        with self._state_lock:
+            self._reschedule_sleep_unsafe()
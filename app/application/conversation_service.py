@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
-from threading import Lock
+from threading import Lock, Thread
 
+from app.application.long_term_memory import LongTermMemory, format_memory_prompt
 from app.application.port.chat_client import ChatClient
+from app.application.port.conversation_store import ConversationStore
 from app.domain.entity.conversation import Conversation
 from app.domain.vo.chat_message import ChatMessage, ChatRole
 
@@ -21,8 +23,33 @@ class ConversationService:
         "If the user writes Japanese, you may include short Japanese hints."
     )
 
+    # Optional persistence; completed turns are handed to it without waiting on disk.
+    store: ConversationStore | None = None
+    # Optional long-term memory; relevant past turns are added as a system message.
+    memory: LongTermMemory | None = None
+
     _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
 
+    def resume_history(self, limit: int) -> Thread | None:
+        """Load the last ``limit`` stored turns on a background thread.
+
+        Replies prepared before the load finishes simply run without the old
+        context; restored turns are inserted ahead of any new ones.
+        """
+        if self.store is None or limit <= 0:
+            return None
+
+        store = self.store
+
+        def load() -> None:
+            turns = store.load_recent(limit)
+            with self._lock:
+                self.conversation.restore(turns)
+
+        thread = Thread(target=load, name="resume-history", daemon=True)
+        thread.start()
+        return thread
+
     def reply(self, user_text: str) -> str:
         reply = self.prepare_reply(user_text)
         if reply:
@@ -39,12 +66,20 @@ class ConversationService:
         if not user_text:
             return ""
 
+        # Bounded by the memory's latency budget; runs before taking the lock.
+        recalled = self.memory.recall(user_text) if self.memory is not None else []
+
         with self._lock:
             self.conversation.start_turn(user_text)
 
             messages: list[ChatMessage] = []
             if self.system_prompt:
                 messages.append(ChatMessage(role=ChatRole.SYSTEM, content=self.system_prompt))
+            # Turns already in the recent context need no second copy.
+            recent = self.conversation.recent_context(self.context_turns)
+            memory_prompt = format_memory_prompt([t for t in recalled if t not in recent])
+            if memory_prompt:
+                messages.append(ChatMessage(role=ChatRole.SYSTEM, content=memory_prompt))
             if ephemeral_system_prompt:
                 messages.append(
                     ChatMessage(role=ChatRole.SYSTEM, content=ephemeral_system_prompt.strip())
@@ -69,4 +104,10 @@ class ConversationService:
             return
 
         with self._lock:
-            self.conversation.complete_turn(reply)
+            turn = self.conversation.complete_turn(reply)
+        if turn is None:
+            return
+        if self.store is not None:
+            self.store.append_turn(turn)
+        if self.memory is not None:
+            self.memory.remember(turn)
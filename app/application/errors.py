@@ -12,3 +12,11 @@ class SpeechToTextError(ExternalServiceError):
 
 class TextToSpeechError(ExternalServiceError):
     """Raised when text-to-speech synthesis fails."""
+
+
+class EmbeddingError(ExternalServiceError):
+    """Raised when text embedding fails."""
+
+
+class DeadlineExceededError(ExternalServiceError):
+    """Raised when an external service call does not finish within its deadline."""
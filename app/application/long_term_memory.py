@@ -0,0 +1,144 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from queue import Empty, Queue
+from threading import Event, Thread
+
+from app.application.errors import ExternalServiceError
+from app.application.port.embedder import Embedder
+from app.application.port.turn_memory_index import TurnMemoryIndex
+from app.domain.vo.turn import Turn
+from app.utils.logger import Logger
+
+
+def turn_text(turn: Turn) -> str:
+    """The text a turn is embedded as."""
+    return f"User: {turn.user_utterance}\nAssistant: {turn.assistant_reply}"
+
+
+def format_memory_prompt(turns: Sequence[Turn]) -> str | None:
+    """System message listing recalled turns, or None when nothing was recalled."""
+    if not turns:
+        return None
+    lines = [
+        "Relevant moments from earlier conversations with this user "
+        "(use them only if they help; do not recite them):"
+    ]
+    for turn in turns:
+        lines.append(f"- User said: {turn.user_utterance}")
+        lines.append(f"  You replied: {turn.assistant_reply}")
+    return "\n".join(lines)
+
+
+class LongTermMemory:
+    """Embeds committed turns and recalls the most relevant ones later.
+
+    ``remember`` only enqueues; a background thread embeds queued turns in
+    one request per batch and appends them to the index.  ``recall`` embeds
+    the new utterance and searches the index, but gives up after
+    ``latency_budget`` seconds: a slow embedding endpoint costs the reply its
+    memories, never its latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedder: Embedder,
+        index: TurnMemoryIndex,
+        top_k: int = 3,
+        min_score: float = 0.3,
+        latency_budget: float = 0.3,
+        logger: Logger | None = None,
+    ) -> None:
+        self._embedder = embedder
+        self._index = index
+        self.top_k = max(0, int(top_k))
+        self.min_score = float(min_score)
+        self.latency_budget = max(0.0, float(latency_budget))
+        self._logger = logger
+
+        # Two workers so one stuck request does not block the next recall.
+        self._recall_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="memory-recall")
+        self._queue: Queue[Turn | Event | None] = Queue()
+        self._closed = False
+        self._thread = Thread(target=self._run, name="memory-indexer", daemon=True)
+        self._thread.start()
+
+    def remember(self, turn: Turn) -> None:
+        if self._closed:
+            return
+        self._queue.put(turn)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every turn remembered so far is indexed (or failed)."""
+        if self._closed:
+            return True
+        done = Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def recall(self, query: str) -> list[Turn]:
+        """Up to ``top_k`` past turns relevant to ``query``, most relevant first."""
+        query = query.strip()
+        if not query or self.top_k == 0 or self._closed:
+            return []
+
+        future = self._recall_pool.submit(self._search, query)
+        try:
+            return future.result(timeout=self.latency_budget)
+        except FutureTimeoutError:
+            future.cancel()
+            self._log(f"[Memory] Recall skipped (over {self.latency_budget * 1000:.0f} ms budget)")
+        except (ExternalServiceError, OSError, ValueError) as e:
+            self._log(f"[Memory] Recall failed: {e}")
+        return []
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._recall_pool.shutdown(wait=False, cancel_futures=True)
+        self._index.close()
+
+    def _search(self, query: str) -> list[Turn]:
+        vector = self._embedder.embed([query])[0]
+        hits = self._index.search(vector, self.top_k)
+        return [turn for score, turn in hits if score >= self.min_score]
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            turns: list[Turn] = []
+            waiters: list[Event] = []
+            # Drain whatever is queued so a burst costs one embedding request.
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, Event):
+                    waiters.append(item)
+                else:
+                    turns.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if turns:
+                self._index_turns(turns)
+            for waiter in waiters:
+                waiter.set()
+
+    def _index_turns(self, turns: list[Turn]) -> None:
+        try:
+            vectors = self._embedder.embed([turn_text(turn) for turn in turns])
+            self._index.add(turns, vectors)
+        except (ExternalServiceError, OSError, ValueError) as e:
+            # Memory is best-effort; the conversation goes on without it.
+            self._log(f"[Memory] Failed to index {len(turns)} turn(s): {e}")
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.log(message)
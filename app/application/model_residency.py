@@ -0,0 +1,102 @@
+from threading import Lock, Thread, Timer
+from time import perf_counter
+
+from app.application.port.resident_model import ModelResidency, ResidentModel
+from app.utils.logger import Logger
+from app.utils.memory import current_rss_bytes, format_bytes
+
+
+class ModelResidencyManager:
+    """Reduces or releases heavy local models while the conversation sleeps.
+
+    ``on_sleep`` arms a one-shot timer; when it fires, each model is moved to
+    its configured sleep residency.  ``on_wake`` cancels the timer and reloads
+    anything that was reduced on a background thread, so the first reply after
+    the wake word overlaps with the reload instead of waiting for it.
+    """
+
+    def __init__(
+        self,
+        *,
+        models: dict[str, ResidentModel],
+        sleep_residency: dict[str, ModelResidency],
+        release_after: float,
+        logger: Logger,
+    ) -> None:
+        unknown = set(sleep_residency) - set(models)
+        if unknown:
+            raise ValueError(f"sleep_residency refers to unknown models: {sorted(unknown)}")
+
+        self._models = models
+        self._sleep_residency = sleep_residency
+        self._release_after = max(0.0, float(release_after))
+        self._logger = logger
+
+        self._lock = Lock()
+        self._timer: Timer | None = None
+        # Bumped on every sleep/wake so a stale timer or reload can detect it lost a race.
+        self._generation = 0
+
+    def on_sleep(self) -> None:
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._cancel_timer_unsafe()
+            timer = Timer(self._release_after, self._reduce, args=(generation,))
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
+    def on_wake(self) -> None:
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._cancel_timer_unsafe()
+
+        if all(model.residency == ModelResidency.FULL for model in self._models.values()):
+            return
+
+        Thread(target=self._restore, args=(generation,), daemon=True).start()
+
+    def _cancel_timer_unsafe(self) -> None:
+        # Assumes _lock is already held by the caller.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def _reduce(self, generation: int) -> None:
+        for name, residency in self._sleep_residency.items():
+            if not self._is_current(generation):
+                return
+            self._apply(name, residency)
+
+    def _restore(self, generation: int) -> None:
+        for name in self._models:
+            if not self._is_current(generation):
+                return
+            self._apply(name, ModelResidency.FULL)
+
+    def _apply(self, name: str, residency: ModelResidency) -> None:
+        model = self._models[name]
+        previous = model.residency
+        if previous == residency:
+            return
+
+        rss_before = current_rss_bytes()
+        started = perf_counter()
+        try:
+            model.set_residency(residency)
+        except Exception as e:  # Keep the conversation running; the adapter reloads lazily.
+            self._logger.log(f"[Residency] Failed to set {name} to {residency}: {e}")
+            return
+        elapsed = perf_counter() - started
+        rss_after = current_rss_bytes()
+
+        self._logger.log(
+            f"[Residency] {name}: {previous} -> {residency} in {elapsed:.2f}s "
+            f"(rss {format_bytes(rss_before)} -> {format_bytes(rss_after)})"
+        )
@@ -0,0 +1,109 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from threading import Lock
+from time import perf_counter
+from types import MappingProxyType
+from typing import Mapping
+
+
+class PipelineStage(StrEnum):
+    LISTENING = "listening"
+    TRANSCRIBING = "transcribing"
+    THINKING = "thinking"
+    SYNTHESIZING = "synthesizing"
+    SPEAKING = "speaking"
+
+
+# When several turns overlap, report the stage closest to the user's ears.
+_STAGE_PRIORITY = (
+    PipelineStage.SPEAKING,
+    PipelineStage.SYNTHESIZING,
+    PipelineStage.THINKING,
+    PipelineStage.TRANSCRIBING,
+)
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class PipelineStatus:
+    """Immutable snapshot of what the conversation pipeline is doing."""
+
+    stage: PipelineStage = PipelineStage.LISTENING
+    is_awake: bool = False
+    # Latest microphone level (mean |x| of the last chunk) and calibrated threshold.
+    input_level: float = 0.0
+    threshold: float | None = None
+    # Stage -> duration (ms) of the most recent completed run of that stage.
+    last_latencies_ms: Mapping[PipelineStage, float] = field(default=_EMPTY)
+    # End of capture -> first audio of the reply, for the most recent turn.
+    last_response_ms: float | None = None
+
+
+class PipelineStatusTracker:
+    """Tracks active stages and last-turn latencies for status displays.
+
+    Writers (worker and speaker threads) serialize on a private lock and
+    publish a fresh immutable ``PipelineStatus``; ``snapshot()`` just reads
+    that reference, so a UI poller never blocks pipeline threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._active: dict[PipelineStage, int] = {}
+        self._latencies: dict[PipelineStage, float] = {}
+        self._turn_started: dict[int, float] = {}
+        self._snapshot = PipelineStatus()
+
+    def snapshot(self) -> PipelineStatus:
+        return self._snapshot
+
+    @contextmanager
+    def stage(self, stage: PipelineStage) -> Iterator[None]:
+        started = perf_counter()
+        with self._lock:
+            self._active[stage] = self._active.get(stage, 0) + 1
+            self._publish_unsafe()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active[stage] -= 1
+                self._latencies[stage] = round((perf_counter() - started) * 1000, 1)
+                self._publish_unsafe()
+
+    def turn_captured(self, request_id: int, captured_at: float) -> None:
+        """Remember when the utterance behind ``request_id`` finished (``perf_counter`` time)."""
+        with self._lock:
+            self._turn_started[request_id] = captured_at
+            # Only the latest few requests can still reach playback.
+            for stale in [rid for rid in self._turn_started if rid < request_id - 8]:
+                del self._turn_started[stale]
+
+    def playback_started(self, request_id: int) -> None:
+        with self._lock:
+            captured_at = self._turn_started.pop(request_id, None)
+            if captured_at is None:
+                return
+            self._snapshot = replace(
+                self._snapshot,
+                last_response_ms=round((perf_counter() - captured_at) * 1000, 1),
+            )
+
+    def set_awake(self, is_awake: bool) -> None:
+        with self._lock:
+            self._snapshot = replace(self._snapshot, is_awake=is_awake)
+
+    def _publish_unsafe(self) -> None:
+        # Assumes _lock is already held by the caller.
+        stage = next(
+            (s for s in _STAGE_PRIORITY if self._active.get(s, 0) > 0),
+            PipelineStage.LISTENING,
+        )
+        self._snapshot = replace(
+            self._snapshot,
+            stage=stage,
+            last_latencies_ms=MappingProxyType(dict(self._latencies)),
+        )
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from app.domain.vo.turn import Turn
+
+
+@dataclass(frozen=True)
+class TurnSearchHit:
+    turn_id: int
+    session_id: str
+    created_at: datetime
+    turn: Turn
+    # Matching fragment with hits wrapped in [brackets].
+    snippet: str
+
+
+class ConversationStore(Protocol):
+    def append_turn(self, turn: Turn) -> None:
+        """Persist a completed turn.  Must not block on disk I/O."""
+        ...
+
+    def load_recent(self, limit: int) -> list[Turn]:
+        """Return up to ``limit`` most recent turns, oldest first."""
+        ...
+
+    def close(self) -> None:
+        """Flush pending writes and release resources."""
+        ...
+
+
+class ConversationSearch(Protocol):
+    def search(self, query: str, *, limit: int = 50) -> list[TurnSearchHit]:
+        """Return stored turns matching ``query``, best matches first."""
+        ...
@@ -3,23 +3,38 @@ from queue import Queue
 from threading import Event, Thread
 from typing import Protocol
 
-import numpy as np
+from app.application.audio_buffer import AudioBuffer
 
 
 class Listener(Protocol):
     def listen(
         self,
         *,
-        utterance_queue: Queue[np.ndarray],
+        utterance_queue: Queue[AudioBuffer],
         stop_event: Event,
         on_speech_start: Callable[[], None] | None,
         on_calibration_start: Callable[[], None] | None,
         on_calibration_end: Callable[[float], None] | None,
         on_calibration_error: Callable[[Exception], None] | None,
     ) -> Thread:
-        """Listen continuously and publish utterances to a queue."""
+        """Listen continuously and publish utterances to a queue.
+
+        Consumers own the published buffers and must ``release()`` them.
+        """
         ...
 
     def request_recalibration(self) -> None:
         """Request noise recalibration."""
         ...
+
+    def get_last_threshold(self) -> float | None:
+        """Return the most recently calibrated speech threshold, if any."""
+        ...
+
+    def get_input_level(self) -> float:
+        """Return the level of the most recent input chunk (cheap; safe from any thread)."""
+        ...
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Hint that only a wake word matters (asleep), so idle listening may trade latency for CPU."""
+        ...
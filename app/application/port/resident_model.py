@@ -0,0 +1,20 @@
+from enum import StrEnum
+from typing import Protocol
+
+
+class ModelResidency(StrEnum):
+    FULL = "full"
+    # Smaller footprint that still serves requests (e.g. quantized or fast model only).
+    REDUCED = "reduced"
+    RELEASED = "released"
+
+
+class ResidentModel(Protocol):
+    @property
+    def residency(self) -> ModelResidency:
+        """Current residency of the model weights."""
+        ...
+
+    def set_residency(self, residency: ModelResidency) -> None:
+        """Load, reduce or release the model weights.  Blocks until done."""
+        ...
@@ -1,13 +1,13 @@
 from threading import Event
 from typing import Protocol
 
-import numpy as np
+from app.application.audio_buffer import AudioBuffer
 
 
 class Speaker(Protocol):
     def speak(
         self,
-        audio: np.ndarray,
+        audio: AudioBuffer,
         stop_event: Event | None = None,
     ) -> bool:
         """Play back audio.  Returns True if playback completed, False if interrupted."""
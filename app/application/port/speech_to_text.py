@@ -1,9 +1,16 @@
+from collections.abc import Sequence
 from typing import Protocol
 
-import numpy as np
+from app.application.audio_buffer import AudioBuffer
 
 
 class SpeechToText(Protocol):
-    def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe raw audio (float32 PCM ndarray) into text."""
+    def transcribe(self, audio: AudioBuffer) -> str:
+        """Transcribe captured audio (read-only PCM with sample-rate metadata) into text."""
+        ...
+
+
+class BatchSpeechToText(SpeechToText, Protocol):
+    def transcribe_batch(self, audios: Sequence[AudioBuffer]) -> list[str]:
+        """Transcribe several utterances in one inference call, one result per input."""
         ...
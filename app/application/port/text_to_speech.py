@@ -1,9 +1,9 @@
 from typing import Protocol
 
-import numpy as np
+from app.application.audio_buffer import AudioBuffer
 
 
 class TextToSpeech(Protocol):
-    def synthesize(self, text: str) -> np.ndarray:
-        """Synthesize speech audio (float32 PCM ndarray) from text."""
+    def synthesize(self, text: str) -> AudioBuffer:
+        """Synthesize speech audio (float32 PCM with its sample rate) from text."""
         ...
@@ -0,0 +1,20 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+import numpy as np
+
+from app.domain.vo.turn import Turn
+
+
+class TurnMemoryIndex(Protocol):
+    def add(self, turns: Sequence[Turn], vectors: np.ndarray) -> None:
+        """Store ``turns`` with their embeddings (one row of ``vectors`` per turn)."""
+        ...
+
+    def search(self, vector: np.ndarray, k: int) -> list[tuple[float, Turn]]:
+        """Return up to ``k`` (cosine similarity, turn) pairs, most similar first."""
+        ...
+
+    def close(self) -> None:
+        """Flush pending writes and release resources."""
+        ...
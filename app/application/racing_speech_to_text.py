@@ -0,0 +1,172 @@
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from time import monotonic
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.errors import DeadlineExceededError, SpeechToTextError
+from app.application.port.speech_to_text import SpeechToText
+from app.application.resilience import LatencyWindow
+from app.utils.logger import Logger
+
+
+class RacingSpeechToText:
+    """Transcribes with several providers at once and keeps the first non-empty result.
+
+    Latencies are learned per utterance-length bucket (failures count as
+    taking the whole deadline).  Once one provider is clearly faster for a
+    bucket it runs alone, and the others only start if it has not answered
+    by its own p90 -- a hedge rather than a full race.  Until then every
+    utterance is a full race.  An empty transcript never wins: the result is
+    "" only when every provider comes back empty.
+
+    A losing request is cancelled if it has not started; one already running
+    (a local decode or an HTTP request) finishes in the background and still
+    feeds the latency statistics.
+    """
+
+    def __init__(
+        self,
+        *,
+        providers: dict[str, SpeechToText],
+        deadline: float | None = 15.0,
+        bucket_edges: Sequence[float] = (1.5, 4.0),
+        min_samples: int = 5,
+        preference_margin: float = 0.25,
+        logger: Logger | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if len(providers) < 2:
+            raise ValueError(f"RacingSpeechToText needs at least two providers. Got: {list(providers)!r}")
+
+        self._providers = dict(providers)
+        self._deadline = deadline
+        self._bucket_edges = tuple(sorted(bucket_edges))
+        self._min_samples = max(1, int(min_samples))
+        self._margin = max(0.0, float(preference_margin))
+        self._logger = logger
+        self._clock = clock
+
+        self._lock = Lock()
+        self._latencies: dict[tuple[int, str], LatencyWindow] = {}
+        self._preferred: dict[int, str | None] = {}
+        # Enough workers for two overlapping races.
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * len(self._providers), thread_name_prefix="stt-race"
+        )
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        bucket = bisect_right(self._bucket_edges, audio.duration)
+        started = self._clock()
+        preferred = self.preferred_provider(bucket)
+
+        futures: dict[Future, str] = {}
+        if preferred is None:
+            for name in self._providers:
+                futures[self._submit(name, audio, bucket)] = name
+        else:
+            futures[self._submit(preferred, audio, bucket)] = preferred
+            hedge_delay = self._window(bucket, preferred).quantile(0.9)
+            done, _ = wait(futures, timeout=self._remaining(started, cap=hedge_delay))
+            # Start the others unless the preferred provider already heard something.
+            if not any(self._has_text(future) for future in done):
+                for name in self._providers:
+                    if name != preferred:
+                        futures[self._submit(name, audio, bucket)] = name
+
+        errors: list[str] = []
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=self._remaining(started), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if self._has_text(future):
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                error = future.exception()
+                if error is not None:
+                    errors.append(f"{futures[future]}: {error}")
+
+        if not pending and not errors:
+            return ""
+        if pending:
+            raise DeadlineExceededError(f"No STT provider finished within {self._deadline:g} s.")
+        raise SpeechToTextError("All STT providers failed (" + "; ".join(errors) + ")")
+
+    def preferred_provider(self, bucket: int) -> str | None:
+        """Name of the provider that runs first for ``bucket``, or None to race them all."""
+        medians: dict[str, float] = {}
+        for name in self._providers:
+            window = self._window(bucket, name)
+            if len(window) < self._min_samples:
+                return None
+            medians[name] = window.quantile(0.5) or 0.0
+
+        best = min(medians, key=medians.__getitem__)
+        others = [m for name, m in medians.items() if name != best]
+        preferred = best if all(medians[best] * (1 + self._margin) < m for m in others) else None
+
+        with self._lock:
+            changed = self._preferred.get(bucket) != preferred
+            self._preferred[bucket] = preferred
+        if changed and self._logger:
+            summary = ", ".join(f"{name} p50={m * 1000:.0f} ms" for name, m in medians.items())
+            self._logger.log(f"[STT race] {self._bucket_label(bucket)}: prefer {preferred or 'racing all'} ({summary})")
+        return preferred
+
+    @staticmethod
+    def _has_text(future: Future) -> bool:
+        return future.exception() is None and bool(future.result().strip())
+
+    def _submit(self, name: str, audio: AudioBuffer, bucket: int) -> Future:
+        provider = self._providers[name]
+        window = self._window(bucket, name)
+        # Retained here, on the caller's thread: a losing provider may still be
+        # reading after transcribe() has returned and the caller released its handle.
+        handle = audio.retain()
+
+        def run() -> str:
+            started = self._clock()
+            try:
+                text = provider.transcribe(handle)
+            except Exception:
+                # A failure is as bad as using up the whole deadline.
+                window.record(self._deadline if self._deadline is not None else self._clock() - started)
+                raise
+            window.record(self._clock() - started)
+            return text
+
+        try:
+            future = self._executor.submit(run)
+        except BaseException:
+            handle.release()
+            raise
+        # Runs when the request finishes or is cancelled before it started.
+        future.add_done_callback(lambda _: handle.release())
+        return future
+
+    def _window(self, bucket: int, name: str) -> LatencyWindow:
+        with self._lock:
+            window = self._latencies.get((bucket, name))
+            if window is None:
+                window = self._latencies[(bucket, name)] = LatencyWindow(size=50)
+            return window
+
+    def _remaining(self, started: float, *, cap: float | None = None) -> float | None:
+        remaining = None
+        if self._deadline is not None:
+            remaining = max(0.0, self._deadline - (self._clock() - started))
+        if cap is not None:
+            remaining = cap if remaining is None else min(cap, remaining)
+        return remaining
+
+    def _bucket_label(self, bucket: int) -> str:
+        edges = self._bucket_edges
+        if bucket == 0:
+            return f"<{edges[0]:g}s" if edges else "all"
+        if bucket == len(edges):
+            return f">={edges[-1]:g}s"
+        return f"{edges[bucket - 1]:g}-{edges[bucket]:g}s"
@@ -20,6 +20,7 @@ class LatestReplyQueue:
         self._cond = Condition(Lock())
         self._items: deque[ReplyItem] = deque(maxlen=1)
         self._latest_request_id = 0
+        self._closed = False
 
     def next_request_id(self) -> int:
         """Increment and return the new latest request ID."""
@@ -51,9 +52,18 @@ class LatestReplyQueue:
             self._items.append(ReplyItem(request_id=request_id, text=text))
             self._cond.notify()
 
-    def get(self) -> ReplyItem:
-        """Block until a reply item is available and return it."""
+    def get(self) -> ReplyItem | None:
+        """Block until a reply item is available and return it (None once closed)."""
         with self._cond:
-            while not self._items:
+            while not self._items and not self._closed:
                 self._cond.wait()
+            if self._closed:
+                return None
             return self._items.popleft()
+
+    def close(self) -> None:
+        """Wake every consumer; ``get()`` returns None from now on."""
+        with self._cond:
+            self._closed = True
+            self._items.clear()
+            self._cond.notify_all()
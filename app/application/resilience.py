@@ -0,0 +1,325 @@
+import random
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import StrEnum
+from threading import Lock
+from time import monotonic, sleep
+from typing import TypeVar
+
+from app.application.errors import DeadlineExceededError, ExternalServiceError
+from app.utils.logger import Logger
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    """How one kind of external call is bounded and retried."""
+
+    # Total time for the call, including retries and backoff (seconds).  None: no limit.
+    deadline: float | None = 30.0
+    # Extra attempts after a failed one.  Only for idempotent calls.
+    retries: int = 2
+    # Full-jitter exponential backoff: sleep uniform(0, min(max, base * 2**attempt)).
+    backoff_base: float = 0.25
+    backoff_max: float = 2.0
+    # Send a second identical request when the first is slower than the
+    # ``hedge_quantile`` of recent latencies.
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls."""
+
+    def __init__(self, size: int = 100) -> None:
+        self._lock = Lock()
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(q * len(samples))))
+        return samples[index]
+
+
+class ResilientCall:
+    """Runs a callable under a ``CallPolicy``: deadline, jittered retries, hedging.
+
+    Attempts run on a small pool so the caller can stop waiting at the
+    deadline.  An abandoned attempt still finishes in the background, so the
+    underlying client should have its own timeout as well.  Only
+    ``ExternalServiceError`` is retried; anything else is a bug and propagates.
+
+    ``lease`` is called on the caller's thread before each attempt is
+    submitted and returns a release callback the attempt runs when it ends.
+    Use it to keep pooled inputs (``AudioBuffer.retain``) alive for attempts
+    that outlive the call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: CallPolicy,
+        *,
+        logger: Logger | None = None,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = sleep,
+        jitter: Callable[[], float] = random.random,
+        max_workers: int = 4,
+    ) -> None:
+        self.name = name
+        self.policy = policy
+        self.latencies = LatencyWindow()
+        self._logger = logger
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    def __call__(self, fn: Callable[[], T], *, lease: Callable[[], Callable[[], None]] | None = None) -> T:
+        policy = self.policy
+        deadline_at = self._clock() + policy.deadline if policy.deadline is not None else None
+        last_error: ExternalServiceError | None = None
+
+        for attempt in range(policy.retries + 1):
+            remaining = deadline_at - self._clock() if deadline_at is not None else None
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                return self._attempt(fn, remaining, lease)
+            except ExternalServiceError as e:
+                last_error = e
+            if isinstance(last_error, DeadlineExceededError) or attempt == policy.retries:
+                break
+
+            delay = self._jitter() * min(policy.backoff_max, policy.backoff_base * 2**attempt)
+            if deadline_at is not None and self._clock() + delay >= deadline_at:
+                break
+            self._log(f"[Resilience] {self.name} failed ({last_error}); retrying in {delay * 1000:.0f} ms")
+            self._sleep(delay)
+
+        if last_error is None:
+            last_error = self._deadline_error()
+        raise last_error
+
+    def _attempt(
+        self,
+        fn: Callable[[], T],
+        timeout: float | None,
+        lease: Callable[[], Callable[[], None]] | None,
+    ) -> T:
+        started = self._clock()
+        futures: set[Future] = {self._submit(fn, lease)}
+
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is not None and (timeout is None or hedge_delay < timeout):
+            done, _ = wait(futures, timeout=hedge_delay)
+            if not done:
+                self._log(f"[Resilience] {self.name} slower than p{self.policy.hedge_quantile * 100:.0f}"
+                          f" ({hedge_delay * 1000:.0f} ms); sending a hedged request")
+                futures.add(self._submit(fn, lease))
+
+        error: BaseException | None = None
+        while futures:
+            remaining = max(0.0, timeout - (self._clock() - started)) if timeout is not None else None
+            done, futures = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                raise self._deadline_error()
+            for future in done:
+                if future.exception() is None:
+                    result, elapsed = future.result()
+                    self.latencies.record(elapsed)
+                    for other in futures:
+                        other.cancel()
+                    return result
+                error = future.exception()
+        assert error is not None
+        raise error
+
+    def _deadline_error(self) -> DeadlineExceededError:
+        return DeadlineExceededError(f"{self.name} exceeded its {self.policy.deadline:g} s deadline.")
+
+    def _submit(self, fn: Callable[[], T], lease: Callable[[], Callable[[], None]] | None) -> Future:
+        if lease is None:
+            return self._executor.submit(self._timed, fn)
+        release = lease()
+        try:
+            future = self._executor.submit(self._timed, fn)
+        except BaseException:
+            release()
+            raise
+        # Runs when the attempt finishes or is cancelled before it started.
+        future.add_done_callback(lambda _: release())
+        return future
+
+    def _timed(self, fn: Callable[[], T]) -> tuple[T, float]:
+        started = self._clock()
+        result = fn()
+        return result, self._clock() - started
+
+    def _hedge_delay(self) -> float | None:
+        if not self.policy.hedge or len(self.latencies) < self.policy.hedge_min_samples:
+            return None
+        return self.latencies.quantile(self.policy.hedge_quantile)
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.log(message)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops using a provider after repeated failures or slow calls.
+
+    After ``failure_threshold`` consecutive bad calls (errors, or successes
+    slower than ``slow_call_seconds``) the circuit opens and ``allow()``
+    returns False for ``reset_after`` seconds.  Then a single trial call is
+    let through: a good one closes the circuit, a bad one reopens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        slow_call_seconds: float | None = None,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_after = max(0.0, float(reset_after))
+        self._clock = clock
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._bad_calls = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_after:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                if self._clock() - self._opened_at < self.reset_after:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+            # Half-open: one trial at a time.
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self, elapsed: float) -> None:
+        if self.slow_call_seconds is not None and elapsed > self.slow_call_seconds:
+            self.record_failure()
+            return
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._bad_calls = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._bad_calls += 1
+            self._trial_in_flight = False
+            if self._state == CircuitState.HALF_OPEN or self._bad_calls >= self.failure_threshold:
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+
+class Failover:
+    """Calls the primary provider through ``call`` and falls back when it is unhealthy.
+
+    With a ``breaker``, a primary that keeps failing or answering slowly is
+    skipped entirely until the breaker lets a trial call through, so tail
+    latency is bounded by the fallback instead of by the primary's deadline.
+    """
+
+    def __init__(
+        self,
+        call: ResilientCall,
+        *,
+        breaker: CircuitBreaker | None = None,
+        fallback_name: str = "fallback",
+        logger: Logger | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.call = call
+        self.breaker = breaker
+        self.fallback_name = fallback_name
+        self._logger = logger
+        self._clock = clock
+
+    def __call__(
+        self,
+        primary: Callable[[], T],
+        fallback: Callable[[], T] | None = None,
+        *,
+        lease: Callable[[], Callable[[], None]] | None = None,
+    ) -> T:
+        if fallback is None or self.breaker is None:
+            return self.call(primary, lease=lease)
+
+        if self.breaker.allow():
+            started = self._clock()
+            try:
+                result = self.call(primary, lease=lease)
+            except ExternalServiceError as e:
+                self._record(failed=True, elapsed=0.0)
+                self._log(f"[Resilience] {self.call.name} failed ({e}); using {self.fallback_name}")
+            except BaseException:
+                # Still end the trial, or a half-open breaker would refuse every later call.
+                self._record(failed=True, elapsed=0.0)
+                raise
+            else:
+                self._record(failed=False, elapsed=self._clock() - started)
+                return result
+        return fallback()
+
+    def _record(self, *, failed: bool, elapsed: float) -> None:
+        assert self.breaker is not None
+        before = self.breaker.state
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success(elapsed)
+        after = self.breaker.state
+
+        if after == CircuitState.OPEN and before != CircuitState.OPEN:
+            self._log(
+                f"[Resilience] {self.call.name} unhealthy; using {self.fallback_name}"
+                f" for {self.breaker.reset_after:g} s"
+            )
+        elif before == CircuitState.HALF_OPEN and after == CircuitState.CLOSED:
+            self._log(f"[Resilience] {self.call.name} recovered")
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.log(message)
@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.port.chat_client import ChatClient
+from app.application.port.speech_to_text import SpeechToText
+from app.application.port.text_to_speech import TextToSpeech
+from app.application.resilience import Failover
+from app.domain.vo.chat_message import ChatMessage
+
+
+class ResilientChatClient:
+    """``ChatClient`` whose calls run under a deadline/retry/hedging policy."""
+
+    def __init__(self, *, client: ChatClient, failover: Failover) -> None:
+        self._client = client
+        self._failover = failover
+
+    def complete(self, *, system: str | None, user: str) -> str:
+        return self._failover(lambda: self._client.complete(system=system, user=user))
+
+    def complete_messages(self, *, messages: Sequence[ChatMessage]) -> str:
+        return self._failover(lambda: self._client.complete_messages(messages=messages))
+
+
+class ResilientSpeechToText:
+    """``SpeechToText`` with a policy and an optional fallback provider (e.g. local)."""
+
+    def __init__(
+        self,
+        *,
+        stt: SpeechToText,
+        failover: Failover,
+        fallback: SpeechToText | None = None,
+    ) -> None:
+        self._stt = stt
+        self._failover = failover
+        self._fallback = fallback
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        fallback = self._fallback
+        return self._failover(
+            lambda: self._stt.transcribe(audio),
+            (lambda: fallback.transcribe(audio)) if fallback is not None else None,
+            # A hedged or abandoned attempt may still be reading after we return.
+            lease=lambda: audio.retain().release,
+        )
+
+
+class ResilientTextToSpeech:
+    """``TextToSpeech`` with a policy and an optional fallback provider (e.g. local)."""
+
+    def __init__(
+        self,
+        *,
+        tts: TextToSpeech,
+        failover: Failover,
+        fallback: TextToSpeech | None = None,
+    ) -> None:
+        self._tts = tts
+        self._failover = failover
+        self._fallback = fallback
+
+    def synthesize(self, text: str) -> AudioBuffer:
+        fallback = self._fallback
+        return self._failover(
+            lambda: self._tts.synthesize(text),
+            (lambda: fallback.synthesize(text)) if fallback is not None else None,
+        )
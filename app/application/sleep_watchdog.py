@@ -1,34 +1,51 @@
 from collections.abc import Callable
-from threading import Event, Thread
+from threading import Condition, Thread
+from time import monotonic
 
 from app.utils.logger import Logger
 
 
 class SleepWatchdog:
-    """Monitors conversation inactivity and transitions the system to sleep.
+    """Transitions the system to sleep when an inactivity deadline passes.
 
-    The watchdog polls at a fixed interval.  When the ``should_sleep`` predicate
-    returns True it immediately calls ``attempt_sleep``, which is expected to atomically
-    perform the state transition.  ``attempt_sleep`` must re-validate the condition
-    under a lock to avoid TOCTOU races (double-checked locking pattern).
+    The owner calls ``schedule()`` whenever something that affects the deadline
+    happens (activity, a worker starting or finishing, playback ending) and
+    passes ``None`` while sleeping is impossible.  The watchdog thread waits
+    for exactly that deadline, so an idle or busy system causes no wakeups.
 
-    The timeout threshold itself is encapsulated in the ``should_sleep`` callback;
-    this class only owns the poll interval.
+    When the deadline passes the watchdog calls ``attempt_sleep``, which must
+    re-validate the condition under the owner's lock and atomically perform the
+    transition (double-checked locking).  Each deadline fires at most once; if
+    the attempt loses a race, the owner is expected to schedule again when the
+    blocking condition clears.
     """
 
     def __init__(
         self,
         *,
-        poll_interval: float,
-        should_sleep: Callable[[], bool],
         attempt_sleep: Callable[[], bool],
         logger: Logger,
+        clock: Callable[[], float] = monotonic,
     ) -> None:
-        self._poll_interval = poll_interval
-        self._should_sleep = should_sleep
         self._attempt_sleep = attempt_sleep
         self._logger = logger
-        self._stop_event = Event()
+        self._clock = clock
+        self._condition = Condition()
+        self._deadline: float | None = None
+        self._stopped = False
+
+    @property
+    def deadline(self) -> float | None:
+        with self._condition:
+            return self._deadline
+
+    def schedule(self, deadline: float | None) -> None:
+        """Replace the pending deadline (a ``clock()`` time), or cancel it with ``None``."""
+        with self._condition:
+            if deadline == self._deadline:
+                return
+            self._deadline = deadline
+            self._condition.notify()
 
     def start(self) -> Thread:
         thread = Thread(target=self._loop, daemon=True)
@@ -36,16 +53,27 @@ class SleepWatchdog:
         return thread
 
     def stop(self) -> None:
-        """Signal the watchdog loop to exit on its next poll."""
-        self._stop_event.set()
+        """Make the watchdog loop exit."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
 
     def _loop(self) -> None:
-        while not self._stop_event.wait(timeout=self._poll_interval):
-            if not self._should_sleep():
-                continue
-
-            # attempt_sleep performs the atomic state transition and returns True when
-            # sleep was actually applied (False means a race was detected).
-            slept = self._attempt_sleep()
-            if slept:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._deadline is not None:
+                        remaining = self._deadline - self._clock()
+                        if remaining <= 0:
+                            break
+                    else:
+                        remaining = None
+                    self._condition.wait(timeout=remaining)
+                if self._stopped:
+                    return
+                self._deadline = None
+
+            # Called without our lock: attempt_sleep takes the owner's lock,
+            # and the owner schedules while holding it.
+            if self._attempt_sleep():
                 self._logger.log("Sleeping (idle timeout). Say 'Buddy' to start.")
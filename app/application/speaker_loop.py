@@ -1,10 +1,13 @@
 from collections.abc import Callable
 from threading import Event, Lock, Thread
+from time import perf_counter
 
 from app.application.errors import ExternalServiceError
+from app.application.pipeline_status import PipelineStage, PipelineStatusTracker
 from app.application.port.speaker import Speaker
 from app.application.port.text_to_speech import TextToSpeech
 from app.application.reply_queue import LatestReplyQueue
+from app.utils.event_log import EventLog, EventType, elapsed_ms
 from app.utils.logger import Logger
 
 
@@ -24,12 +27,18 @@ class SpeakerLoop:
         reply_queue: LatestReplyQueue,
         on_reply_completed: Callable[[str], None],
         logger: Logger,
+        on_speaking_end: Callable[[], None] | None = None,
+        event_log: EventLog | None = None,
+        pipeline_status: PipelineStatusTracker | None = None,
     ) -> None:
         self._tts = tts
         self._speaker = speaker
         self._reply_queue = reply_queue
         self._on_reply_completed = on_reply_completed
+        self._on_speaking_end = on_speaking_end
         self._logger = logger
+        self._events = event_log or EventLog()
+        self._status = pipeline_status or PipelineStatusTracker()
 
         self._stop_event = Event()
         self._is_speaking_event = Event()
@@ -52,6 +61,13 @@ class SpeakerLoop:
         """Request that the current playback be interrupted."""
         self._stop_event.set()
 
+    def stop(self, timeout: float | None = None) -> None:
+        """Interrupt playback, end the loop and wait for its thread."""
+        self._reply_queue.close()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
     def start(self) -> Thread:
         if self._thread is not None:
             raise RuntimeError("SpeakerLoop is already running")
@@ -62,6 +78,8 @@ class SpeakerLoop:
     def _loop(self) -> None:
         while True:
             item = self._reply_queue.get()
+            if item is None:
+                return
 
             if not item.text:
                 continue
@@ -78,14 +96,34 @@ class SpeakerLoop:
                     self._currently_speaking_text = item.text
                     self._is_speaking_event.set()
 
-                reply_audio = self._tts.synthesize(item.text)
+                started = perf_counter()
+                with self._status.stage(PipelineStage.SYNTHESIZING):
+                    reply_audio = self._tts.synthesize(item.text)
+                self._events.emit(
+                    EventType.SYNTHESIZED,
+                    request_id=item.request_id,
+                    duration_ms=elapsed_ms(started),
+                    chars=len(item.text),
+                    audio_seconds=round(reply_audio.duration, 3),
+                    bytes=reply_audio.nbytes,
+                )
 
                 if not self._reply_queue.is_latest(item.request_id):
                     continue
 
-                completed = self._speaker.speak(
-                    reply_audio,
-                    stop_event=self._stop_event,
+                self._events.emit(EventType.PLAYBACK_STARTED, request_id=item.request_id)
+                self._status.playback_started(item.request_id)
+                started = perf_counter()
+                with self._status.stage(PipelineStage.SPEAKING):
+                    completed = self._speaker.speak(
+                        reply_audio,
+                        stop_event=self._stop_event,
+                    )
+                self._events.emit(
+                    EventType.PLAYBACK_ENDED if completed else EventType.INTERRUPTED,
+                    request_id=item.request_id,
+                    duration_ms=elapsed_ms(started),
+                    audio_seconds=round(reply_audio.duration, 3),
                 )
                 if not completed:
                     self._logger.log(
@@ -99,9 +137,12 @@ class SpeakerLoop:
                     self._on_reply_completed(item.text)
             except (ExternalServiceError, OSError, RuntimeError, ValueError) as e:
                 self._logger.log(f"Error in speaker loop: {e}")
+                self._events.emit(EventType.ERROR, request_id=item.request_id, stage="speaker", error=str(e))
                 self._stop_event.set()
                 continue
             finally:
                 with self._speaking_lock:
                     self._is_speaking_event.clear()
                     self._currently_speaking_text = None
+                if self._on_speaking_end:
+                    self._on_speaking_end()
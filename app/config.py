@@ -7,6 +7,62 @@ from app.utils.text import read_text_file
 DEFAULT_SYSTEM_PROMPT_FILE = "prompt.txt"
 
 
+def _read_non_negative_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number. Got: {raw!r}") from None
+    if value < 0:
+        raise ValueError(f"{name} must be >= 0. Got: {value!r}")
+    return value
+
+
+def _read_bool(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    if raw in {"1", "true", "yes", "on"}:
+        return True
+    if raw in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{name} must be true or false. Got: {raw!r}")
+
+
+def _read_audio_device(name: str) -> int | str | None:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return None
+    # A number is a device index; anything else matches part of the device name.
+    return int(raw) if raw.isdigit() else raw
+
+
+def _read_non_negative_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer. Got: {raw!r}") from None
+    if value < 0:
+        raise ValueError(f"{name} must be >= 0. Got: {value!r}")
+    return value
+
+
+@dataclass(frozen=True)
+class AudioConfig:
+    # 取り込んだ発話を STT の前にスペクトルノイズ抑圧 (Wiener フィルタ) する。
+    denoise: bool = False
+    # マイク・スピーカーをデバイス既定のサンプルレート (44.1/48 kHz など) で開き、リサンプリングする。
+    native_sample_rate: bool = False
+    # 入出力デバイス (番号または名前の一部)。None ならシステム既定。見つからない間は既定を使う。
+    input_device: int | str | None = None
+    output_device: int | str | None = None
+
+
 @dataclass(frozen=True)
 class OpenAIConfig:
     api_key: str
@@ -16,8 +72,15 @@ class OpenAIConfig:
 
 @dataclass(frozen=True)
 class SpeechToTextConfig:
-    provider: Literal["openai", "local"] = "openai"
+    # "race": ローカルと OpenAI を並行実行し、先に返った結果を使う。
+    provider: Literal["openai", "local", "race"] = "openai"
     local_model: str = "distil-large-v3"
+    # ローカル STT のバッチ収集ウィンドウ (ms)。0 でバッチ処理を無効化する。
+    local_batch_window_ms: int = 0
+    # 短い発話やウェイクワード検出に使う小さいモデル (例: "tiny.en")。None なら常に local_model。
+    local_fast_model: str | None = None
+    # この秒数以下の発話は greedy デコードにする。0 で適応的デコードを無効化する。
+    local_short_clip_seconds: float = 1.5
 
 
 @dataclass(frozen=True)
@@ -30,11 +93,76 @@ class TextToSpeechConfig:
     local_lang_code: str = "a"
 
 
+@dataclass(frozen=True)
+class ModelResidencyConfig:
+    # スリープ後、この秒数でローカルモデルを縮小/解放する。0 で無効。
+    release_after_seconds: float = 0.0
+    # スリープ中のローカル STT: "reduced" (fast モデル or int8 で待機) / "released"。
+    # "released" にするとスリープ中のウェイクワード検出がモデル再ロードを待つ。
+    stt_sleep_residency: Literal["reduced", "released"] = "reduced"
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    log_dir: str = "logs"
+    # セッションログをこのサイズ (MB) で次のファイルにローテーション。0 で無効。
+    max_file_mb: float = 10.0
+    # この時間 (h) ごとにローテーション。0 で無効。
+    rotate_hours: float = 0.0
+    # ターンごとの構造化イベント (*.events.jsonl) を書き出す。
+    events: bool = True
+
+
+@dataclass(frozen=True)
+class HistoryConfig:
+    # 会話履歴を保存する SQLite ファイル。None なら保存しない（メモリのみ）。
+    db_path: str | None = None
+    # 起動時にバックグラウンドで復元する直近ターン数。
+    resume_turns: int = 10
+
+
+@dataclass(frozen=True)
+class MemoryConfig:
+    # 長期記憶 (埋め込みインデックス) の保存先ディレクトリ。None なら無効。
+    index_dir: str | None = None
+    embedding_model: str = "text-embedding-3-small"
+    # OpenAI 互換の埋め込みエンドポイント (ローカルサーバーなど)。None なら OPENAI_BASE_URL と同じ。
+    embedding_base_url: str | None = None
+    # 応答ごとに思い出す過去ターン数の上限。
+    top_k: int = 3
+    # 想起にかける時間の上限 (ms)。超えたら記憶なしで応答する。
+    budget_ms: int = 300
+    # 埋め込みリクエスト 1 回のタイムアウト (秒)。リトライはしない。0 なら無制限。
+    embedding_timeout_seconds: float = 5.0
+
+
+@dataclass(frozen=True)
+class ResilienceConfig:
+    # 外部 API 呼び出しの締め切り (秒)。リトライとバックオフを含む。
+    chat_timeout_seconds: float = 30.0
+    stt_timeout_seconds: float = 15.0
+    tts_timeout_seconds: float = 15.0
+    # 失敗時の追加リトライ回数 (ジッター付き指数バックオフ)。
+    retries: int = 2
+    # 直近の p95 より遅い呼び出しに同じリクエストをもう 1 本送る。
+    hedge_requests: bool = False
+    # OpenAI の STT/TTS が不調な間はローカルの STT/TTS を使う。
+    failover_to_local: bool = False
+    # これより遅い応答はフェイルオーバー判定で失敗として数える (秒)。
+    failover_slow_seconds: float = 5.0
+
+
 @dataclass(frozen=True)
 class AppConfig:
     openai: OpenAIConfig
+    audio: AudioConfig = AudioConfig()
     stt: SpeechToTextConfig = SpeechToTextConfig()
     tts: TextToSpeechConfig = TextToSpeechConfig()
+    residency: ModelResidencyConfig = ModelResidencyConfig()
+    logging: LoggingConfig = LoggingConfig()
+    history: HistoryConfig = HistoryConfig()
+    memory: MemoryConfig = MemoryConfig()
+    resilience: ResilienceConfig = ResilienceConfig()
     system_prompt: str | None = None
     system_prompt_file: str | None = DEFAULT_SYSTEM_PROMPT_FILE
 
@@ -51,13 +179,23 @@ class AppConfig:
         base_url = os.getenv("OPENAI_BASE_URL") or None
 
         stt_provider = (os.getenv("MY_ENGLISH_BUDDY_STT_PROVIDER") or "openai").strip().lower()
-        if stt_provider not in {"openai", "local"}:
+        if stt_provider not in {"openai", "local", "race"}:
             raise ValueError(
-                "MY_ENGLISH_BUDDY_STT_PROVIDER must be 'openai' or 'local'. "
+                "MY_ENGLISH_BUDDY_STT_PROVIDER must be 'openai', 'local' or 'race'. "
                 f"Got: {stt_provider!r}"
             )
 
+        denoise = _read_bool("MY_ENGLISH_BUDDY_DENOISE", False)
+        native_sample_rate = _read_bool("MY_ENGLISH_BUDDY_NATIVE_SAMPLE_RATE", False)
+        input_device = _read_audio_device("MY_ENGLISH_BUDDY_INPUT_DEVICE")
+        output_device = _read_audio_device("MY_ENGLISH_BUDDY_OUTPUT_DEVICE")
+
         local_stt_model = (os.getenv("MY_ENGLISH_BUDDY_LOCAL_STT_MODEL") or "distil-large-v3").strip()
+        local_stt_batch_window_ms = _read_non_negative_int("MY_ENGLISH_BUDDY_LOCAL_STT_BATCH_WINDOW_MS", 0)
+        local_stt_fast_model = (os.getenv("MY_ENGLISH_BUDDY_LOCAL_STT_FAST_MODEL") or "").strip() or None
+        local_stt_short_clip_seconds = _read_non_negative_float(
+            "MY_ENGLISH_BUDDY_LOCAL_STT_SHORT_CLIP_SECONDS", 1.5
+        )
 
         tts_provider = (os.getenv("MY_ENGLISH_BUDDY_TTS_PROVIDER") or "openai").strip().lower()
         if tts_provider not in {"openai", "local"}:
@@ -69,6 +207,47 @@ class AppConfig:
         tts_voice = (os.getenv("MY_ENGLISH_BUDDY_TTS_VOICE") or "").strip() or None
         tts_lang_code = (os.getenv("MY_ENGLISH_BUDDY_TTS_LANG_CODE") or "a").strip().lower()
 
+        model_release_after_seconds = _read_non_negative_float(
+            "MY_ENGLISH_BUDDY_MODEL_RELEASE_AFTER_SECONDS", 0.0
+        )
+        stt_sleep_residency = (
+            (os.getenv("MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY") or "reduced").strip().lower()
+        )
+        if stt_sleep_residency not in {"reduced", "released"}:
+            raise ValueError(
+                "MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY must be 'reduced' or 'released'. "
+                f"Got: {stt_sleep_residency!r}"
+            )
+
+        log_dir = (os.getenv("MY_ENGLISH_BUDDY_LOG_DIR") or "logs").strip()
+        log_max_file_mb = _read_non_negative_float("MY_ENGLISH_BUDDY_LOG_MAX_FILE_MB", 10.0)
+        log_rotate_hours = _read_non_negative_float("MY_ENGLISH_BUDDY_LOG_ROTATE_HOURS", 0.0)
+        log_events = _read_bool("MY_ENGLISH_BUDDY_LOG_EVENTS", True)
+
+        history_db_path = (os.getenv("MY_ENGLISH_BUDDY_HISTORY_DB") or "").strip() or None
+        history_resume_turns = _read_non_negative_int("MY_ENGLISH_BUDDY_HISTORY_RESUME_TURNS", 10)
+
+        memory_dir = (os.getenv("MY_ENGLISH_BUDDY_MEMORY_DIR") or "").strip() or None
+        memory_embedding_model = (
+            os.getenv("MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_MODEL") or "text-embedding-3-small"
+        ).strip()
+        memory_embedding_base_url = (
+            os.getenv("MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_BASE_URL") or ""
+        ).strip() or None
+        memory_top_k = _read_non_negative_int("MY_ENGLISH_BUDDY_MEMORY_TOP_K", 3)
+        memory_budget_ms = _read_non_negative_int("MY_ENGLISH_BUDDY_MEMORY_BUDGET_MS", 300)
+        memory_embedding_timeout_seconds = _read_non_negative_float(
+            "MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_TIMEOUT_SECONDS", 5.0
+        )
+
+        chat_timeout_seconds = _read_non_negative_float("MY_ENGLISH_BUDDY_CHAT_TIMEOUT_SECONDS", 30.0)
+        stt_timeout_seconds = _read_non_negative_float("MY_ENGLISH_BUDDY_STT_TIMEOUT_SECONDS", 15.0)
+        tts_timeout_seconds = _read_non_negative_float("MY_ENGLISH_BUDDY_TTS_TIMEOUT_SECONDS", 15.0)
+        retries = _read_non_negative_int("MY_ENGLISH_BUDDY_RETRIES", 2)
+        hedge_requests = _read_bool("MY_ENGLISH_BUDDY_HEDGE_REQUESTS", False)
+        failover_to_local = _read_bool("MY_ENGLISH_BUDDY_FAILOVER_TO_LOCAL", False)
+        failover_slow_seconds = _read_non_negative_float("MY_ENGLISH_BUDDY_FAILOVER_SLOW_SECONDS", 5.0)
+
         # TODO: In the real desktop app, this should likely be stored per-user
         # (e.g., in local storage) and editable in the UI.
         system_prompt = os.getenv("MY_ENGLISH_BUDDY_SYSTEM_PROMPT") or None
@@ -80,15 +259,55 @@ class AppConfig:
                 model=model,
                 base_url=base_url,
             ),
+            audio=AudioConfig(
+                denoise=denoise,
+                native_sample_rate=native_sample_rate,
+                input_device=input_device,
+                output_device=output_device,
+            ),
             stt=SpeechToTextConfig(
                 provider=stt_provider,
                 local_model=local_stt_model,
+                local_batch_window_ms=local_stt_batch_window_ms,
+                local_fast_model=local_stt_fast_model,
+                local_short_clip_seconds=local_stt_short_clip_seconds,
             ),
             tts=TextToSpeechConfig(
                 provider=tts_provider,
                 voice=tts_voice,
                 local_lang_code=tts_lang_code,
             ),
+            residency=ModelResidencyConfig(
+                release_after_seconds=model_release_after_seconds,
+                stt_sleep_residency=stt_sleep_residency,
+            ),
+            logging=LoggingConfig(
+                log_dir=log_dir,
+                max_file_mb=log_max_file_mb,
+                rotate_hours=log_rotate_hours,
+                events=log_events,
+            ),
+            history=HistoryConfig(
+                db_path=history_db_path,
+                resume_turns=history_resume_turns,
+            ),
+            memory=MemoryConfig(
+                index_dir=memory_dir,
+                embedding_model=memory_embedding_model,
+                embedding_base_url=memory_embedding_base_url,
+                top_k=memory_top_k,
+                budget_ms=memory_budget_ms,
+                embedding_timeout_seconds=memory_embedding_timeout_seconds,
+            ),
+            resilience=ResilienceConfig(
+                chat_timeout_seconds=chat_timeout_seconds,
+                stt_timeout_seconds=stt_timeout_seconds,
+                tts_timeout_seconds=tts_timeout_seconds,
+                retries=retries,
+                hedge_requests=hedge_requests,
+                failover_to_local=failover_to_local,
+                failover_slow_seconds=failover_slow_seconds,
+            ),
             system_prompt=system_prompt,
             system_prompt_file=system_prompt_file,
         )
@@ -0,0 +1 @@
+"""Developer tools (not used by the app at runtime)."""
@@ -0,0 +1,303 @@
+"""Soak test: thousands of synthetic turns through ``ConversationRunner``.
+
+Every provider is an in-process stand-in (no audio devices, no network), so
+what is measured is the app's own memory and thread behaviour over a long
+session::
+
+    python -m app.devtools.soak --turns 3000 --max-growth-kib 256
+
+The report shows traced memory after warm-up and at the end, the peak, the
+thread high-water mark and the allocation sites that grew (and that hold the
+most memory).  With ``--max-growth-kib``/``--max-extra-threads`` the exit
+status is 1 when a budget is exceeded.
+"""
+
+import argparse
+import gc
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import dataclass
+from queue import Queue
+from threading import Condition, Event, Thread
+
+import numpy as np
+
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool
+from app.application.conversation_runner import ConversationRunner
+from app.application.conversation_service import ConversationService
+from app.domain.vo.chat_message import ChatMessage, ChatRole
+from app.utils.logger import Logger
+
+# Allocations made by the tracer or the import system are not the app's.
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _speech_like(seconds: float, sample_rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) ** 2
+    return (0.2 * envelope * np.sin(2 * np.pi * 150 * t)).astype(np.float32)
+
+
+class SyntheticListener:
+    """Publishes a synthetic utterance each time ``say()`` is called.
+
+    Utterances are captured chunk by chunk into pooled slabs, like the real
+    listener, so slab reuse and ``release()`` discipline are part of the soak.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16_000,
+        utterance_seconds: float = 2.0,
+        chunk_seconds: float = 0.1,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self._chunk_frames = max(1, int(sample_rate * chunk_seconds))
+        self._signal = _speech_like(utterance_seconds, sample_rate)
+        self.pool = AudioSlabPool(capacity_frames=self._signal.size)
+        self._queue: Queue[AudioBuffer] | None = None
+        self._listening = Event()
+
+    def listen(self, *, utterance_queue: Queue[AudioBuffer], stop_event: Event, **callbacks) -> Thread:
+        self._queue = utterance_queue
+        self._listening.set()
+        # Nothing to capture in the background; the thread only honours the port contract.
+        thread = Thread(target=stop_event.wait, name="soak-listener", daemon=True)
+        thread.start()
+        return thread
+
+    def say(self, timeout: float | None = None) -> None:
+        if not self._listening.wait(timeout):
+            raise RuntimeError("The runner never started listening")
+        writer = self.pool.writer(sample_rate=self.sample_rate)
+        for start in range(0, self._signal.size, self._chunk_frames):
+            writer.append(self._signal[start : start + self._chunk_frames])
+        assert self._queue is not None
+        self._queue.put(writer.publish(), timeout=timeout)
+
+    def request_recalibration(self) -> None:
+        pass
+
+    def get_last_threshold(self) -> float | None:
+        return None
+
+    def get_input_level(self) -> float:
+        return 0.0
+
+    def set_low_power(self, enabled: bool) -> None:
+        pass
+
+
+class ScriptedSpeechToText:
+    """Returns a different wake-word sentence for every utterance."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        self.calls += 1
+        return f"Buddy, tell me something about topic number {self.calls}."
+
+
+class EchoChatClient:
+    """Replies with a fixed prefix plus the last user message."""
+
+    def complete(self, *, system: str | None, user: str) -> str:
+        return f"Sure! You said: {user}"
+
+    def complete_messages(self, *, messages: Sequence[ChatMessage]) -> str:
+        user = next((m.content for m in reversed(messages) if m.role == ChatRole.USER), "")
+        return self.complete(system=None, user=user)
+
+
+class SilentTextToSpeech:
+    """Allocates a fresh reply buffer per call, sized like real speech."""
+
+    def __init__(self, *, sample_rate: int = 24_000, seconds_per_char: float = 0.06) -> None:
+        self.sample_rate = sample_rate
+        self.seconds_per_char = seconds_per_char
+
+    def synthesize(self, text: str) -> AudioBuffer:
+        frames = int(len(text) * self.seconds_per_char * self.sample_rate)
+        return AudioBuffer(np.zeros(frames, dtype=np.float32), sample_rate=self.sample_rate)
+
+
+class CountingSpeaker:
+    """Finishes every playback at once; the driver waits on the playback count."""
+
+    def __init__(self) -> None:
+        self._played = 0
+        self._condition = Condition()
+
+    @property
+    def played(self) -> int:
+        with self._condition:
+            return self._played
+
+    def speak(self, audio: AudioBuffer, stop_event: Event | None = None) -> bool:
+        with self._condition:
+            self._played += 1
+            self._condition.notify_all()
+        return True
+
+    def wait_for(self, played: int, timeout: float | None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._played >= played, timeout)
+
+
+@dataclass(frozen=True)
+class SoakReport:
+    turns: int
+    warmup_turns: int
+    seconds: float
+    # Traced memory (bytes) right after warm-up and after the last turn.
+    baseline_bytes: int
+    final_bytes: int
+    peak_bytes: int
+    baseline_threads: int
+    max_threads: int
+    # ``tracemalloc`` statistics, formatted one per line.
+    top_growth: tuple[str, ...]
+    top_sites: tuple[str, ...]
+
+    @property
+    def growth_bytes(self) -> int:
+        return self.final_bytes - self.baseline_bytes
+
+    @property
+    def extra_threads(self) -> int:
+        return self.max_threads - self.baseline_threads
+
+    def format(self) -> str:
+        measured = max(1, self.turns - self.warmup_turns)
+        lines = [
+            f"Soak: {self.turns} turns in {self.seconds:.1f} s (warm-up {self.warmup_turns})",
+            f"  traced memory  {self.baseline_bytes / 1024:10.1f} KiB after warm-up",
+            f"                 {self.final_bytes / 1024:10.1f} KiB at the end"
+            f" ({self.growth_bytes / 1024:+.1f} KiB, {self.growth_bytes / measured:+.1f} B/turn)",
+            f"                 {self.peak_bytes / 1024:10.1f} KiB peak",
+            f"  threads        {self.baseline_threads} after warm-up, {self.max_threads} max",
+            "Top growth since warm-up:",
+            *(f"  {line}" for line in self.top_growth),
+            "Top allocation sites at the end:",
+            *(f"  {line}" for line in self.top_sites),
+        ]
+        return "\n".join(lines)
+
+
+def run_soak(
+    turns: int = 3000,
+    *,
+    warmup: int | None = None,
+    top: int = 10,
+    turn_timeout: float = 10.0,
+    logger: Logger | None = None,
+) -> SoakReport:
+    """Drive ``turns`` wake-word turns through a real runner and service.
+
+    Each turn waits for its reply to be "played" before the next one, like a
+    person taking turns.  Memory is measured from the end of warm-up (default:
+    half the run), so bounded caches (log tail, conversation window, slab
+    pool) are full before the baseline is taken.
+    """
+    if turns <= 0:
+        raise ValueError(f"turns must be positive. Got: {turns!r}")
+    warmup = turns // 2 if warmup is None else min(max(0, warmup), turns - 1)
+
+    listener = SyntheticListener()
+    speaker = CountingSpeaker()
+    logger = logger or Logger()
+    runner = ConversationRunner(
+        listener=listener,
+        stt=ScriptedSpeechToText(),
+        conversation_service=ConversationService(chat_client=EchoChatClient()),
+        tts=SilentTextToSpeech(),
+        speaker=speaker,
+        logger=logger,
+    )
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    runner_thread = Thread(target=runner.run, name="soak-runner", daemon=True)
+    try:
+        runner_thread.start()
+        started = time.perf_counter()
+        baseline: tracemalloc.Snapshot | None = None
+        baseline_bytes = baseline_threads = max_threads = 0
+
+        for turn in range(1, turns + 1):
+            listener.say(timeout=turn_timeout)
+            if not speaker.wait_for(turn, turn_timeout):
+                raise RuntimeError(f"Turn {turn} got no reply within {turn_timeout} s")
+            max_threads = max(max_threads, threading.active_count())
+            if turn == warmup or (warmup == 0 and baseline is None):
+                gc.collect()
+                baseline = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+                baseline_bytes = tracemalloc.get_traced_memory()[0]
+                baseline_threads = max_threads = threading.active_count()
+                tracemalloc.reset_peak()
+
+        seconds = time.perf_counter() - started
+        gc.collect()
+        final = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        final_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        runner.stop(turn_timeout)
+        if runner_thread.is_alive():
+            runner_thread.join(turn_timeout)
+        if started_tracing:
+            tracemalloc.stop()
+
+    assert baseline is not None
+    growth = [stat for stat in final.compare_to(baseline, "lineno") if stat.size_diff > 0]
+    return SoakReport(
+        turns=turns,
+        warmup_turns=warmup,
+        seconds=seconds,
+        baseline_bytes=baseline_bytes,
+        final_bytes=final_bytes,
+        peak_bytes=peak_bytes,
+        baseline_threads=baseline_threads,
+        max_threads=max_threads,
+        top_growth=tuple(str(stat) for stat in growth[:top]),
+        top_sites=tuple(str(stat) for stat in final.statistics("lineno")[:top]),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=None, help="Turns before the baseline (default: half).")
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to list.")
+    parser.add_argument("--max-growth-kib", type=float, default=None)
+    parser.add_argument("--max-extra-threads", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_soak(args.turns, warmup=args.warmup, top=args.top)
+    except (RuntimeError, ValueError) as e:
+        print(f"Soak failed: {e}", file=sys.stderr)
+        return 1
+    print(report.format())
+
+    failed = False
+    if args.max_growth_kib is not None and report.growth_bytes > args.max_growth_kib * 1024:
+        print(f"Memory grew by more than {args.max_growth_kib} KiB", file=sys.stderr)
+        failed = True
+    if args.max_extra_threads is not None and report.extra_threads > args.max_extra_threads:
+        print(f"Thread count grew by more than {args.max_extra_threads}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
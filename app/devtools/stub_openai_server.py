@@ -0,0 +1,362 @@
+"""OpenAI-compatible stub server for offline latency and load testing.
+
+Run it and point the app (or a benchmark) at it::
+
+    python -m app.devtools.stub_openai_server --port 8808 --chat-latency-ms 300:900
+    OPENAI_BASE_URL=http://127.0.0.1:8808/v1 OPENAI_API_KEY=stub OPENAI_MODEL=stub uv run python -m app.main
+
+Latencies are ``MEDIAN`` or ``MEDIAN:P95`` in milliseconds (log-normal).
+Nothing here is used by the app at runtime.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import struct
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+# 95th percentile of the standard normal distribution.
+_Z95 = 1.6448536269514722
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Log-normal latency given its median and 95th percentile (ms)."""
+
+    median_ms: float = 0.0
+    p95_ms: float | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        median, _, p95 = spec.partition(":")
+        try:
+            return cls(float(median), float(p95) if p95 else None)
+        except ValueError:
+            raise ValueError(f"Latency must be MEDIAN or MEDIAN:P95 in ms. Got: {spec!r}") from None
+
+    def sample(self, rng: random.Random) -> float:
+        """One latency in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.p95_ms is None or self.p95_ms <= self.median_ms:
+            return self.median_ms / 1000
+        sigma = math.log(self.p95_ms / self.median_ms) / _Z95
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+@dataclass(frozen=True)
+class EndpointBehavior:
+    # Time to the first byte of the response.
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    # Fraction of requests answered with ``error_status`` instead.
+    error_rate: float = 0.0
+    error_status: int = 500
+
+
+@dataclass(frozen=True)
+class StubBehavior:
+    chat: EndpointBehavior = field(default_factory=EndpointBehavior)
+    transcription: EndpointBehavior = field(default_factory=EndpointBehavior)
+    speech: EndpointBehavior = field(default_factory=EndpointBehavior)
+    embeddings: EndpointBehavior = field(default_factory=EndpointBehavior)
+    # Generation speed after the first token (chat) and audio length per character (speech).
+    tokens_per_second: float = 50.0
+    speech_seconds_per_char: float = 0.06
+    # Chat reply; None echoes the last user message.
+    reply: str | None = None
+    transcript: str = "Hello, buddy."
+    embedding_dim: int = 256
+    seed: int | None = None
+
+
+class StubOpenAIServer:
+    """Threaded HTTP server speaking enough of the OpenAI API for this app.
+
+    Endpoints (with or without the ``/v1`` prefix): ``/chat/completions``
+    (including ``stream=true``), ``/audio/transcriptions``, ``/audio/speech``
+    (``response_format=pcm``: 24 kHz, 16-bit mono) and ``/embeddings``.
+    """
+
+    def __init__(self, behavior: StubBehavior | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.behavior = behavior or StubBehavior()
+        self._rng = random.Random(self.behavior.seed)
+        self._rng_lock = Lock()
+        self.request_counts: dict[str, int] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubOpenAIServer":
+        # A short poll interval keeps stop() fast for tests and benchmarks.
+        self._thread = Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="stub-openai", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(5)
+
+    def __enter__(self) -> "StubOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def sample_latency(self, latency: LatencyDistribution) -> float:
+        with self._rng_lock:
+            return latency.sample(self._rng)
+
+    def count(self, endpoint: str) -> None:
+        with self._rng_lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+
+def _make_handler(server: StubOpenAIServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(_StubHandler):
+        stub = server
+
+    return Handler
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    stub: StubOpenAIServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep benchmark output clean.
+        pass
+
+    def do_POST(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/v1/"):
+            path = path[3:]
+        routes = {
+            "/chat/completions": ("chat", self._chat),
+            "/audio/transcriptions": ("transcription", self._transcription),
+            "/audio/speech": ("speech", self._speech),
+            "/embeddings": ("embeddings", self._embeddings),
+        }
+        route = routes.get(path)
+        body = self._read_body()
+        if route is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {self.path}")
+            return
+
+        name, handler = route
+        self.stub.count(name)
+        behavior: EndpointBehavior = getattr(self.stub.behavior, name)
+        time.sleep(self.stub.sample_latency(behavior.latency))
+        if behavior.error_rate > 0 and self.stub.random() < behavior.error_rate:
+            self._send_error(behavior.error_status, f"Injected {name} failure")
+            return
+        handler(body)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        parts = []
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0], 16)
+            if size == 0:
+                self.rfile.readline()
+                return b"".join(parts)
+            parts.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _chat(self, body: bytes) -> None:
+        request = json.loads(body or b"{}")
+        behavior = self.stub.behavior
+        reply = behavior.reply
+        if reply is None:
+            users = [m.get("content", "") for m in request.get("messages", []) if m.get("role") == "user"]
+            reply = f"You said: {users[-1]}" if users else "Hello!"
+        tokens = reply.split(" ")
+        token_delay = 1.0 / behavior.tokens_per_second if behavior.tokens_per_second > 0 else 0.0
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = request.get("model", "stub")
+
+        if not request.get("stream"):
+            time.sleep(token_delay * len(tokens))
+            self._send_json(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": reply},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+                }
+            )
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def chunk(delta: dict, finish_reason: str | None = None) -> bytes:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return b"data: " + json.dumps(payload).encode() + b"\n\n"
+
+        self.wfile.write(chunk({"role": "assistant", "content": ""}))
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(token_delay)
+            self.wfile.write(chunk({"content": token if i == 0 else " " + token}))
+            self.wfile.flush()
+        self.wfile.write(chunk({}, "stop"))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _transcription(self, body: bytes) -> None:
+        # The multipart upload is read (so the client sees realistic upload
+        # timing) but not decoded.
+        self._send_json({"text": self.stub.behavior.transcript})
+
+    def _speech(self, body: bytes) -> None:
+        request = json.loads(body or b"{}")
+        text = request.get("input", "")
+        frames = int(24_000 * self.stub.behavior.speech_seconds_per_char * max(1, len(text)))
+        # A quiet 220 Hz tone, so players and level meters have something to show.
+        amplitude = 0.1 * 32767
+        samples = (int(amplitude * math.sin(2 * math.pi * 220 * i / 24_000)) for i in range(frames))
+        pcm = struct.pack(f"<{frames}h", *samples)
+        self._send_bytes(pcm, "application/octet-stream")
+
+    def _embeddings(self, body: bytes) -> None:
+        request = json.loads(body or b"{}")
+        inputs = request.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dim = self.stub.behavior.embedding_dim
+        data = [
+            {"object": "embedding", "index": i, "embedding": _hashed_embedding(text, dim)}
+            for i, text in enumerate(inputs)
+        ]
+        self._send_json(
+            {
+                "object": "list",
+                "data": data,
+                "model": request.get("model", "stub"),
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            }
+        )
+
+    def _send_json(self, payload: dict, status: int = HTTPStatus.OK) -> None:
+        self._send_bytes(json.dumps(payload).encode(), "application/json", status)
+
+    def _send_bytes(self, data: bytes, content_type: str, status: int = HTTPStatus.OK) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str) -> None:
+        error = {"error": {"message": message, "type": "server_error", "code": None, "param": None}}
+        self._send_json(error, status)
+
+
+def _hashed_embedding(text: str, dim: int) -> list[float]:
+    """Deterministic bag-of-words vector: texts sharing words are similar."""
+    vector = [0.0] * dim
+    for word in text.lower().split():
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], "little") % dim
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _behavior_from_args(args: argparse.Namespace) -> StubBehavior:
+    def endpoint(latency: str) -> EndpointBehavior:
+        return EndpointBehavior(
+            latency=LatencyDistribution.parse(latency),
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+        )
+
+    return StubBehavior(
+        chat=endpoint(args.chat_latency_ms),
+        transcription=endpoint(args.stt_latency_ms),
+        speech=endpoint(args.tts_latency_ms),
+        embeddings=endpoint(args.embeddings_latency_ms),
+        tokens_per_second=args.tokens_per_second,
+        reply=args.reply,
+        transcript=args.transcript,
+        seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8808)
+    parser.add_argument("--chat-latency-ms", default="300:900", help="Time to first token (MEDIAN[:P95]).")
+    parser.add_argument("--stt-latency-ms", default="400:1200")
+    parser.add_argument("--tts-latency-ms", default="250:800")
+    parser.add_argument("--embeddings-latency-ms", default="50:150")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail (0-1).")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--reply", default=None, help="Fixed chat reply (default: echo the user).")
+    parser.add_argument("--transcript", default="Hello, buddy.")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        behavior = _behavior_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = StubOpenAIServer(behavior, host=args.host, port=args.port)
+    print(f"Stub OpenAI server listening on {server.base_url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,36 @@
+import re
 from dataclasses import dataclass
+from pathlib import Path
 
-from openai import OpenAI
-
+from app.application.batching_speech_to_text import BatchingSpeechToText
 from app.application.conversation_runner import ConversationRunner
 from app.application.conversation_service import ConversationService
+from app.application.errors import ExternalServiceError
+from app.application.long_term_memory import LongTermMemory
+from app.application.model_residency import ModelResidencyManager
 from app.application.port.chat_client import ChatClient
+from app.application.port.conversation_store import ConversationStore
+from app.application.port.listener import Listener
+from app.application.port.resident_model import ModelResidency, ResidentModel
+from app.application.port.speaker import Speaker
 from app.application.port.speech_to_text import SpeechToText
 from app.application.port.text_to_speech import TextToSpeech
-from app.config import AppConfig
-from app.infrastructure.audio.listener import Listener
-from app.infrastructure.audio.speaker import Speaker
-from app.infrastructure.openai.chat_client import OpenAIChatClient
-from app.infrastructure.openai.speech_to_text import SpeechToText as OpenAISpeechToText
-from app.infrastructure.openai.text_to_speech import TextToSpeech as OpenAITextToSpeech
+from app.application.racing_speech_to_text import RacingSpeechToText
+from app.application.resilience import (
+    CallPolicy,
+    CircuitBreaker,
+    Failover,
+    ResilientCall,
+)
+from app.application.resilient_clients import (
+    ResilientChatClient,
+    ResilientSpeechToText,
+    ResilientTextToSpeech,
+)
+from app.config import AppConfig, ResilienceConfig
+from app.utils.event_log import EventLog
 from app.utils.logger import Logger
+from app.utils.startup_profiler import StartupProfiler, profile_phase
 
 
 @dataclass(frozen=True)
@@ -27,6 +44,15 @@ class AppContainer:
     tts: TextToSpeech
     conversation_service: ConversationService
     conversation_runner: ConversationRunner
+    conversation_store: ConversationStore | None = None
+    long_term_memory: LongTermMemory | None = None
+
+    def close(self) -> None:
+        """Flush anything still being written in the background."""
+        if self.conversation_store is not None:
+            self.conversation_store.close()
+        if self.long_term_memory is not None:
+            self.long_term_memory.close()
 
 
 def build_container(
@@ -39,50 +65,164 @@ def build_container(
     stt: SpeechToText | None = None,
     tts: TextToSpeech | None = None,
     system_prompt: str | None = None,
+    profiler: StartupProfiler | None = None,
+    event_log: EventLog | None = None,
+    conversation_store: ConversationStore | None = None,
+    long_term_memory: LongTermMemory | None = None,
 ) -> AppContainer:
+    # Infrastructure modules pull in sounddevice/PortAudio, openai/httpx and
+    # faster-whisper/kokoro, so they are imported here (possibly on a background thread)
+    # rather than at module import time.
     logger = logger or Logger()
-    listener = listener or Listener()
-    speaker = speaker or Speaker(sample_rate=24_000)
+    if listener is None:
+        with profile_phase(profiler, "listener"):
+            from app.infrastructure.audio.listener import Listener as AudioListener
+
+            listener = AudioListener(
+                device=config.audio.input_device,
+                denoise=config.audio.denoise,
+                native_sample_rate=config.audio.native_sample_rate,
+                logger=logger,
+            )
+    if speaker is None:
+        with profile_phase(profiler, "speaker"):
+            from app.infrastructure.audio.speaker import Speaker as AudioSpeaker
+
+            speaker = AudioSpeaker(
+                sample_rate=24_000,
+                device=config.audio.output_device,
+                native_sample_rate=config.audio.native_sample_rate,
+                logger=logger,
+            )
 
     if system_prompt is None:
         system_prompt = config.resolve_system_prompt()
 
+    local_stt = None
+    local_tts = None
+    fallback_stt = None
+    resilience = config.resilience
     if chat_client is None or stt is None or tts is None:
-        openai_client = OpenAI(
-            api_key=config.openai.api_key,
-            base_url=config.openai.base_url,
-        )
+        with profile_phase(profiler, "openai client"):
+            from openai import OpenAI
 
-        chat_client = chat_client or OpenAIChatClient(
-            client=openai_client,
-            model=config.openai.model,
-        )
+            from app.infrastructure.openai.chat_client import OpenAIChatClient
 
-        if stt is None:
-            if config.stt.provider == "local":
-                from app.infrastructure.local.speech_to_text import (
-                    SpeechToText as LocalSpeechToText,
+            timeouts = (
+                resilience.chat_timeout_seconds,
+                resilience.stt_timeout_seconds,
+                resilience.tts_timeout_seconds,
+            )
+            openai_client = OpenAI(
+                api_key=config.openai.api_key,
+                base_url=config.openai.base_url,
+                # ResilientCall owns retries and deadlines; the SDK timeout only
+                # reclaims requests the caller has already given up on.
+                timeout=max(timeouts) if all(timeouts) else None,
+                max_retries=0,
+            )
+
+            if chat_client is None:
+                chat_client = ResilientChatClient(
+                    client=OpenAIChatClient(client=openai_client, model=config.openai.model),
+                    failover=_failover("OpenAI chat", resilience.chat_timeout_seconds, resilience, logger),
                 )
 
-                stt = LocalSpeechToText(model=config.stt.local_model, logger=logger)
-            else:
-                stt = OpenAISpeechToText(client=openai_client)
+        if stt is None:
+            with profile_phase(profiler, f"stt ({config.stt.provider})"):
+                if config.stt.provider == "local":
+                    local_stt = _build_local_stt(config, logger)
+                    stt = local_stt
+                    if config.stt.local_batch_window_ms > 0:
+                        stt = BatchingSpeechToText(
+                            stt=stt,
+                            window=config.stt.local_batch_window_ms / 1000,
+                        )
+                elif config.stt.provider == "race":
+                    from app.infrastructure.openai.speech_to_text import (
+                        SpeechToText as OpenAISpeechToText,
+                    )
+
+                    local_stt = _build_local_stt(config, logger)
+                    stt = RacingSpeechToText(
+                        providers={
+                            "local": local_stt,
+                            "openai": ResilientSpeechToText(
+                                stt=OpenAISpeechToText(client=openai_client),
+                                failover=_failover(
+                                    "OpenAI STT", resilience.stt_timeout_seconds, resilience, logger
+                                ),
+                            ),
+                        },
+                        deadline=resilience.stt_timeout_seconds or None,
+                        logger=logger,
+                    )
+                else:
+                    from app.infrastructure.openai.speech_to_text import (
+                        SpeechToText as OpenAISpeechToText,
+                    )
+
+                    if resilience.failover_to_local:
+                        fallback_stt = _build_fallback("local STT", lambda: _build_local_stt(config, logger), logger)
+                    stt = ResilientSpeechToText(
+                        stt=OpenAISpeechToText(client=openai_client),
+                        failover=_failover(
+                            "OpenAI STT",
+                            resilience.stt_timeout_seconds,
+                            resilience,
+                            logger,
+                            fallback_name="local STT" if fallback_stt is not None else None,
+                        ),
+                        fallback=fallback_stt,
+                    )
 
         if tts is None:
-            tts_kwargs = {"voice": config.tts.voice} if config.tts.voice else {}
-            if config.tts.provider == "local":
-                from app.infrastructure.local.text_to_speech import (
-                    TextToSpeech as LocalTextToSpeech,
-                )
+            with profile_phase(profiler, f"tts ({config.tts.provider})"):
+                tts_kwargs = {"voice": config.tts.voice} if config.tts.voice else {}
+                if config.tts.provider == "local":
+                    local_tts = _build_local_tts(config, logger, **tts_kwargs)
+                    tts = local_tts
+                else:
+                    from app.infrastructure.openai.text_to_speech import (
+                        TextToSpeech as OpenAITextToSpeech,
+                    )
+
+                    fallback_tts = None
+                    if resilience.failover_to_local:
+                        # OpenAI voice names do not exist in Kokoro; use its default voice.
+                        fallback_tts = _build_fallback("local TTS", lambda: _build_local_tts(config, logger), logger)
+                    tts = ResilientTextToSpeech(
+                        tts=OpenAITextToSpeech(client=openai_client, **tts_kwargs),
+                        failover=_failover(
+                            "OpenAI TTS",
+                            resilience.tts_timeout_seconds,
+                            resilience,
+                            logger,
+                            fallback_name="local TTS" if fallback_tts is not None else None,
+                        ),
+                        fallback=fallback_tts,
+                    )
+
+    if conversation_store is None and config.history.db_path:
+        with profile_phase(profiler, "history"):
+            from app.infrastructure.sqlite.conversation_store import (
+                SqliteConversationStore,
+            )
 
-                tts = LocalTextToSpeech(**tts_kwargs, lang_code=config.tts.local_lang_code, logger=logger)
-            else:
-                tts = OpenAITextToSpeech(client=openai_client, **tts_kwargs)
+            conversation_store = SqliteConversationStore(Path(config.history.db_path), logger=logger)
+
+    if long_term_memory is None and config.memory.index_dir:
+        with profile_phase(profiler, "memory"):
+            long_term_memory = _build_long_term_memory(config, logger)
 
     conversation_service = ConversationService(
         chat_client=chat_client,
         system_prompt=system_prompt,
+        store=conversation_store,
+        memory=long_term_memory,
     )
+    # Old turns arrive in the background; the first reply never waits for disk.
+    conversation_service.resume_history(config.history.resume_turns)
 
     conversation_runner = ConversationRunner(
         listener=listener,
@@ -91,8 +231,35 @@ def build_container(
         tts=tts,
         speaker=speaker,
         logger=logger,
+        event_log=event_log,
     )
 
+    for wake_aware_stt in (local_stt, fallback_stt):
+        if wake_aware_stt is not None:
+            # Wake state drives the local STT decoding policy (wake-word vs. conversation).
+            wake_aware_stt.is_awake = lambda: conversation_runner.is_awake
+
+    resident_models: dict[str, ResidentModel] = {}
+    sleep_residency: dict[str, ModelResidency] = {}
+    if local_stt is not None:
+        resident_models["local STT"] = local_stt
+        sleep_residency["local STT"] = ModelResidency(config.residency.stt_sleep_residency)
+    if local_tts is not None:
+        resident_models["local TTS"] = local_tts
+        sleep_residency["local TTS"] = ModelResidency.RELEASED
+
+    if resident_models and config.residency.release_after_seconds > 0:
+        residency_manager = ModelResidencyManager(
+            models=resident_models,
+            sleep_residency=sleep_residency,
+            release_after=config.residency.release_after_seconds,
+            logger=logger,
+        )
+        conversation_runner.on_sleep = residency_manager.on_sleep
+        conversation_runner.on_wake = residency_manager.on_wake
+        # The conversation starts asleep, so arm the release timer right away.
+        residency_manager.on_sleep()
+
     return AppContainer(
         config=config,
         logger=logger,
@@ -103,4 +270,87 @@ def build_container(
         tts=tts,
         conversation_service=conversation_service,
         conversation_runner=conversation_runner,
+        conversation_store=conversation_store,
+        long_term_memory=long_term_memory,
+    )
+
+
+def _build_long_term_memory(config: AppConfig, logger: Logger) -> LongTermMemory:
+    from openai import OpenAI
+
+    from app.infrastructure.local.vector_index import MemmapVectorIndex
+    from app.infrastructure.openai.embedder import Embedder
+
+    embedding_client = OpenAI(
+        api_key=config.openai.api_key,
+        base_url=config.memory.embedding_base_url or config.openai.base_url,
+        # Only two workers serve recall and indexing, so a hung request must
+        # not hold one for the SDK's 10-minute default; a failed batch is logged.
+        timeout=config.memory.embedding_timeout_seconds or None,
+        max_retries=0,
+    )
+    # One index per embedding model: vectors from different models are not comparable.
+    model_dir = re.sub(r"[^A-Za-z0-9._-]+", "_", config.memory.embedding_model)
+    return LongTermMemory(
+        embedder=Embedder(client=embedding_client, model=config.memory.embedding_model),
+        index=MemmapVectorIndex(Path(config.memory.index_dir or ".") / model_dir),
+        top_k=config.memory.top_k,
+        latency_budget=config.memory.budget_ms / 1000,
+        logger=logger,
+    )
+
+
+def _build_local_stt(config: AppConfig, logger: Logger):
+    from app.infrastructure.local.decoding_policy import DecodingPolicySelector
+    from app.infrastructure.local.speech_to_text import (
+        SpeechToText as LocalSpeechToText,
+    )
+
+    return LocalSpeechToText(
+        model=config.stt.local_model,
+        fast_model=config.stt.local_fast_model,
+        decoding_policy=DecodingPolicySelector(
+            short_clip_seconds=config.stt.local_short_clip_seconds,
+        ),
+        logger=logger,
+    )
+
+
+def _build_local_tts(config: AppConfig, logger: Logger, **tts_kwargs):
+    from app.infrastructure.local.text_to_speech import (
+        TextToSpeech as LocalTextToSpeech,
+    )
+
+    return LocalTextToSpeech(**tts_kwargs, lang_code=config.tts.local_lang_code, logger=logger)
+
+
+def _build_fallback(name: str, build, logger: Logger):
+    # A missing optional dependency only disables failover, not the app.
+    try:
+        return build()
+    except (ExternalServiceError, OSError, RuntimeError) as e:
+        logger.log(f"[Resilience] {name} fallback unavailable: {e}")
+        return None
+
+
+def _failover(
+    name: str,
+    timeout_seconds: float,
+    config: ResilienceConfig,
+    logger: Logger,
+    *,
+    fallback_name: str | None = None,
+) -> Failover:
+    call = ResilientCall(
+        name,
+        CallPolicy(
+            deadline=timeout_seconds or None,
+            retries=config.retries,
+            hedge=config.hedge_requests,
+        ),
+        logger=logger,
     )
+    if fallback_name is None:
+        return Failover(call, logger=logger)
+    breaker = CircuitBreaker(slow_call_seconds=config.failover_slow_seconds or None)
+    return Failover(call, breaker=breaker, fallback_name=fallback_name, logger=logger)
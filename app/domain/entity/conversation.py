@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from app.domain.vo.chat_message import ChatMessage, ChatRole
 from app.domain.vo.turn import Turn
 
@@ -7,7 +9,10 @@ class Conversation:
     def __init__(self, *, max_turns: int | None = None):
         self._max_turns = max_turns
         self._turns: list[Turn] = []
+        # _turns を平坦化したメッセージ列 (1 ターン = 2 メッセージ)。ターンの追加・削除と同時に更新する。
+        self._messages: list[ChatMessage] = []
         self._pending_user_utterance: str | None = None
+        self._pending_message: ChatMessage | None = None
 
     def add_turn(self, user_utterance: str, assistant_reply: str) -> None:
         user_utterance = user_utterance.strip()
@@ -15,26 +20,37 @@ class Conversation:
         if not user_utterance or not assistant_reply:
             return
 
-        self._turns.append(Turn(user_utterance=user_utterance, assistant_reply=assistant_reply))
-        self._trim_if_needed()
+        self._append(Turn(user_utterance=user_utterance, assistant_reply=assistant_reply))
 
     def start_turn(self, user_utterance: str) -> None:
         user_utterance = user_utterance.strip()
         if not user_utterance:
             return
         self._pending_user_utterance = user_utterance
+        self._pending_message = ChatMessage(role=ChatRole.USER, content=user_utterance)
 
-    def complete_turn(self, assistant_reply: str) -> None:
+    def complete_turn(self, assistant_reply: str) -> Turn | None:
+        """保留中の発話と応答でターンを確定し、確定したターンを返す（確定しなければ None）。"""
         assistant_reply = assistant_reply.strip()
         if self._pending_user_utterance is None or not assistant_reply:
-            return
-        self._turns.append(
-            Turn(
-                user_utterance=self._pending_user_utterance,
-                assistant_reply=assistant_reply,
-            )
+            return None
+        turn = Turn(
+            user_utterance=self._pending_user_utterance,
+            assistant_reply=assistant_reply,
         )
-        self._pending_user_utterance = None
+        self._clear_pending()
+        self._append(turn)
+        return turn
+
+    def restore(self, turns: Sequence[Turn]) -> None:
+        """過去のセッションのターンを、現在のターンより前に復元する。
+
+        復元が最初の発話より遅れても、新しいターンは失われない。
+        """
+        if not turns:
+            return
+        self._turns[:0] = turns
+        self._messages[:0] = [message for turn in turns for message in turn.to_messages()]
         self._trim_if_needed()
 
     def cancel_turn(self, *, expected_utterance: str | None = None) -> str | None:
@@ -47,7 +63,7 @@ class Conversation:
         if expected_utterance is not None and self._pending_user_utterance != expected_utterance:
             return None
         utterance = self._pending_user_utterance
-        self._pending_user_utterance = None
+        self._clear_pending()
         return utterance
 
     @property
@@ -60,29 +76,38 @@ class Conversation:
         return self._turns[-n:]
 
     def build_messages(self, n: int) -> list[ChatMessage]:
-        messages: list[ChatMessage] = []
-        for turn in self.recent_context(n):
-            messages.extend(turn.to_messages())
-        if self._pending_user_utterance is not None:
-            messages.append(
-                ChatMessage(role=ChatRole.USER, content=self._pending_user_utterance)
-            )
+        # 保持済みのメッセージ列を切り出すだけで、ターンごとの変換はしない。
+        messages = self._messages[-2 * n:] if n > 0 else []
+        if self._pending_message is not None:
+            messages.append(self._pending_message)
         return messages
 
     def clear(self) -> None:
         self._turns.clear()
-        self._pending_user_utterance = None
+        self._messages.clear()
+        self._clear_pending()
 
     @property
     def turn_count(self) -> int:
         return len(self._turns)
 
+    def _append(self, turn: Turn) -> None:
+        self._turns.append(turn)
+        self._messages.extend(turn.to_messages())
+        self._trim_if_needed()
+
+    def _clear_pending(self) -> None:
+        self._pending_user_utterance = None
+        self._pending_message = None
+
     def _trim_if_needed(self) -> None:
         if self._max_turns is None:
             return
         if self._max_turns <= 0:
             self._turns.clear()
+            self._messages.clear()
             return
         overflow = len(self._turns) - self._max_turns
         if overflow > 0:
             del self._turns[:overflow]
+            del self._messages[: 2 * overflow]
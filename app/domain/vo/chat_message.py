@@ -8,7 +8,7 @@ class ChatRole(StrEnum):
     ASSISTANT = "assistant"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     role: ChatRole
     content: str
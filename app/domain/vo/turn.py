@@ -1,16 +1,25 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from app.domain.vo.chat_message import ChatMessage, ChatRole
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Turn:
 
     user_utterance: str
     assistant_reply: str
+    # to_messages() の結果。ターンは不変なので生成時に一度だけ作る。
+    _messages: tuple[ChatMessage, ChatMessage] = field(init=False, repr=False, compare=False)
 
-    def to_messages(self) -> list[ChatMessage]:
-        return [
-            ChatMessage(role=ChatRole.USER, content=self.user_utterance),
-            ChatMessage(role=ChatRole.ASSISTANT, content=self.assistant_reply),
-        ]
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_messages",
+            (
+                ChatMessage(role=ChatRole.USER, content=self.user_utterance),
+                ChatMessage(role=ChatRole.ASSISTANT, content=self.assistant_reply),
+            ),
+        )
+
+    def to_messages(self) -> tuple[ChatMessage, ChatMessage]:
+        return self._messages
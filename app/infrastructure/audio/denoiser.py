@@ -0,0 +1,142 @@
+import numpy as np
+
+
+class StreamingDenoiser:
+    """Wiener-filter noise suppression in streaming STFT blocks (mono float32).
+
+    Frames of ``frame_size`` samples with 50% overlap are windowed with a
+    square-root Hann window on analysis and synthesis, so overlap-add restores
+    the signal exactly when the gain is 1.  Each ``process()`` call handles
+    every complete frame in one batch of FFTs and returns the samples that are
+    final so far (up to ``latency`` behind the input); ``flush()`` returns the
+    rest, so a whole stream comes back sample-aligned and at its full length.
+
+    The noise power spectrum is learned from calibration chunks
+    (``learn_noise``) and can keep following the background afterwards
+    (``track_noise``).  Until a profile exists, audio passes through unchanged.
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_size: int = 512,
+        gain_floor: float = 0.1,
+        over_subtraction: float = 1.5,
+        noise_smoothing: float = 0.1,
+    ) -> None:
+        if frame_size <= 0 or frame_size % 2:
+            raise ValueError(f"frame_size must be a positive even number. Got: {frame_size!r}")
+
+        self.frame_size = frame_size
+        self.hop = frame_size // 2
+        self.gain_floor = gain_floor
+        self.over_subtraction = over_subtraction
+        self.noise_smoothing = noise_smoothing
+
+        n = np.arange(frame_size)
+        self._window = np.sqrt(0.5 - 0.5 * np.cos(2 * np.pi * n / frame_size)).astype(np.float32)
+
+        self._noise_power: np.ndarray | None = None
+        self._noise_frames = 0
+        self.reset()
+
+    @property
+    def latency(self) -> int:
+        return self.frame_size - self.hop
+
+    @property
+    def has_noise_profile(self) -> bool:
+        return self._noise_power is not None
+
+    def reset(self) -> None:
+        """Start a new stream (the noise profile is kept)."""
+        # Leading zeros give the first samples a full pair of overlapping
+        # frames; the output they produce is skipped.
+        self._pending = np.zeros(self.latency, dtype=np.float32)
+        self._overlap = np.zeros(self.hop, dtype=np.float32)
+        self._skip = self.latency
+        self._held = 0
+
+    def clear_noise_profile(self) -> None:
+        self._noise_power = None
+        self._noise_frames = 0
+
+    def learn_noise(self, chunk: np.ndarray) -> None:
+        """Average ``chunk`` into the noise profile (use on calibration audio)."""
+        power = self._frame_power(self._mono(chunk))
+        if power is None:
+            return
+        total = self._noise_frames + len(power)
+        mean = power.mean(axis=0)
+        if self._noise_power is None:
+            self._noise_power = mean
+        else:
+            self._noise_power += (mean - self._noise_power) * (len(power) / total)
+        self._noise_frames = total
+
+    def track_noise(self, chunk: np.ndarray) -> None:
+        """Move the profile slowly towards ``chunk`` (use on non-speech audio)."""
+        if self._noise_power is None:
+            self.learn_noise(chunk)
+            return
+        power = self._frame_power(self._mono(chunk))
+        if power is not None:
+            self._noise_power += (power.mean(axis=0) - self._noise_power) * self.noise_smoothing
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        samples = self._mono(chunk)
+        self._held += len(samples)
+        buffer = np.concatenate([self._pending, samples])
+        frame_count = (len(buffer) - self.frame_size) // self.hop + 1 if len(buffer) >= self.frame_size else 0
+        if frame_count <= 0:
+            self._pending = buffer
+            return np.empty(0, dtype=np.float32)
+
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, self.frame_size)[:: self.hop][:frame_count]
+        spectrum = np.fft.rfft(frames * self._window, axis=1)
+        if self._noise_power is not None:
+            spectrum *= self._gain(spectrum.real**2 + spectrum.imag**2)
+        output = np.fft.irfft(spectrum, n=self.frame_size, axis=1).astype(np.float32) * self._window
+
+        # Overlap-add: each hop of output is this frame's first half plus the previous frame's second half.
+        out = output[:, : self.hop].copy()
+        out[0] += self._overlap
+        out[1:] += output[:-1, self.hop :]
+        self._overlap = output[-1, self.hop :].copy()
+
+        self._pending = buffer[frame_count * self.hop :]
+        out = out.reshape(-1)
+        if self._skip:
+            skipped = min(self._skip, len(out))
+            out = out[skipped:]
+            self._skip -= skipped
+        self._held -= len(out)
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Return the samples still held back, then start a new stream."""
+        held = self._held
+        tail = self.process(np.zeros(self.frame_size, dtype=np.float32))[:held] if held > 0 else None
+        self.reset()
+        return tail if tail is not None else np.empty(0, dtype=np.float32)
+
+    def _gain(self, power: np.ndarray) -> np.ndarray:
+        assert self._noise_power is not None
+        # Wiener gain from the a-posteriori SNR; the floor limits musical noise.
+        noise = self.over_subtraction * self._noise_power
+        prior_snr = np.maximum(power / np.maximum(noise, 1e-12) - 1.0, 0.0)
+        return np.maximum(prior_snr / (1.0 + prior_snr), self.gain_floor)
+
+    def _frame_power(self, samples: np.ndarray) -> np.ndarray | None:
+        if len(samples) < self.frame_size:
+            return None
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.frame_size)[:: self.hop]
+        spectrum = np.fft.rfft(frames * self._window, axis=1)
+        return spectrum.real**2 + spectrum.imag**2
+
+    @staticmethod
+    def _mono(chunk: np.ndarray) -> np.ndarray:
+        samples = np.asarray(chunk, dtype=np.float32)
+        if samples.ndim == 2:
+            samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+        return samples
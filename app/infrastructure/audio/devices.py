@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+
+import sounddevice as sd
+
+# PortAudio can only re-enumerate devices by re-initializing, which closes
+# every open stream, so streams register here while they are open.
+_portaudio_lock = Lock()
+_open_streams = 0
+
+
+def default_sample_rate(kind: str, *, device: int | None = None, fallback: int) -> int:
+    """Native rate of ``device`` (default: the default ``kind`` device), or ``fallback``."""
+    try:
+        with _portaudio_lock:
+            info = sd.query_devices(device, kind=kind)
+        rate = int(round(float(info["default_samplerate"])))
+    except (sd.PortAudioError, KeyError, TypeError, ValueError):
+        return fallback
+    return rate if rate > 0 else fallback
+
+
+def find_device(kind: str, preferred: int | str | None) -> int | None:
+    """Index of the ``kind`` ("input"/"output") device matching ``preferred``.
+
+    ``preferred`` is a device index or a case-insensitive part of its name.
+    Returns None (the system default) when nothing matches, e.g. while a
+    configured headset is unplugged.
+    """
+    if preferred is None:
+        return None
+    try:
+        with _portaudio_lock:
+            devices = sd.query_devices()
+    except sd.PortAudioError:
+        return None
+    for device in devices:
+        if device[f"max_{kind}_channels"] <= 0:
+            continue
+        if isinstance(preferred, int):
+            if device["index"] == preferred:
+                return preferred
+        elif preferred.lower() in device["name"].lower():
+            return int(device["index"])
+    return None
+
+
+def rescan_devices() -> bool:
+    """Re-initialize PortAudio so hot-plugged devices are listed.
+
+    Skipped (returns False) while another stream is open, since it would be
+    closed, or when this sounddevice version cannot re-initialize.
+    """
+    with _portaudio_lock:
+        if _open_streams:
+            return False
+        return _reinitialize_portaudio()
+
+
+def _reinitialize_portaudio() -> bool:
+    # PortAudio enumerates devices once, in Pa_Initialize(), and sounddevice has
+    # no public way to re-run it; its private _terminate()/_initialize() are the
+    # only way to see a device plugged in after start-up.  Without them the
+    # device list stays as it was and recovery can only reopen known devices.
+    terminate = getattr(sd, "_terminate", None)
+    initialize = getattr(sd, "_initialize", None)
+    if terminate is None or initialize is None:
+        return False
+    terminate()
+    initialize()
+    return True
+
+
+@contextmanager
+def stream_in_use() -> Iterator[None]:
+    """Hold off ``rescan_devices()`` while a stream is open."""
+    global _open_streams
+    with _portaudio_lock:
+        _open_streams += 1
+    try:
+        yield
+    finally:
+        with _portaudio_lock:
+            _open_streams -= 1
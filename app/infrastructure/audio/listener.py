@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 from queue import Empty, Full, Queue
@@ -6,6 +7,14 @@ from threading import Event, Lock, Thread
 import numpy as np
 import sounddevice as sd
 
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool, AudioSlabWriter
+from app.infrastructure.audio.denoiser import StreamingDenoiser
+from app.infrastructure.audio.devices import default_sample_rate, stream_in_use
+from app.infrastructure.audio.noise_floor import NoiseFloorSample, NoiseFloorTracker
+from app.infrastructure.audio.resampler import StreamingResampler
+from app.infrastructure.audio.stream_supervisor import StreamSupervisor
+from app.utils.logger import Logger
+
 try:
     import webrtcvad  # type: ignore
 except (ModuleNotFoundError, ImportError, OSError):  # Optional dependency (binary extension can fail to load).
@@ -17,23 +26,55 @@ class Listener:
         self,
         *,
         sample_rate: int = 16_000,
+        device: int | str | None = None,
+        device_sample_rate: int | None = None,
+        native_sample_rate: bool = False,
         channels: int = 1,
         silence_duration: float = 1.5,
         chunk_duration: float = 0.1,
         calibration_duration: float = 1.0,
         noise_threshold_multiplier: float = 3.0,
+        adaptive_threshold: bool = True,
+        noise_floor_window: float = 8.0,
+        denoise: bool = False,
+        utterance_slab_duration: float = 20.0,
         voice_gate_enabled: bool = True,
         voice_gate_aggressiveness: int = 2,
         voice_gate_frame_ms: int = 20,
         voice_gate_min_speech_ms: int = 250,
         voice_gate_min_speech_ratio: float = 0.12,
+        low_power_block_duration: float = 0.5,
+        low_power_decimation: int = 4,
+        low_power_preroll_duration: float = 0.5,
+        logger: Logger | None = None,
     ):
+        if device_sample_rate is not None and device_sample_rate != sample_rate and channels != 1:
+            raise ValueError("Resampling the microphone is only supported for mono input")
+
         self.sample_rate = sample_rate
+        # The stream may be opened at another rate (e.g. the device's native
+        # 44.1/48 kHz); captured audio is resampled to ``sample_rate``.
+        self.device_sample_rate = device_sample_rate
+        self.native_sample_rate = native_sample_rate and channels == 1
+        self._resampler: StreamingResampler | None = None
+        # Picks the input device (index or part of its name; None: the default)
+        # and reopens the stream after the device fails or is unplugged.
+        self._supervisor = StreamSupervisor(kind="input", device=device, logger=logger)
         self.channels = channels
         self.silence_duration = silence_duration
         self.chunk_duration = chunk_duration
         self.calibration_duration = calibration_duration
         self.noise_threshold_multiplier = noise_threshold_multiplier
+        # Keeps following the background level after calibration, so the
+        # threshold moves with it (e.g. when a fan turns on or off).
+        self._noise_floor = (
+            NoiseFloorTracker(multiplier=noise_threshold_multiplier, window=noise_floor_window)
+            if adaptive_threshold
+            else None
+        )
+        # Optional spectral noise suppression of captured audio (mono only),
+        # using the noise profile from calibration and quiet chunks.
+        self._denoiser = StreamingDenoiser() if denoise and channels == 1 else None
 
         self.voice_gate_enabled = voice_gate_enabled
         self.voice_gate_aggressiveness = voice_gate_aggressiveness
@@ -41,9 +82,26 @@ class Listener:
         self.voice_gate_min_speech_ms = voice_gate_min_speech_ms
         self.voice_gate_min_speech_ratio = voice_gate_min_speech_ratio
 
+        # Low-power mode (while asleep): longer blocks and a decimated level
+        # check until something loud enough to be a wake word comes along.
+        self.low_power_block_duration = max(chunk_duration, low_power_block_duration)
+        self.low_power_decimation = max(1, int(low_power_decimation))
+        self.low_power_preroll_duration = max(0.0, low_power_preroll_duration)
+        self._low_power = False
+
+        # Utterances are captured into pooled slabs and handed to STT as read-only
+        # views, so a turn does not allocate (or concatenate) a fresh array.
+        self._slab_pool = AudioSlabPool(
+            capacity_frames=max(1, int(sample_rate * utterance_slab_duration)),
+            channels=channels,
+        )
+
         self._recalibration_requested = Event()
         self._threshold_lock = Lock()
         self._last_threshold: float | None = None
+        # Written by the capture thread, read by status displays.  A float
+        # attribute swap is atomic, so neither side needs a lock.
+        self._input_level = 0.0
 
     def request_recalibration(self) -> None:
         """Request noise recalibration.
@@ -58,22 +116,38 @@ class Listener:
         with self._threshold_lock:
             return self._last_threshold
 
+    def get_input_level(self) -> float:
+        return self._input_level
+
+    def get_noise_floor_history(self) -> list[NoiseFloorSample]:
+        """Recent noise-floor estimates (oldest first); empty when the threshold is fixed."""
+        return self._noise_floor.history() if self._noise_floor is not None else []
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Switch idle listening to the low-power detector (thread-safe).
+
+        Takes effect between utterances; a capture in progress finishes at full rate.
+        """
+        self._low_power = bool(enabled)
+
     def _calibrate_noise_level(self, stream) -> float:
         noise_samples = []
         calibration_chunks = int(self.calibration_duration / self.chunk_duration)
+        if self._denoiser is not None:
+            self._denoiser.clear_noise_profile()
 
         for _ in range(calibration_chunks):
-            chunk, _ = stream.read(int(self.sample_rate * self.chunk_duration))
-            volume = float(np.abs(chunk).mean())
-            noise_samples.append(volume)
+            chunk = self._read(stream, self.chunk_duration)
+            noise_samples.append(self._chunk_level(chunk))
+            if self._denoiser is not None:
+                self._denoiser.learn_noise(chunk)
 
         if not noise_samples:
             raise RuntimeError(
                 "Failed to calibrate noise level: no audio samples were collected."
             )
 
-        noise_level = np.mean(noise_samples)
-        return noise_level * self.noise_threshold_multiplier
+        return float(np.mean(noise_samples))
 
     def _calibrate(
         self,
@@ -86,9 +160,12 @@ class Listener:
             with suppress(Exception):
                 on_calibration_start()
 
-        threshold = self._calibrate_noise_level(stream)
-        with self._threshold_lock:
-            self._last_threshold = float(threshold)
+        noise_level = self._calibrate_noise_level(stream)
+        if self._noise_floor is not None:
+            threshold = self._noise_floor.reset(noise_level)
+        else:
+            threshold = noise_level * self.noise_threshold_multiplier
+        self._set_last_threshold(threshold)
 
         if on_calibration_end:
             with suppress(Exception):
@@ -96,10 +173,14 @@ class Listener:
 
         return float(threshold)
 
+    def _set_last_threshold(self, threshold: float) -> None:
+        with self._threshold_lock:
+            self._last_threshold = float(threshold)
+
     def listen(
         self,
         *,
-        utterance_queue: Queue[np.ndarray],
+        utterance_queue: Queue[AudioBuffer],
         stop_event: Event,
         on_speech_start: Callable[[], None] | None = None,
         on_calibration_start: Callable[[], None] | None = None,
@@ -128,88 +209,208 @@ class Listener:
     def _utterance_listen_loop(
         self,
         *,
-        utterance_queue: Queue[np.ndarray],
+        utterance_queue: Queue[AudioBuffer],
         stop_event: Event,
         on_speech_start: Callable[[], None] | None = None,
         on_calibration_start: Callable[[], None] | None = None,
         on_calibration_end: Callable[[float], None] | None = None,
         on_calibration_error: Callable[[Exception], None] | None = None,
     ) -> None:
-        frames: list[np.ndarray] = []
+        writer: AudioSlabWriter | None = None
         silent_time = 0.0
         speech_detected = False
         started_notified = False
 
-        with sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype="float32",
-        ) as stream:
-            try:
-                threshold = self._calibrate(
-                    stream,
-                    on_calibration_start=on_calibration_start,
-                    on_calibration_end=on_calibration_end,
-                )
-            except Exception as e:
-                if on_calibration_error:
-                    with suppress(Exception):
-                        on_calibration_error(e)
-                stop_event.set()
-                return
+        # Recent quiet blocks, so a promoted capture keeps the onset of the wake word.
+        preroll: deque[np.ndarray] = deque(
+            maxlen=int(np.ceil(self.low_power_preroll_duration / self.low_power_block_duration))
+        )
+        # Survives reconnects: a recovered stream keeps the calibrated threshold.
+        threshold: float | None = None
+
+        while not stop_event.is_set():
+            device = self._supervisor.device()
+            device_rate = self._device_rate(device)
+            self._resampler = (
+                StreamingResampler(device_rate, self.sample_rate) if device_rate != self.sample_rate else None
+            )
+            idle_block_frames = int(device_rate * self.low_power_block_duration)
 
-            while not stop_event.is_set():
-                # Perform (re)calibration only when idle to avoid disrupting an utterance.
-                if self._recalibration_requested.is_set() and (not speech_detected):
-                    self._recalibration_requested.clear()
-                    try:
-                        threshold = self._calibrate(
-                            stream,
-                            on_calibration_start=on_calibration_start,
-                            on_calibration_end=on_calibration_end,
-                        )
-                    except Exception as e:  # Keep listening even if recalibration fails.
-                        if on_calibration_error:
-                            with suppress(Exception):
-                                on_calibration_error(e)
-
-                chunk, _ = stream.read(int(self.sample_rate * self.chunk_duration))
-                volume = float(np.abs(chunk).mean())
-
-                if volume >= threshold:
-                    silent_time = 0.0
-                    if not speech_detected:
-                        speech_detected = True
-                        if (not started_notified) and on_speech_start:
-                            started_notified = True
-                            with suppress(Exception):
-                                on_speech_start()
-                    frames.append(chunk)
-                elif speech_detected:
-                    silent_time += self.chunk_duration
-                    frames.append(chunk)
-
-                if speech_detected and silent_time >= self.silence_duration:
-                    if frames:
-                        if self._voice_gate_accepts(frames=frames):
-                            utterance = np.concatenate(frames, axis=0)
-                            self._put_drop_oldest(utterance_queue, utterance)
-
-                    frames = []
-                    silent_time = 0.0
-                    speech_detected = False
-                    started_notified = False
+            try:
+                with stream_in_use(), sd.InputStream(
+                    device=device,
+                    samplerate=device_rate,
+                    channels=self.channels,
+                    dtype="float32",
+                ) as stream:
+                    self._supervisor.recovered()
+                    if threshold is None:
+                        try:
+                            threshold = self._calibrate(
+                                stream,
+                                on_calibration_start=on_calibration_start,
+                                on_calibration_end=on_calibration_end,
+                            )
+                        except sd.PortAudioError as e:
+                            # Close out the calibration that was announced; it
+                            # runs again from the start once the stream is back.
+                            if on_calibration_error:
+                                with suppress(Exception):
+                                    on_calibration_error(e)
+                            raise
+                        except Exception as e:
+                            if on_calibration_error:
+                                with suppress(Exception):
+                                    on_calibration_error(e)
+                            stop_event.set()
+                            return
+
+                    while not stop_event.is_set():
+                        # Perform (re)calibration only when idle to avoid disrupting an utterance.
+                        if self._recalibration_requested.is_set() and (not speech_detected):
+                            self._recalibration_requested.clear()
+                            try:
+                                threshold = self._calibrate(
+                                    stream,
+                                    on_calibration_start=on_calibration_start,
+                                    on_calibration_end=on_calibration_end,
+                                )
+                            except sd.PortAudioError as e:
+                                if on_calibration_error:
+                                    with suppress(Exception):
+                                        on_calibration_error(e)
+                                self._recalibration_requested.set()
+                                raise
+                            except Exception as e:  # Keep listening even if recalibration fails.
+                                if on_calibration_error:
+                                    with suppress(Exception):
+                                        on_calibration_error(e)
+
+                        if self._low_power and writer is None:
+                            # Idle blocks stay at the device rate; only a candidate is resampled.
+                            chunk, _ = stream.read(idle_block_frames)
+                            volume = self._chunk_level(chunk[:: self.low_power_decimation])
+                            self._input_level = volume
+                            threshold = self._track_noise_floor(volume, self.low_power_block_duration, threshold)
+                            if self._resampler is not None:
+                                self._resampler.reset()
+                            if volume < threshold:
+                                preroll.append(chunk)
+                                continue
+                            # Wake-word candidate: promote to full-rate capture (handled below).
+                            writer = self._start_capture()
+                            for block in preroll:
+                                self._capture(writer, self._resample(block))
+                            preroll.clear()
+                            chunk = self._resample(chunk)
+                        else:
+                            preroll.clear()
+                            chunk = self._read(stream, self.chunk_duration)
+                            volume = self._chunk_level(chunk)
+                            self._input_level = volume
+                            threshold = self._track_noise_floor(volume, self.chunk_duration, threshold)
+
+                        if volume >= threshold:
+                            silent_time = 0.0
+                            if not speech_detected:
+                                speech_detected = True
+                                if (not started_notified) and on_speech_start:
+                                    started_notified = True
+                                    with suppress(Exception):
+                                        on_speech_start()
+                            if writer is None:
+                                writer = self._start_capture()
+                            self._capture(writer, chunk)
+                        elif speech_detected and writer is not None:
+                            silent_time += self.chunk_duration
+                            self._capture(writer, chunk)
+                        elif self._denoiser is not None:
+                            self._denoiser.track_noise(chunk)
+
+                        if speech_detected and silent_time >= self.silence_duration:
+                            if writer is not None:
+                                self._publish_utterance(writer, utterance_queue)
+
+                            writer = None
+                            silent_time = 0.0
+                            speech_detected = False
+                            started_notified = False
+            except sd.PortAudioError as e:
+                # The device went away (or failed to open): drop the cut-off
+                # utterance, then reopen on whatever device is available.
+                if writer is not None:
+                    writer.discard()
+                writer = None
+                silent_time = 0.0
+                speech_detected = False
+                started_notified = False
+                preroll.clear()
+                self._input_level = 0.0
+                if not self._supervisor.wait_to_retry(e, stop_event):
+                    break
 
         # Drain any partial utterance on stop.
-        if frames and speech_detected:
-            if self._voice_gate_accepts(frames=frames):
-                utterance = np.concatenate(frames, axis=0)
-                self._put_drop_oldest(utterance_queue, utterance)
+        if writer is not None:
+            if speech_detected:
+                self._publish_utterance(writer, utterance_queue)
+            else:
+                writer.discard()
+
+    def _track_noise_floor(self, level: float, duration: float, threshold: float) -> float:
+        # Every chunk is fed, speech included: minimum statistics ignores short
+        # loud stretches, and skipping "speech" would hide a louder background.
+        if self._noise_floor is None:
+            return threshold
+        updated = self._noise_floor.update(level, duration)
+        if updated != threshold:
+            self._set_last_threshold(updated)
+        return updated
+
+    def _device_rate(self, device: int | None) -> int:
+        if self.device_sample_rate is not None:
+            return self.device_sample_rate
+        if self.native_sample_rate:
+            return default_sample_rate("input", device=device, fallback=self.sample_rate)
+        return self.sample_rate
+
+    def _read(self, stream, duration: float) -> np.ndarray:
+        """Read ``duration`` seconds from the stream, at ``sample_rate``."""
+        rate = self._resampler.from_rate if self._resampler is not None else self.sample_rate
+        chunk, _ = stream.read(int(rate * duration))
+        return self._resample(chunk)
+
+    def _resample(self, chunk: np.ndarray) -> np.ndarray:
+        return self._resampler.process(chunk) if self._resampler is not None else chunk
+
+    @staticmethod
+    def _chunk_level(chunk: np.ndarray) -> float:
+        """Mean absolute amplitude of one captured chunk (runs ~10x per second)."""
+        return float(np.abs(chunk).mean())
+
+    def _start_capture(self) -> AudioSlabWriter:
+        if self._denoiser is not None:
+            self._denoiser.reset()
+        return self._slab_pool.writer(sample_rate=self.sample_rate)
+
+    def _capture(self, writer: AudioSlabWriter, chunk: np.ndarray) -> None:
+        writer.append(self._denoiser.process(chunk) if self._denoiser is not None else chunk)
+
+    def _publish_utterance(
+        self,
+        writer: AudioSlabWriter,
+        utterance_queue: Queue[AudioBuffer],
+    ) -> None:
+        if self._denoiser is not None:
+            writer.append(self._denoiser.flush())
+        if writer.frames > 0 and self._voice_gate_accepts(audio=writer.view()):
+            self._put_drop_oldest(utterance_queue, writer.publish())
+        else:
+            writer.discard()
 
     def _voice_gate_accepts(
         self,
         *,
-        frames: list[np.ndarray],
+        audio: np.ndarray,
     ) -> bool:
         if not self.voice_gate_enabled:
             return True
@@ -217,16 +418,25 @@ class Listener:
             # Optional dependency not installed; keep existing behavior.
             return True
 
+        chunk_samples = int(self.sample_rate * self.chunk_duration)
+        if chunk_samples <= 0:
+            return True
+
         # Remove the trailing silence tail we intentionally captured for end-of-utterance detection.
         # This improves VAD speech ratio for short utterances and avoids classifying the silence.
-        silence_chunks = int(self.silence_duration / self.chunk_duration)
-        vad_frames = frames
-        if silence_chunks > 0 and len(frames) > silence_chunks:
-            vad_frames = frames[:-silence_chunks]
+        silence_samples = int(self.silence_duration / self.chunk_duration) * chunk_samples
+        vad_audio = audio
+        if silence_samples > 0 and len(audio) > silence_samples:
+            vad_audio = audio[:-silence_samples]
 
-        if not vad_frames:
+        if len(vad_audio) == 0:
             return False
 
+        # Chunk-sized views keep the int16 conversion bounded without copying the utterance.
+        vad_frames = [
+            vad_audio[i : i + chunk_samples] for i in range(0, len(vad_audio), chunk_samples)
+        ]
+
         try:
             return self._is_voice_like_frames(vad_frames)
         except Exception:
@@ -306,13 +516,16 @@ class Listener:
         )
 
     @staticmethod
-    def _put_drop_oldest(queue: Queue[np.ndarray], item: np.ndarray) -> None:
+    def _put_drop_oldest(queue: Queue[AudioBuffer], item: AudioBuffer) -> None:
         while True:
             try:
                 queue.put_nowait(item)
                 return
             except Full:
                 try:
-                    queue.get_nowait()
+                    dropped = queue.get_nowait()
                 except Empty:
+                    item.release()
                     return
+                # Nobody will consume the dropped utterance; hand its slab back.
+                dropped.release()
@@ -0,0 +1,107 @@
+import math
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+
+@dataclass(frozen=True, slots=True)
+class NoiseFloorSample:
+    at: float  # clock() time
+    floor: float
+    threshold: float
+
+
+class NoiseFloorTracker:
+    """Online noise-floor estimate by minimum statistics.
+
+    The floor is the lowest chunk level seen over the last ``window`` seconds,
+    kept as ``subwindows`` running minima so an update is O(1).  Speech only
+    raises the level for a few seconds at a time, so it rarely sets the
+    minimum; a louder background (a fan turning on) is picked up after about
+    one window, a quieter one immediately.
+
+    ``update()`` is meant for the capture thread only; ``history()`` may be
+    read from any thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        multiplier: float = 3.0,
+        window: float = 8.0,
+        subwindows: int = 8,
+        min_floor: float = 1e-4,
+        history_size: int = 600,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if window <= 0 or subwindows <= 0:
+            raise ValueError(f"window and subwindows must be positive. Got: {window!r}, {subwindows!r}")
+
+        self.multiplier = multiplier
+        self.min_floor = min_floor
+        self._subwindow_seconds = window / subwindows
+        self._clock = clock
+
+        self._minima: deque[float] = deque(maxlen=subwindows)
+        self._window_min = math.inf
+        self._current_min = math.inf
+        self._current_seconds = 0.0
+        self._floor: float | None = None
+
+        # One sample per completed subwindow (and per reset), for diagnostics.
+        self._history: deque[NoiseFloorSample] = deque(maxlen=history_size)
+        self._history_lock = Lock()
+
+    @property
+    def floor(self) -> float | None:
+        return self._floor
+
+    @property
+    def threshold(self) -> float | None:
+        return None if self._floor is None else self._floor * self.multiplier
+
+    def reset(self, floor: float) -> float:
+        """Seed the estimate with a calibrated floor and return the threshold."""
+        self._minima.clear()
+        self._minima.extend([float(floor)] * (self._minima.maxlen or 1))
+        self._window_min = float(floor)
+        self._current_min = math.inf
+        self._current_seconds = 0.0
+        self._floor = max(self.min_floor, float(floor))
+        self._record()
+        return self._floor * self.multiplier
+
+    def update(self, level: float, duration: float) -> float:
+        """Add the level of ``duration`` seconds of audio and return the current threshold."""
+        if level < self._current_min:
+            self._current_min = level
+        self._current_seconds += duration
+
+        # Tolerance: ten 0.1 s chunks should add up to a full second.
+        completed = self._current_seconds >= self._subwindow_seconds - 1e-9
+        if completed:
+            self._minima.append(self._current_min)
+            self._window_min = min(self._minima)
+            self._current_min = math.inf
+            self._current_seconds = 0.0
+
+        self._floor = max(self.min_floor, min(self._window_min, self._current_min))
+        if completed:
+            self._record()
+        return self._floor * self.multiplier
+
+    def history(self) -> list[NoiseFloorSample]:
+        with self._history_lock:
+            return list(self._history)
+
+    def _record(self) -> None:
+        assert self._floor is not None
+        sample = NoiseFloorSample(
+            at=self._clock(),
+            floor=self._floor,
+            threshold=self._floor * self.multiplier,
+        )
+        with self._history_lock:
+            self._history.append(sample)
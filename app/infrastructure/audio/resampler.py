@@ -0,0 +1,92 @@
+from math import gcd
+
+import numpy as np
+
+
+class StreamingResampler:
+    """Polyphase FIR resampling of a mono stream, one chunk at a time.
+
+    Uses the same Kaiser-windowed low-pass filter as ``scipy.signal.resample_poly``
+    and ``upfirdn`` over each chunk plus a short input history, so chunk
+    boundaries are seamless.  The filter's group delay is compensated: the
+    concatenated output of ``process()`` calls plus ``flush()`` lines up with
+    ``resample_poly`` on the whole signal.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int) -> None:
+        if from_rate <= 0 or to_rate <= 0:
+            raise ValueError(f"Sample rates must be positive. Got: {from_rate!r} -> {to_rate!r}")
+
+        self.from_rate = int(from_rate)
+        self.to_rate = int(to_rate)
+        divisor = gcd(self.from_rate, self.to_rate)
+        self.up = self.to_rate // divisor
+        self.down = self.from_rate // divisor
+
+        if self.is_identity:
+            self._taps = np.ones(1, dtype=np.float32)
+            self._delay = 0
+        else:
+            # scipy.signal takes a noticeable time to import; only pay for it when resampling.
+            from scipy.signal import firwin, upfirdn
+
+            self._upfirdn = upfirdn
+            max_rate = max(self.up, self.down)
+            half_length = 10 * max_rate
+            taps = firwin(2 * half_length + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self.up
+            # Like resample_poly: pad the front so the delay is a whole number of output samples.
+            padding = -half_length % self.down
+            self._taps = np.concatenate([np.zeros(padding), taps]).astype(np.float32)
+            self._delay = (half_length + padding) // self.down
+        # Input history that covers the filter, kept as whole multiples of ``down``.
+        history = -(-(len(self._taps) - 1) // self.up)
+        self._history_length = -(-history // self.down) * self.down
+        self.reset()
+
+    @property
+    def is_identity(self) -> bool:
+        return self.up == self.down
+
+    def reset(self) -> None:
+        """Start a new stream."""
+        self._history = np.zeros(self._history_length, dtype=np.float32)
+        self._remainder = np.empty(0, dtype=np.float32)
+        self._skip = self._delay
+        self._consumed = 0
+        self._produced = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        samples = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        if self.is_identity:
+            return samples
+        self._consumed += len(samples)
+
+        pending = np.concatenate([self._remainder, samples]) if self._remainder.size else samples
+        usable = len(pending) // self.down * self.down
+        self._remainder = pending[usable:]
+        if usable == 0:
+            return np.empty(0, dtype=np.float32)
+
+        buffer = np.concatenate([self._history, pending[:usable]])
+        start = self._history_length * self.up // self.down
+        out = self._upfirdn(self._taps, buffer, self.up, self.down)[start : start + usable * self.up // self.down]
+        self._history = buffer[-self._history_length :]
+
+        if self._skip:
+            skipped = min(self._skip, len(out))
+            out = out[skipped:]
+            self._skip -= skipped
+        self._produced += len(out)
+        return out.astype(np.float32, copy=False)
+
+    def flush(self) -> np.ndarray:
+        """Return the rest of the stream (held back by the filter delay), then reset."""
+        expected = -(-self._consumed * self.up // self.down)
+        missing = expected - self._produced
+        tail = np.empty(0, dtype=np.float32)
+        if missing > 0 and not self.is_identity:
+            padding = (self._delay + missing) * self.down // self.up + 2 * self.down
+            tail = self.process(np.zeros(padding, dtype=np.float32))[:missing]
+        self.reset()
+        return tail
+
@@ -1,38 +1,92 @@
 import time
 from threading import Event
 
-import numpy as np
 import sounddevice as sd
 
+from app.application.audio_buffer import AudioBuffer
+from app.infrastructure.audio.devices import default_sample_rate, stream_in_use
+from app.infrastructure.audio.resampler import StreamingResampler
+from app.infrastructure.audio.stream_supervisor import StreamSupervisor
+from app.utils.logger import Logger
+
 
 class Speaker:
-    def __init__(self, *, sample_rate: int = 24_000):
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 24_000,
+        device: int | str | None = None,
+        device_sample_rate: int | None = None,
+        native_sample_rate: bool = False,
+        max_stream_retries: int = 2,
+        logger: Logger | None = None,
+    ):
         self.sample_rate = sample_rate
+        # The rate the output stream is opened at; audio at any other rate is
+        # resampled to it.  Defaults to ``sample_rate``.
+        self.device_sample_rate = device_sample_rate
+        self.native_sample_rate = native_sample_rate
+        # A failed stream is reopened (possibly on another device) and playback
+        # resumes where it stopped; after this many retries speak() gives up.
+        # Short backoff: a reply should not wait long for a device that is gone.
+        self.max_stream_retries = max_stream_retries
+        self._supervisor = StreamSupervisor(kind="output", device=device, logger=logger, backoff_max=1.0)
 
     def speak(
         self,
-        audio: np.ndarray,
+        audio: AudioBuffer,
         stop_event: Event | None = None,
         chunk_size: int = 1024,
     ) -> bool:
-        if audio.ndim == 1:
-            audio = audio.reshape(-1, 1)
-
-        try:
-            with sd.OutputStream(
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype="float32",
-            ) as stream:
-                time.sleep(0.1)
-
-                for i in range(0, len(audio), chunk_size):
-                    if stop_event and stop_event.is_set():
-                        return False
-
-                    chunk = audio[i : i + chunk_size]
-                    stream.write(chunk)
-
-                return True
-        except sd.PortAudioError as e:
-            raise OSError(str(e)) from e
+        if audio.channels != 1:
+            raise ValueError(f"Speaker plays mono audio. Got {audio.channels} channels")
+
+        samples = audio.samples
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+
+        position = 0
+        retries = 0
+        while True:
+            device = self._supervisor.device()
+            device_rate = self._device_rate(device)
+            # Playing at the wrong rate would silently change pitch and speed.
+            resampler = (
+                StreamingResampler(audio.sample_rate, device_rate) if audio.sample_rate != device_rate else None
+            )
+            try:
+                with stream_in_use(), sd.OutputStream(
+                    device=device,
+                    samplerate=device_rate,
+                    channels=1,
+                    dtype="float32",
+                ) as stream:
+                    self._supervisor.recovered()
+                    time.sleep(0.1)
+
+                    for i in range(position, len(samples), chunk_size):
+                        if stop_event and stop_event.is_set():
+                            return False
+
+                        chunk = samples[i : i + chunk_size]
+                        if resampler is not None:
+                            chunk = resampler.process(chunk).reshape(-1, 1)
+                        stream.write(chunk)
+                        position = i + chunk_size
+
+                    if resampler is not None:
+                        stream.write(resampler.flush().reshape(-1, 1))
+                    return True
+            except sd.PortAudioError as e:
+                if retries >= self.max_stream_retries:
+                    raise OSError(str(e)) from e
+                retries += 1
+                if not self._supervisor.wait_to_retry(e, stop_event):
+                    return False
+
+    def _device_rate(self, device: int | None) -> int:
+        if self.device_sample_rate is not None:
+            return self.device_sample_rate
+        if self.native_sample_rate:
+            return default_sample_rate("output", device=device, fallback=self.sample_rate)
+        return self.sample_rate
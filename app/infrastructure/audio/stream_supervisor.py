@@ -0,0 +1,85 @@
+from collections.abc import Callable
+from threading import Event
+from time import monotonic, sleep
+
+from app.infrastructure.audio.devices import find_device, rescan_devices
+from app.utils.logger import Logger
+
+
+class StreamSupervisor:
+    """Chooses the device for an audio stream and paces recovery after it fails.
+
+    ``device()`` re-enumerates devices on every call: the configured device
+    when it is present, otherwise the system default.  When a stream fails
+    (e.g. a headset is unplugged), ``wait_to_retry()`` logs the error, waits an
+    exponential backoff capped at ``backoff_max`` and re-initializes PortAudio
+    so hot-plugged devices show up.  ``recovered()`` is called once the stream
+    is open again; it ends the outage and logs how long it lasted.
+    """
+
+    def __init__(
+        self,
+        *,
+        kind: str,
+        device: int | str | None = None,
+        logger: Logger | None = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 5.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.kind = kind
+        self.preferred_device = device
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._logger = logger
+        self._clock = clock
+        self._failures = 0
+        self._outage_started_at: float | None = None
+        self._using_default = False
+        self.last_recovery_seconds: float | None = None
+
+    @property
+    def failures(self) -> int:
+        """Consecutive failures in the current outage (0 when the stream is healthy)."""
+        return self._failures
+
+    def device(self) -> int | None:
+        device = find_device(self.kind, self.preferred_device)
+        using_default = self.preferred_device is not None and device is None
+        if using_default and not self._using_default:
+            self._log(f"[Audio] {self.kind} device {self.preferred_device!r} not found; using the default")
+        self._using_default = using_default
+        return device
+
+    def next_delay(self) -> float:
+        return min(self.backoff_max, self.backoff_base * 2 ** max(0, self._failures - 1))
+
+    def wait_to_retry(self, error: Exception, stop_event: Event | None = None) -> bool:
+        """Record a failure and wait before the next attempt; False if stopped meanwhile."""
+        if self._outage_started_at is None:
+            self._outage_started_at = self._clock()
+        self._failures += 1
+        delay = self.next_delay()
+        self._log(f"[Audio] {self.kind} stream failed ({error}); retrying in {delay:.1f}s")
+
+        if stop_event is None:
+            sleep(delay)
+        elif stop_event.wait(delay):
+            return False
+        rescan_devices()
+        return True
+
+    def recovered(self) -> float | None:
+        """End the current outage, if any, and return how long it lasted (seconds)."""
+        if self._outage_started_at is None:
+            return None
+        elapsed = self._clock() - self._outage_started_at
+        self._log(f"[Audio] {self.kind} stream recovered after {elapsed:.2f}s ({self._failures} failure(s))")
+        self._outage_started_at = None
+        self._failures = 0
+        self.last_recovery_seconds = elapsed
+        return elapsed
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.log(message)
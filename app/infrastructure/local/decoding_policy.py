@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from threading import Lock
+
+
+@dataclass(frozen=True)
+class DecodingPolicy:
+    name: str
+    beam_size: int
+    vad_filter: bool
+    # True to decode with the small "fast" model when one is configured.
+    use_fast_model: bool = False
+
+
+# While asleep we only need to spot the wake word, and every loud noise reaches
+# STT, so keep Silero VAD on to reject non-speech but decode greedily.
+WAKE_POLICY = DecodingPolicy(name="wake", beam_size=1, vad_filter=True, use_fast_model=True)
+# One-word replies ("yes", "buddy"): greedy decoding is as accurate and much faster.
+SHORT_POLICY = DecodingPolicy(name="short", beam_size=1, vad_filter=False, use_fast_model=True)
+FULL_POLICY = DecodingPolicy(name="full", beam_size=5, vad_filter=True)
+
+
+class DecodingPolicySelector:
+    """Chooses faster-whisper decoding parameters from utterance length and wake state.
+
+    ``short_clip_seconds <= 0`` disables adaptation and always returns the full policy.
+    """
+
+    def __init__(self, *, short_clip_seconds: float = 1.5) -> None:
+        self.short_clip_seconds = float(short_clip_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        return self.short_clip_seconds > 0
+
+    def select(self, *, duration: float, is_awake: bool) -> DecodingPolicy:
+        if not self.enabled:
+            return FULL_POLICY
+        if not is_awake:
+            return WAKE_POLICY
+        if duration <= self.short_clip_seconds:
+            return SHORT_POLICY
+        return FULL_POLICY
+
+
+@dataclass
+class _PolicyStats:
+    count: int = 0
+    total_latency: float = 0.0
+    total_audio_seconds: float = 0.0
+    scored: int = 0
+    total_avg_logprob: float = 0.0
+
+
+class DecodingPolicyStats:
+    """Per-policy latency and confidence accounting.
+
+    There is no ground truth at runtime, so segment ``avg_logprob`` is used as
+    the accuracy proxy (closer to 0 means the decoder was more confident).
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stats: dict[str, _PolicyStats] = {}
+
+    def record(
+        self,
+        policy: DecodingPolicy,
+        *,
+        latency: float,
+        audio_seconds: float,
+        avg_logprob: float | None,
+    ) -> int:
+        """Record one transcription and return the policy's running count."""
+        with self._lock:
+            stats = self._stats.setdefault(policy.name, _PolicyStats())
+            stats.count += 1
+            stats.total_latency += latency
+            stats.total_audio_seconds += audio_seconds
+            if avg_logprob is not None:
+                stats.scored += 1
+                stats.total_avg_logprob += avg_logprob
+            return stats.count
+
+    def summary(self, policy: DecodingPolicy) -> str:
+        with self._lock:
+            stats = self._stats.get(policy.name, _PolicyStats())
+            count = stats.count
+            mean_latency_ms = stats.total_latency / count * 1000 if count else 0.0
+            rtf = stats.total_latency / stats.total_audio_seconds if stats.total_audio_seconds else 0.0
+            logprob = (
+                f"{stats.total_avg_logprob / stats.scored:.3f}" if stats.scored else "n/a"
+            )
+
+        return (
+            f"policy={policy.name} beam_size={policy.beam_size} "
+            f"vad={'on' if policy.vad_filter else 'off'} n={count} "
+            f"mean_latency={mean_latency_ms:.0f}ms rtf={rtf:.2f} mean_avg_logprob={logprob}"
+        )
@@ -1,9 +1,22 @@
 import inspect
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from threading import Lock
+from time import perf_counter
 
 import numpy as np
 
+from app.application.audio_buffer import AudioBuffer, as_audio_buffer
 from app.application.errors import SpeechToTextError
+from app.application.port.resident_model import ModelResidency
+from app.infrastructure.local.decoding_policy import (
+    FULL_POLICY,
+    DecodingPolicy,
+    DecodingPolicySelector,
+    DecodingPolicyStats,
+)
 from app.utils.logger import Logger
+from app.utils.memory import release_unused_memory
 
 try:
     from faster_whisper import WhisperModel
@@ -21,6 +34,9 @@ except Exception as e:
 
 
 class SpeechToText:
+    # faster-whisper expects 16 kHz mono float32.
+    SAMPLE_RATE = 16_000
+
     def __init__(
         self,
         *,
@@ -33,12 +49,27 @@ class SpeechToText:
         vad_min_speech_duration_ms: int = 250,
         vad_min_silence_duration_ms: int = 600,
         vad_speech_pad_ms: int = 200,
+        fast_model: str | None = None,
+        decoding_policy: DecodingPolicySelector | None = None,
+        policy_log_interval: int = 10,
         logger: Logger | None = None,
     ) -> None:
         self.model_name = model
         self.language = language
         self._logger = logger
 
+        # Small model used for short clips / wake-word detection (loaded on first use).
+        self.fast_model_name = fast_model or None
+        self._fast_model = None
+        self._fast_model_failed = False
+        self._fast_model_lock = Lock()
+        self._policy_selector = decoding_policy or DecodingPolicySelector()
+        self._policy_stats = DecodingPolicyStats()
+        self._policy_log_interval = max(1, int(policy_log_interval))
+
+        # Optional hook: reports whether the conversation is awake. Assumed awake when unset.
+        self.is_awake: Callable[[], bool] | None = None
+
         self._vad_filter = bool(vad_filter)
         # These are passed to faster-whisper's Silero VAD integration.
         # Keep defaults conservative: reduce false positives without breaking short wake words.
@@ -52,6 +83,11 @@ class SpeechToText:
         self.device: str | None = None
         self.compute_type: str | None = None
 
+        self._batched_pipeline = None
+        self._residency = ModelResidency.FULL
+        # Serializes model (re)loads between the residency manager and lazy reloads.
+        self._residency_lock = Lock()
+
         self._transcribe_supports_vad_filter: bool = False
         self._transcribe_supports_vad_parameters: bool = False
         self._logged_no_vad_support: bool = False
@@ -113,13 +149,18 @@ class SpeechToText:
                         "You can also switch back to OpenAI STT (MY_ENGLISH_BUDDY_STT_PROVIDER=openai). "
                         f"GPU error: {e} | CPU error: {cpu_e}"
                     ) from cpu_e
+            else:
+                raise SpeechToTextError(
+                    "Failed to initialize local STT model. "
+                    "If you want to use GPU, ensure CUDA 12 + cuDNN 9 are installed. "
+                    "Otherwise switch back to OpenAI STT (MY_ENGLISH_BUDDY_STT_PROVIDER=openai). "
+                    f"Original error: {e}"
+                ) from e
 
-            raise SpeechToTextError(
-                "Failed to initialize local STT model. "
-                "If you want to use GPU, ensure CUDA 12 + cuDNN 9 are installed. "
-                "Otherwise switch back to OpenAI STT (MY_ENGLISH_BUDDY_STT_PROVIDER=openai). "
-                f"Original error: {e}"
-            ) from e
+        # Remember the resolved placement so a released model reloads the same way.
+        self._full_device = self.device
+        self._full_compute_type = self.compute_type
+        self._num_workers = 2 if self.device == preferred_device else 1
 
         # Log device info after successful initialization.
         self._log(
@@ -161,43 +202,28 @@ class SpeechToText:
         except Exception:
             return ""
 
-    def transcribe(self, audio: np.ndarray) -> str:
+    def transcribe(self, audio: AudioBuffer | np.ndarray) -> str:
         try:
-            audio_arr = np.asarray(audio, dtype=np.float32)
-
-            if audio_arr.ndim == 1:
-                audio_1d = audio_arr
-            elif audio_arr.ndim == 2:
-                # Allow multi-channel audio by downmixing to mono.
-                # Listener can be configured with multiple channels, e.g. (samples, channels).
-                # Some audio stacks may produce (channels, samples), so handle both.
-                if audio_arr.shape[0] >= audio_arr.shape[1]:
-                    # (samples, channels)
-                    audio_1d = audio_arr.mean(axis=1)
-                else:
-                    # (channels, samples)
-                    audio_1d = audio_arr.mean(axis=0)
-            else:
-                raise ValueError(
-                    f"Expected 1D mono audio or 2D multi-channel audio. Got shape={audio_arr.shape!r}"
-                )
+            audio_1d = self._prepare_audio(audio)
 
-            # Listener produces float32 PCM in [-1, 1] at 16kHz.
-            audio_1d = np.clip(audio_1d, -1.0, 1.0)
-            audio_1d = np.ascontiguousarray(audio_1d)
+            duration = audio_1d.size / self.SAMPLE_RATE
+            is_awake = self.is_awake() if self.is_awake else True
+            policy = self._policy_selector.select(duration=duration, is_awake=is_awake)
+            model, model_name = self._model_for(policy)
 
             base_kwargs = {
                 "language": self.language,
                 "condition_on_previous_text": False,
                 "without_timestamps": True,
-                "beam_size": 5,
+                "beam_size": policy.beam_size,
             }
 
+            vad_filter = self._vad_filter and policy.vad_filter
             transcribe_kwargs = dict(base_kwargs)
             if self._transcribe_supports_vad_filter:
-                transcribe_kwargs["vad_filter"] = bool(self._vad_filter)
+                transcribe_kwargs["vad_filter"] = vad_filter
 
-            if self._vad_filter:
+            if vad_filter:
                 if self._transcribe_supports_vad_parameters:
                     transcribe_kwargs["vad_parameters"] = self._vad_parameters
                 elif not self._logged_no_vad_support:
@@ -205,12 +231,265 @@ class SpeechToText:
                     self._logged_no_vad_support = True
                     self._log("[STT] Installed faster-whisper does not support vad_parameters; continuing without it.")
 
-            segments, _info = self._model.transcribe(audio_1d, **transcribe_kwargs)
+            started = perf_counter()
+            segments, _info = model.transcribe(audio_1d, **transcribe_kwargs)
 
             # `segments` is a generator; force evaluation.
+            segments = list(segments)
+            latency = perf_counter() - started
+
+            self._record_policy(
+                policy,
+                model_name=model_name,
+                latency=latency,
+                duration=duration,
+                segments=segments,
+            )
+
             text = "".join(segment.text for segment in segments).strip()
             return text
         except SpeechToTextError:
             raise
         except Exception as e:
             raise SpeechToTextError(str(e)) from e
+
+    def transcribe_batch(self, audios: Sequence[AudioBuffer | np.ndarray]) -> list[str]:
+        """Transcribe several utterances with faster-whisper's batched pipeline.
+
+        Only utterances that get the full decoding policy are batched; wake-word
+        checks and short clips go through ``transcribe()`` so they keep their
+        cheaper policy (greedy, fast model, VAD).  The batched utterances are
+        laid end to end and passed as explicit clip boundaries, so each one is
+        decoded as its own batch item and segments map back to their utterance
+        by start time.
+        """
+        if len(audios) <= 1:
+            return [self.transcribe(audio) for audio in audios]
+
+        try:
+            clips = [self._prepare_audio(audio) for audio in audios]
+            is_awake = self.is_awake() if self.is_awake else True
+            policies = [
+                self._policy_selector.select(duration=clip.size / self.SAMPLE_RATE, is_awake=is_awake)
+                for clip in clips
+            ]
+        except SpeechToTextError:
+            raise
+        except Exception as e:
+            raise SpeechToTextError(str(e)) from e
+
+        texts = [""] * len(clips)
+        batched = [index for index, clip in enumerate(clips) if clip.size and policies[index] == FULL_POLICY]
+        if len(batched) < 2:
+            # A lone utterance gains nothing from the batched pipeline.
+            batched = []
+        for index, clip in enumerate(clips):
+            if clip.size and index not in batched:
+                texts[index] = self.transcribe(audios[index])
+
+        if batched:
+            for index, text in zip(batched, self._transcribe_clips([clips[i] for i in batched], FULL_POLICY)):
+                texts[index] = text
+        return texts
+
+    def _transcribe_clips(self, clips: list[np.ndarray], policy: DecodingPolicy) -> list[str]:
+        try:
+            starts: list[float] = []
+            clip_timestamps: list[dict[str, float]] = []
+            offset = 0
+            for clip in clips:
+                start = offset / self.SAMPLE_RATE
+                end = (offset + clip.size) / self.SAMPLE_RATE
+                starts.append(start)
+                clip_timestamps.append({"start": start, "end": end})
+                offset += clip.size
+
+            texts: list[list[str]] = [[] for _ in clips]
+            # Explicit clip_timestamps bypass faster-whisper's own VAD chunking.
+            segments, _info = self._get_batched_pipeline().transcribe(
+                np.concatenate(clips),
+                language=self.language,
+                without_timestamps=True,
+                beam_size=policy.beam_size,
+                batch_size=len(clip_timestamps),
+                clip_timestamps=clip_timestamps,
+            )
+            for segment in segments:
+                # Segment starts are rounded to milliseconds; nudge past the clip start.
+                position = bisect_right(starts, float(segment.start) + 1e-3) - 1
+                texts[max(position, 0)].append(segment.text)
+
+            return ["".join(parts).strip() for parts in texts]
+        except SpeechToTextError:
+            raise
+        except Exception as e:
+            raise SpeechToTextError(str(e)) from e
+
+    @property
+    def residency(self) -> ModelResidency:
+        return self._residency
+
+    def set_residency(self, residency: ModelResidency) -> None:
+        """Reload, reduce or release the Whisper weights.
+
+        REDUCED keeps only the fast model when one is configured (it already
+        serves wake-word checks); otherwise the main model is reloaded as int8.
+        Either way the app can still hear the wake word.
+        """
+        with self._residency_lock:
+            if residency == self._residency:
+                return
+
+            # Drop references first so the old weights can be freed before loading.
+            self._model = None
+            self._batched_pipeline = None
+            if residency == ModelResidency.RELEASED:
+                self._fast_model = None
+            release_unused_memory()
+
+            if residency == ModelResidency.FULL:
+                self._model = self._create_model(
+                    self.model_name,
+                    compute_type=self._full_compute_type,
+                    num_workers=self._num_workers,
+                )
+                self.compute_type = self._full_compute_type
+            elif residency == ModelResidency.REDUCED and self._get_fast_model() is None:
+                self._model = self._create_model(self.model_name, compute_type="int8", num_workers=1)
+                self.compute_type = "int8"
+
+            self._residency = residency
+
+    def _create_model(self, name: str, *, compute_type: str | None, num_workers: int):
+        try:
+            return WhisperModel(
+                name,
+                device=self._full_device,
+                compute_type=compute_type,
+                num_workers=num_workers,
+            )
+        except Exception as e:
+            raise SpeechToTextError(f"Failed to load local STT model {name!r}: {e}") from e
+
+    def _model_for(self, policy: DecodingPolicy):
+        if policy.use_fast_model:
+            fast_model = self._get_fast_model()
+            if fast_model is not None:
+                return fast_model, self.fast_model_name
+
+        model = self._model
+        if model is not None:
+            return model, self.model_name
+
+        # Reduced to the fast model only (e.g. right after wake, before the
+        # background reload finishes): keep answering with it rather than block.
+        fast_model = self._get_fast_model()
+        if fast_model is not None:
+            return fast_model, self.fast_model_name
+
+        return self._require_main_model(), self.model_name
+
+    def _require_main_model(self):
+        model = self._model
+        if model is None:
+            self._log("[STT] Local STT model was released; reloading before transcribing")
+            self.set_residency(ModelResidency.FULL)
+            model = self._model
+        return model
+
+    def _get_fast_model(self):
+        if not self.fast_model_name or self._fast_model_failed:
+            return None
+
+        with self._fast_model_lock:
+            if self._fast_model is None and not self._fast_model_failed:
+                try:
+                    self._fast_model = WhisperModel(
+                        self.fast_model_name,
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        num_workers=1,
+                    )
+                    self._log(f"[STT] Fast local STT model loaded: model={self.fast_model_name}")
+                except Exception as e:
+                    # Keep transcribing with the configured model rather than failing turns.
+                    self._fast_model_failed = True
+                    self._log(
+                        f"[STT] Failed to load fast model {self.fast_model_name!r}; "
+                        f"using {self.model_name!r} for all clips. Error: {e}"
+                    )
+            return self._fast_model
+
+    def _record_policy(
+        self,
+        policy: DecodingPolicy,
+        *,
+        model_name: str,
+        latency: float,
+        duration: float,
+        segments: list,
+    ) -> None:
+        logprobs = [
+            float(segment.avg_logprob)
+            for segment in segments
+            if isinstance(getattr(segment, "avg_logprob", None), (int, float))
+        ]
+        avg_logprob = sum(logprobs) / len(logprobs) if logprobs else None
+
+        count = self._policy_stats.record(
+            policy,
+            latency=latency,
+            audio_seconds=duration,
+            avg_logprob=avg_logprob,
+        )
+        if count == 1 or count % self._policy_log_interval == 0:
+            self._log(
+                f"[STT] Decoding {self._policy_stats.summary(policy)} model={model_name} "
+                f"last_latency={latency * 1000:.0f}ms"
+            )
+
+    def _get_batched_pipeline(self):
+        if self._batched_pipeline is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError as e:
+                raise SpeechToTextError(
+                    "Batched local STT requires faster-whisper>=1.1 (BatchedInferencePipeline). "
+                    f"Original error: {e}"
+                ) from e
+            self._batched_pipeline = BatchedInferencePipeline(model=self._require_main_model())
+            self._log("[STT] Local STT batched inference pipeline initialized")
+        return self._batched_pipeline
+
+    def _prepare_audio(self, audio: AudioBuffer | np.ndarray) -> np.ndarray:
+        buffer = as_audio_buffer(audio, sample_rate=self.SAMPLE_RATE)
+        if buffer.sample_rate != self.SAMPLE_RATE:
+            raise ValueError(
+                f"Local STT expects {self.SAMPLE_RATE} Hz audio. Got: {buffer.sample_rate} Hz"
+            )
+
+        # No copy when the buffer already holds float32 (the Listener's format).
+        audio_arr = np.asarray(buffer.samples, dtype=np.float32)
+
+        if audio_arr.ndim == 1:
+            audio_1d = audio_arr
+        elif audio_arr.ndim == 2:
+            # Allow multi-channel audio by downmixing to mono.
+            # Listener can be configured with multiple channels, e.g. (samples, channels).
+            # Some audio stacks may produce (channels, samples), so handle both.
+            if audio_arr.shape[0] >= audio_arr.shape[1]:
+                # (samples, channels)
+                audio_1d = audio_arr.mean(axis=1)
+            else:
+                # (channels, samples)
+                audio_1d = audio_arr.mean(axis=0)
+        else:
+            raise ValueError(
+                f"Expected 1D mono audio or 2D multi-channel audio. Got shape={audio_arr.shape!r}"
+            )
+
+        # Listener produces float32 PCM in [-1, 1] at 16kHz; only pay for a clipped
+        # copy when something is actually out of range.
+        if audio_1d.size and (audio_1d.max() > 1.0 or audio_1d.min() < -1.0):
+            audio_1d = np.clip(audio_1d, -1.0, 1.0)
+        return np.ascontiguousarray(audio_1d)
@@ -1,7 +1,12 @@
+from threading import Lock
+
 import numpy as np
 
+from app.application.audio_buffer import AudioBuffer
 from app.application.errors import TextToSpeechError
+from app.application.port.resident_model import ModelResidency
 from app.utils.logger import Logger
+from app.utils.memory import release_unused_memory
 
 try:
     from kokoro import KPipeline
@@ -29,6 +34,7 @@ except Exception as e:
 
 _DEFAULT_VOICE = "af_heart"
 _DEFAULT_LANG_CODE = "a"  # American English
+_SAMPLE_RATE = 24_000  # Kokoro は 24 kHz で出力する。
 
 
 class TextToSpeech:
@@ -47,15 +53,43 @@ class TextToSpeech:
             f"[TTS] Initializing local TTS (Kokoro): voice={voice}, lang_code={lang_code}"
         )
 
+        # residency manager と synthesize() の遅延再ロードが同時にロードしないようにする。
+        self._pipeline_lock = Lock()
+        self._pipeline = self._create_pipeline()
+
+        self._log(f"[TTS] Local TTS initialized: voice={self._voice}, lang_code={self._lang_code}")
+
+    def _create_pipeline(self):
         try:
             # KPipeline のロード時にモデルが Hugging Face からダウンロードされる（初回のみ）。
-            self._pipeline = KPipeline(lang_code=lang_code)
+            return KPipeline(lang_code=self._lang_code)
         except Exception as e:
             raise TextToSpeechError(
                 f"Failed to initialize Kokoro TTS pipeline: {e}"
             ) from e
 
-        self._log(f"[TTS] Local TTS initialized: voice={self._voice}, lang_code={self._lang_code}")
+    @property
+    def residency(self) -> ModelResidency:
+        return ModelResidency.FULL if self._pipeline is not None else ModelResidency.RELEASED
+
+    def set_residency(self, residency: ModelResidency) -> None:
+        """Kokoro に縮小版は無いため、REDUCED は RELEASED と同じ扱いにする。"""
+        with self._pipeline_lock:
+            if residency == ModelResidency.FULL:
+                if self._pipeline is None:
+                    self._pipeline = self._create_pipeline()
+                return
+            if self._pipeline is not None:
+                self._pipeline = None
+                release_unused_memory()
+
+    def _require_pipeline(self):
+        pipeline = self._pipeline
+        if pipeline is None:
+            self._log("[TTS] Local TTS pipeline was released; reloading before synthesizing")
+            self.set_residency(ModelResidency.FULL)
+            pipeline = self._pipeline
+        return pipeline
 
     def _log(self, message: str) -> None:
         if not message:
@@ -63,13 +97,16 @@ class TextToSpeech:
         if self._logger:
             self._logger.log(message)
 
-    def synthesize(self, text: str) -> np.ndarray:
+    def synthesize(self, text: str) -> AudioBuffer:
         try:
-            chunks = [chunk for _, _, chunk in self._pipeline(text, voice=self._voice)]
+            pipeline = self._require_pipeline()
+            chunks = [chunk for _, _, chunk in pipeline(text, voice=self._voice)]
             if not chunks:
-                return np.zeros(0, dtype=np.float32)
+                return AudioBuffer(np.zeros(0, dtype=np.float32), sample_rate=_SAMPLE_RATE)
             # Kokoro は float32 を返すが、将来のライブラリ変更に備えて明示的に変換する。
-            return np.concatenate(chunks).astype(np.float32)
+            # dtype を concatenate に渡し、結合と型変換を 1 回の確保で済ませる。
+            samples = np.concatenate(chunks, dtype=np.float32)
+            return AudioBuffer(samples, sample_rate=_SAMPLE_RATE)
         except TextToSpeechError:
             raise
         except Exception as e:
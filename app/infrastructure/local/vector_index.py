@@ -0,0 +1,142 @@
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+from app.domain.vo.turn import Turn
+
+_META = "meta.json"
+_VECTORS = "vectors.f32"
+_TURNS = "turns.jsonl"
+
+
+class MemmapVectorIndex:
+    """On-disk embedding index for past turns, searched by cosine similarity.
+
+    Vectors are L2-normalized and appended to a flat float32 file that is
+    memory-mapped for search, so the OS pages it in on demand instead of the
+    process holding every embedding.  Turn texts live in a JSONL file next to
+    it; only their byte offsets are kept in memory.
+
+    Row ``i`` of the vector file always belongs to line ``i`` of the turns
+    file.  If a crash leaves the two out of step, the extra tail is dropped
+    on the next open.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._dim: int | None = None
+        self._offsets: list[int] = []
+        self._matrix: np.memmap | None = None
+
+        meta_path = self.directory / _META
+        if meta_path.exists():
+            self._dim = int(json.loads(meta_path.read_text(encoding="utf-8"))["dim"])
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    def add(self, turns: Sequence[Turn], vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(turns):
+            raise ValueError(f"Expected {len(turns)} vectors, got shape {vectors.shape}.")
+        if not turns:
+            return
+
+        with self._lock:
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                (self.directory / _META).write_text(json.dumps({"dim": self._dim}), encoding="utf-8")
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding size changed ({vectors.shape[1]} != {self._dim}); "
+                    f"use a new index directory for a different model."
+                )
+
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            normalized = vectors / np.maximum(norms, 1e-12)
+
+            # Vectors first: a crash in between leaves an extra vector, which _load drops.
+            with open(self.directory / _VECTORS, "ab") as f:
+                f.write(normalized.astype(np.float32, copy=False).tobytes())
+            with open(self.directory / _TURNS, "ab") as f:
+                for turn in turns:
+                    self._offsets.append(f.tell())
+                    record = {"user": turn.user_utterance, "assistant": turn.assistant_reply}
+                    f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._matrix = None
+
+    def search(self, vector: np.ndarray, k: int) -> list[tuple[float, Turn]]:
+        with self._lock:
+            if k <= 0 or not self._offsets or self._dim is None:
+                return []
+            query = np.asarray(vector, dtype=np.float32).reshape(-1)
+            if query.shape[0] != self._dim:
+                raise ValueError(f"Query has {query.shape[0]} dims; index has {self._dim}.")
+            query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+            scores = self._mapped() @ query
+            k = min(k, len(scores))
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+            return [(float(scores[i]), self._read_turn(int(i))) for i in top]
+
+    def close(self) -> None:
+        with self._lock:
+            self._matrix = None
+
+    def _mapped(self) -> np.memmap:
+        # Assumes _lock is already held by the caller.
+        if self._matrix is None:
+            self._matrix = np.memmap(
+                self.directory / _VECTORS,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(self._offsets), self._dim),
+            )
+        return self._matrix
+
+    def _read_turn(self, row: int) -> Turn:
+        with open(self.directory / _TURNS, "rb") as f:
+            f.seek(self._offsets[row])
+            record = json.loads(f.readline())
+        return Turn(user_utterance=record["user"], assistant_reply=record["assistant"])
+
+    def _load(self) -> None:
+        turns_path = self.directory / _TURNS
+        vectors_path = self.directory / _VECTORS
+        # Start of each complete line, plus the end of the last one.
+        offsets: list[int] = [0]
+        if turns_path.exists():
+            with open(turns_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    offsets.append(offsets[-1] + len(line))
+
+        rows = 0
+        if self._dim and vectors_path.exists():
+            rows = vectors_path.stat().st_size // (self._dim * 4)
+        count = min(len(offsets) - 1, rows)
+
+        # Drop whatever an interrupted append left behind.
+        if vectors_path.exists() and self._dim:
+            self._truncate(vectors_path, count * self._dim * 4)
+        if turns_path.exists():
+            self._truncate(turns_path, offsets[count])
+        self._offsets = offsets[:count]
+
+    @staticmethod
+    def _truncate(path: Path, size: int) -> None:
+        if path.stat().st_size > size:
+            os.truncate(path, size)
@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+
+import numpy as np
+from openai import OpenAI, OpenAIError
+
+from app.application.errors import EmbeddingError
+
+
+class Embedder:
+    """Embeddings from an OpenAI-compatible ``/embeddings`` endpoint.
+
+    Point the client's ``base_url`` at a local server (llama.cpp, Ollama, ...)
+    to keep embeddings on the machine.
+    """
+
+    def __init__(self, *, client: OpenAI, model: str = "text-embedding-3-small"):
+        self.client = client
+        self.model = model
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        try:
+            response = self.client.embeddings.create(model=self.model, input=list(texts))
+        except OpenAIError as e:
+            raise EmbeddingError(str(e)) from e
+
+        # The API may return items out of order; "index" ties each one to its input.
+        items = sorted(response.data, key=lambda item: item.index)
+        if len(items) != len(texts):
+            raise EmbeddingError(f"Expected {len(texts)} embeddings, got {len(items)}.")
+        return np.asarray([item.embedding for item in items], dtype=np.float32)
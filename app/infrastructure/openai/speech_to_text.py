@@ -1,9 +1,10 @@
 import io
+import wave
 
 import numpy as np
 from openai import OpenAI, OpenAIError
-from scipy.io.wavfile import write
 
+from app.application.audio_buffer import AudioBuffer, as_audio_buffer
 from app.application.errors import SpeechToTextError
 
 
@@ -18,19 +19,18 @@ class SpeechToText:
     ):
         self.client = client
         self.model = model
+        # Used only for bare ndarrays; AudioBuffer carries its own rate.
         self.sample_rate = sample_rate
         self.silence_threshold = silence_threshold
 
-    def transcribe(self, audio: np.ndarray) -> str:
-        if self._is_silent(audio):
-            return ""
+    def transcribe(self, audio: AudioBuffer | np.ndarray) -> str:
+        buffer = as_audio_buffer(audio, sample_rate=self.sample_rate)
+        samples = buffer.samples
 
-        audio = np.clip(audio, -1.0, 1.0)
-        audio_int16 = (audio * 32767).astype(np.int16)
+        if self._is_silent(samples):
+            return ""
 
-        wav_buffer = io.BytesIO()
-        write(wav_buffer, self.sample_rate, audio_int16)
-        wav_buffer.seek(0)
+        wav_buffer = self._to_wav(self._to_pcm16(samples), sample_rate=buffer.sample_rate)
 
         try:
             response = self.client.audio.transcriptions.create(
@@ -41,7 +41,30 @@ class SpeechToText:
         except OpenAIError as e:
             raise SpeechToTextError(str(e)) from e
 
+    @staticmethod
+    def _to_pcm16(samples: np.ndarray) -> np.ndarray:
+        # Scale into a single scratch array and clip in place instead of
+        # materializing a clipped copy, a scaled copy and then the int16 result.
+        scaled = np.multiply(samples, 32767.0, dtype=np.float32)
+        np.clip(scaled, -32767.0, 32767.0, out=scaled)
+        return scaled.astype(np.int16)
+
+    @staticmethod
+    def _to_wav(audio_int16: np.ndarray, *, sample_rate: int) -> io.BytesIO:
+        # The stdlib writer avoids importing scipy.io (~100 ms of scipy.sparse etc.).
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, "wb") as wav:
+            wav.setnchannels(1 if audio_int16.ndim == 1 else audio_int16.shape[1])
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(audio_int16.astype("<i2", copy=False).tobytes())
+        wav_buffer.seek(0)
+        return wav_buffer
+
     def _is_silent(self, audio: np.ndarray) -> bool:
         audio_float = np.asarray(audio, dtype=np.float32)
-        rms = np.sqrt(np.mean(audio_float**2))
+        if audio_float.size == 0:
+            return True
+        flat = audio_float.reshape(-1)
+        rms = np.sqrt(np.dot(flat, flat) / flat.size)
         return rms < self.silence_threshold
@@ -1,6 +1,7 @@
 import numpy as np
 from openai import OpenAI, OpenAIError
 
+from app.application.audio_buffer import AudioBuffer
 from app.application.errors import TextToSpeechError
 
 
@@ -11,12 +12,15 @@ class TextToSpeech:
         client: OpenAI,
         model: str = "gpt-4o-mini-tts",
         voice: str = "alloy",
+        sample_rate: int = 24_000,
     ):
         self.client = client
         self.model = model
         self.voice = voice
+        # OpenAI "pcm" responses are 24 kHz, 16-bit little-endian mono.
+        self.sample_rate = sample_rate
 
-    def synthesize(self, text: str) -> np.ndarray:
+    def synthesize(self, text: str) -> AudioBuffer:
         try:
             response = self.client.audio.speech.create(
                 model=self.model,
@@ -29,6 +33,7 @@ class TextToSpeech:
             raise TextToSpeechError(str(e)) from e
 
         audio_int16 = np.frombuffer(pcm_bytes, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32767.0
+        # Decode straight into float32 (one allocation instead of astype + divide).
+        audio_float = np.multiply(audio_int16, 1.0 / 32767.0, dtype=np.float32)
 
-        return audio_float
+        return AudioBuffer(audio_float, sample_rate=self.sample_rate)
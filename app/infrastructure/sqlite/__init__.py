@@ -0,0 +1 @@
+"""SQLite infrastructure implementations."""
@@ -0,0 +1,219 @@
+import re
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+
+from app.application.port.conversation_store import TurnSearchHit
+from app.domain.vo.turn import Turn
+from app.utils.logger import Logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    user_utterance TEXT NOT NULL,
+    assistant_reply TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS turns_session_id ON turns(session_id, id);
+"""
+
+# External-content index: the text lives once in ``turns``; triggers keep the
+# index in step with every insert, so search never rescans the table.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE turns_fts USING fts5(
+    user_utterance,
+    assistant_reply,
+    content='turns',
+    content_rowid='id',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS turns_fts_insert AFTER INSERT ON turns BEGIN
+    INSERT INTO turns_fts(rowid, user_utterance, assistant_reply)
+    VALUES (new.id, new.user_utterance, new.assistant_reply);
+END;
+CREATE TRIGGER IF NOT EXISTS turns_fts_delete AFTER DELETE ON turns BEGIN
+    INSERT INTO turns_fts(turns_fts, rowid, user_utterance, assistant_reply)
+    VALUES ('delete', old.id, old.user_utterance, old.assistant_reply);
+END;
+"""
+
+_TOKEN = re.compile(r"\w+")
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open the history database in WAL mode (readers never wait for the writer)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL + NORMAL only risks the last transactions on power loss, never corruption.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SqliteConversationStore:
+    """Append-only turn history in SQLite.
+
+    ``append_turn`` only enqueues; a background thread inserts queued turns
+    in one transaction per batch, so the reply path never waits for disk.
+    Reads use their own connection and see every committed batch.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        session_id: str | None = None,
+        logger: Logger | None = None,
+    ) -> None:
+        self.path = path
+        self.session_id = session_id or uuid.uuid4().hex
+        self._logger = logger
+
+        self._write_conn = connect(path)
+        self._write_conn.executescript(_SCHEMA)
+        self.has_fts = self._ensure_fts()
+        self._read_conn = connect(path)
+        # Reads may come from the resume thread and the UI at the same time.
+        self._read_lock = Lock()
+
+        self._queue: Queue[tuple[float, Turn] | Event | None] = Queue()
+        self._closed = False
+        self._thread = Thread(target=self._run, name="conversation-store", daemon=True)
+        self._thread.start()
+
+    def append_turn(self, turn: Turn) -> None:
+        if self._closed:
+            return
+        self._queue.put((time.time(), turn))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every turn appended so far is committed."""
+        if self._closed:
+            return True
+        done = Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def load_recent(self, limit: int) -> list[Turn]:
+        if limit <= 0:
+            return []
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                "SELECT user_utterance, assistant_reply FROM turns ORDER BY id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [Turn(user_utterance=user, assistant_reply=reply) for user, reply in reversed(rows)]
+
+    def search(self, query: str, *, limit: int = 50) -> list[TurnSearchHit]:
+        """Turns whose utterance or reply contain every word of ``query``.
+
+        Words match by prefix ("trav" finds "travelled"); FTS syntax in
+        ``query`` is treated as plain text.  Best matches come first.
+        """
+        tokens = _TOKEN.findall(query)
+        if not tokens or limit <= 0:
+            return []
+
+        if self.has_fts:
+            match = " ".join(f'"{token}"*' for token in tokens)
+            sql = (
+                "SELECT t.id, t.session_id, t.created_at, t.user_utterance, t.assistant_reply,"
+                " snippet(turns_fts, -1, '[', ']', '...', 12)"
+                " FROM turns_fts JOIN turns AS t ON t.id = turns_fts.rowid"
+                " WHERE turns_fts MATCH ? ORDER BY bm25(turns_fts) LIMIT ?"
+            )
+            params: tuple = (match, limit)
+        else:
+            # Without FTS5 fall back to a (slow) scan so search still works.
+            conditions = " AND ".join(
+                "(user_utterance LIKE ? OR assistant_reply LIKE ?)" for _ in tokens
+            )
+            sql = (
+                "SELECT id, session_id, created_at, user_utterance, assistant_reply, user_utterance"
+                f" FROM turns WHERE {conditions} ORDER BY id DESC LIMIT ?"
+            )
+            params = (*(f"%{token}%" for token in tokens for _ in range(2)), limit)
+
+        with self._read_lock:
+            rows = self._read_conn.execute(sql, params).fetchall()
+        return [
+            TurnSearchHit(
+                turn_id=turn_id,
+                session_id=session_id,
+                created_at=datetime.fromtimestamp(created_at),
+                turn=Turn(user_utterance=user, assistant_reply=reply),
+                snippet=snippet,
+            )
+            for turn_id, session_id, created_at, user, reply, snippet in rows
+        ]
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        with self._read_lock:
+            self._read_conn.close()
+
+    def _ensure_fts(self) -> bool:
+        exists = self._write_conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'turns_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            with self._write_conn:
+                # "rebuild" indexes turns saved before the index existed.
+                self._write_conn.executescript(
+                    "BEGIN;" + _FTS_SCHEMA + "INSERT INTO turns_fts(turns_fts) VALUES ('rebuild');COMMIT;"
+                )
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5.
+            return False
+        return True
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            rows: list[tuple[str, float, str, str]] = []
+            waiters: list[Event] = []
+            # Drain whatever is queued so a burst commits in one transaction.
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, Event):
+                    waiters.append(item)
+                else:
+                    created_at, turn = item
+                    rows.append((self.session_id, created_at, turn.user_utterance, turn.assistant_reply))
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if rows:
+                self._insert(rows)
+            for waiter in waiters:
+                waiter.set()
+
+        self._write_conn.close()
+
+    def _insert(self, rows: list[tuple[str, float, str, str]]) -> None:
+        try:
+            with self._write_conn:
+                self._write_conn.executemany(
+                    "INSERT INTO turns (session_id, created_at, user_utterance, assistant_reply)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            # History is best-effort; never take the conversation down with it.
+            if self._logger:
+                self._logger.log(f"Failed to save conversation history: {e}")
@@ -1,38 +1,167 @@
 import sys
-
-from PySide6.QtWidgets import QApplication
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from app.config import AppConfig
-from app.di_container import build_container
-from app.presentation.conversation_worker import ConversationWorker
-from app.presentation.main_window import MainWindow
 from app.utils.args import parse_args
 from app.utils.env import load_dotenv
+from app.utils.event_log import EventLog
+from app.utils.logger import Logger
+from app.utils.session_log_writer import SessionLogWriter
+from app.utils.startup_profiler import StartupProfiler, profile_phase
+
+if TYPE_CHECKING:
+    from app.di_container import AppContainer
+    from app.presentation.conversation_worker import ConversationWorker
+
+# Heavy modules (PySide6, numpy, openai, sounddevice, local models) are imported
+# lazily below so the window can appear before they finish loading.
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(sys.argv[1:] if argv is None else argv)
-    load_dotenv(args.env_file)
+
+    profiler: StartupProfiler | None = None
+    if args.profile_startup:
+        profiler = StartupProfiler()
+        profiler.install_import_hook()
+
+    with profile_phase(profiler, "dotenv"):
+        load_dotenv(args.env_file)
 
     try:
-        config = AppConfig.from_env()
-        container = build_container(config)
+        with profile_phase(profiler, "config"):
+            config = AppConfig.from_env()
     except ValueError as e:
         print(f"Config error: {e}", file=sys.stderr)
         return 1
+
+    logs = _SessionLogs.create(config)
+
+    if args.headless:
+        return _run_headless(config, logs, profiler=profiler, log_format=args.log_format)
+    return _run_gui(config, logs, profiler=profiler)
+
+
+@dataclass(frozen=True)
+class _SessionLogs:
+    logger: Logger
+    event_log: EventLog
+
+    @staticmethod
+    def create(config: AppConfig) -> "_SessionLogs":
+        log_dir = Path(config.logging.log_dir)
+        started_at = datetime.now()
+
+        def writer(suffix: str) -> SessionLogWriter:
+            # Stream to disk as lines are written so a crash keeps the log.
+            return SessionLogWriter(
+                log_dir,
+                started_at=started_at,
+                max_bytes=int(config.logging.max_file_mb * 1024 * 1024),
+                rotate_interval=config.logging.rotate_hours * 3600,
+                suffix=suffix,
+            )
+
+        return _SessionLogs(
+            logger=Logger(log_dir=log_dir, writer=writer(".txt")),
+            event_log=EventLog(writer=writer(".events.jsonl") if config.logging.events else None),
+        )
+
+    def save(self) -> None:
+        self.logger.save()
+        self.event_log.close()
+
+
+def _build_container(config: AppConfig, logs: _SessionLogs, profiler: StartupProfiler | None):
+    with profile_phase(profiler, "container"):
+        from app.di_container import build_container
+
+        return build_container(
+            config,
+            logger=logs.logger,
+            event_log=logs.event_log,
+            profiler=profiler,
+        )
+
+
+def _shutdown(
+    container: "AppContainer | None",
+    logs: _SessionLogs,
+    *,
+    worker: "ConversationWorker | None" = None,
+) -> None:
+    # The runner's threads must be gone before the store, memory and logs close under them.
+    if worker is not None:
+        worker.stop()
+    if container is not None:
+        container.close()
+    logs.save()
+
+
+def _print_startup_report(profiler: StartupProfiler | None) -> None:
+    if profiler is None:
+        return
+    profiler.uninstall_import_hook()
+    print(profiler.report(), file=sys.stderr)
+
+
+def _run_headless(
+    config: AppConfig,
+    logs: _SessionLogs,
+    *,
+    profiler: StartupProfiler | None,
+    log_format: str,
+) -> int:
+    # Keep Qt out of the process entirely in headless mode.
+    from app.presentation.headless import HeadlessApp
+
+    try:
+        container = _build_container(config, logs, profiler)
+    except ValueError as e:
+        print(f"Config error: {e}", file=sys.stderr)
+        logs.save()
+        return 1
     except Exception as e:
         print(f"Failed to initialize application: {e}", file=sys.stderr)
+        logs.save()
         return 2
 
-    conversation_worker = ConversationWorker(container.conversation_runner)
+    _print_startup_report(profiler)
+
+    app = HeadlessApp(
+        container.conversation_runner,
+        on_shutdown=lambda: _shutdown(container, logs),
+        log_format=log_format,
+    )
+    return app.run()
+
+
+def _run_gui(config: AppConfig, logs: _SessionLogs, *, profiler: StartupProfiler | None) -> int:
+    with profile_phase(profiler, "window"):
+        from PySide6.QtWidgets import QApplication
+
+        from app.presentation.container_loader import ContainerLoader
+        from app.presentation.main_window import MainWindow
 
-    app = QApplication(sys.argv)
-    app.aboutToQuit.connect(container.logger.save)
+        app = QApplication(sys.argv)
 
-    window = MainWindow(conversation_worker)
-    window.show()
+        window = MainWindow()
+        window.show()
 
-    conversation_worker.start()
+    # Build STT/TTS/audio devices off the UI thread; the window is already visible.
+    # Connect to window slots so the handlers run on the UI thread.
+    loader = ContainerLoader(lambda: _build_container(config, logs, profiler))
+    loader.loaded.connect(window.on_container_loaded)
+    loader.failed.connect(window.on_initialization_failed)
+    loader.failed.connect(
+        lambda message: print(f"Failed to initialize application: {message}", file=sys.stderr)
+    )
+    window.conversation_started.connect(lambda: _print_startup_report(profiler))
+    app.aboutToQuit.connect(lambda: _shutdown(loader.container, logs, worker=window.worker))
+    loader.start()
 
     return app.exec()
 
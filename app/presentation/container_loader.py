@@ -0,0 +1,25 @@
+from collections.abc import Callable
+
+from PySide6.QtCore import QThread, Signal
+
+
+class ContainerLoader(QThread):
+    """Builds the app container off the UI thread so the window shows immediately."""
+
+    loaded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, build: Callable[[], object]):
+        super().__init__()
+        self._build = build
+        # Kept so the app can close it on exit even though the UI only sees the runner.
+        self.container: object | None = None
+
+    def run(self) -> None:
+        try:
+            container = self._build()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.container = container
+        self.loaded.emit(container)
@@ -1,19 +1,34 @@
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, QTimer, Signal
 
 from app.application.conversation_runner import ConversationRunner
+from app.presentation.log_coalescer import LogCoalescer
 
 
 class ConversationWorker(QThread):
-    log = Signal(str)
+    # Log lines are delivered in batches (at most one per LOG_FLUSH_INTERVAL_MS)
+    # so a replay of thousands of buffered lines does not flood the event loop.
+    log_batch = Signal(list)
     calibration_started = Signal()
     calibration_finished = Signal(float)
     calibration_failed = Signal(str)
 
+    LOG_FLUSH_INTERVAL_MS = 50
+
+    # Emitted from logging threads; queued to the UI thread, where this object lives.
+    _logs_pending = Signal()
+
     def __init__(self, runner: ConversationRunner):
         super().__init__()
         self.runner = runner
 
-        self.runner.logger.on_emit = self.log.emit
+        self._log_coalescer = LogCoalescer()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._logs_pending.connect(self._schedule_log_flush)
+
+        self.runner.logger.on_emit = self._enqueue_log
 
         # Bridge calibration events to the UI.
         self.runner.on_calibration_start = self.calibration_started.emit
@@ -25,8 +40,26 @@ class ConversationWorker(QThread):
     def request_noise_calibration(self) -> None:
         self.runner.request_noise_recalibration()
 
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the runner and wait for ``run()`` to return."""
+        self.runner.stop(timeout)
+        self.wait(int(timeout * 1000))
+
     def run(self) -> None:
         try:
             self.runner.run()
         except Exception as e:
-            self.log.emit(f"Unexpected error: {e}")
+            self._enqueue_log(f"Unexpected error: {e}")
+
+    def _enqueue_log(self, line: str) -> None:
+        if self._log_coalescer.add(line):
+            self._logs_pending.emit()
+
+    def _schedule_log_flush(self) -> None:
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        lines = self._log_coalescer.drain()
+        if lines:
+            self.log_batch.emit(lines)
@@ -0,0 +1,123 @@
+import json
+import signal
+import sys
+from collections.abc import Callable
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Literal, TextIO
+
+from app.application.conversation_runner import ConversationRunner
+
+LogFormat = Literal["text", "jsonl"]
+
+
+class ConsoleLogSink:
+    """Writes runner log lines to a text stream as plain text or JSON Lines."""
+
+    def __init__(self, *, stream: TextIO, log_format: LogFormat = "text") -> None:
+        if log_format not in ("text", "jsonl"):
+            raise ValueError(f"log_format must be 'text' or 'jsonl'. Got: {log_format!r}")
+
+        self._stream = stream
+        self._log_format = log_format
+        # Logger.log is called from several worker threads.
+        self._lock = Lock()
+
+    def __call__(self, message: str) -> None:
+        self.write(message)
+
+    def write(self, message: str, *, event: str = "log") -> None:
+        if self._log_format == "jsonl":
+            line = json.dumps(
+                {
+                    "ts": datetime.now().isoformat(timespec="milliseconds"),
+                    "event": event,
+                    "message": message,
+                },
+                ensure_ascii=False,
+            )
+        else:
+            line = message
+
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+class HeadlessApp:
+    """Runs ConversationRunner without Qt, shutting down on SIGINT/SIGTERM.
+
+    The runner loop runs on a daemon thread and the main thread just waits for
+    a stop request (a signal or the runner crashing), then stops the runner.
+    """
+
+    def __init__(
+        self,
+        runner: ConversationRunner,
+        *,
+        on_shutdown: Callable[[], None] | None = None,
+        stream: TextIO | None = None,
+        log_format: LogFormat = "text",
+    ) -> None:
+        self.runner = runner
+        self._on_shutdown = on_shutdown
+        self._sink = ConsoleLogSink(stream=stream or sys.stdout, log_format=log_format)
+        self._stop_event = Event()
+        self._exit_code = 0
+
+        self.runner.logger.on_emit = self._sink
+        self.runner.on_calibration_error = lambda e: self._sink.write(
+            str(e), event="calibration_error"
+        )
+
+    def request_stop(self, exit_code: int = 0) -> None:
+        self._exit_code = exit_code
+        self._stop_event.set()
+
+    def run(self) -> int:
+        previous_handlers = self._install_signal_handlers()
+        runner_thread = Thread(target=self._run_runner, name="conversation-runner", daemon=True)
+        try:
+            runner_thread.start()
+
+            # Wait in short slices so signal handlers get a chance to run on Windows.
+            while not self._stop_event.wait(timeout=0.5):
+                pass
+        finally:
+            self._restore_signal_handlers(previous_handlers)
+            # Stop the mic, playback and watchdog before on_shutdown closes the store and logs.
+            self.runner.stop()
+            if runner_thread.is_alive():
+                runner_thread.join(timeout=2.0)
+            if self._on_shutdown:
+                self._on_shutdown()
+
+        return self._exit_code
+
+    def _run_runner(self) -> None:
+        try:
+            self.runner.run()
+        except Exception as e:
+            self._sink.write(f"Unexpected error: {e}", event="error")
+            self.request_stop(exit_code=1)
+
+    def _handle_signal(self, signum: int, _frame: object) -> None:
+        self._sink.write(f"Received {signal.Signals(signum).name}, shutting down.", event="shutdown")
+        self.request_stop()
+
+    def _install_signal_handlers(self) -> dict[int, object]:
+        previous: dict[int, object] = {}
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                previous[signum] = signal.signal(signum, self._handle_signal)
+            except ValueError:
+                # signal.signal only works on the main thread (e.g. not under a test runner thread).
+                break
+        return previous
+
+    @staticmethod
+    def _restore_signal_handlers(previous: dict[int, object]) -> None:
+        for signum, handler in previous.items():
+            # None means the previous handler was not installed from Python.
+            if handler is not None:
+                signal.signal(signum, handler)
@@ -0,0 +1,38 @@
+from collections import deque
+from threading import Lock
+
+
+class LogCoalescer:
+    """Collects log lines from any thread until the UI drains them in one batch.
+
+    ``add()`` returns True only for the line that makes the buffer non-empty,
+    so the caller schedules one flush per batch instead of one per line.  If
+    the UI falls more than ``max_pending`` lines behind, the oldest pending
+    lines are dropped and replaced by a single "skipped" marker.
+    """
+
+    def __init__(self, *, max_pending: int = 2000) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1. Got: {max_pending!r}")
+
+        self._lock = Lock()
+        self._pending: deque[str] = deque(maxlen=max_pending)
+        self._skipped = 0
+
+    def add(self, line: str) -> bool:
+        with self._lock:
+            was_empty = not self._pending and not self._skipped
+            if len(self._pending) == self._pending.maxlen:
+                self._skipped += 1
+            self._pending.append(line)
+            return was_empty
+
+    def drain(self) -> list[str]:
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            skipped, self._skipped = self._skipped, 0
+
+        if skipped:
+            lines.insert(0, f"... ({skipped} earlier lines not shown; see the log file)")
+        return lines
@@ -1,29 +1,83 @@
-from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QMainWindow, QTextEdit
+from typing import TYPE_CHECKING
 
-from app.presentation.conversation_worker import ConversationWorker
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtWidgets import QMainWindow, QPlainTextEdit, QVBoxLayout, QWidget
+
+from app.presentation.status_panel import StatusPanel
+
+if TYPE_CHECKING:
+    # Importing the worker pulls in the whole application layer (numpy etc.),
+    # which would delay the first paint.
+    from app.presentation.conversation_worker import ConversationWorker
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, worker: ConversationWorker):
+    conversation_started = Signal()
+
+    # Older lines stay in the session log file; the view only keeps the tail.
+    MAX_LOG_LINES = 5000
+
+    def __init__(self, worker: "ConversationWorker | None" = None):
         super().__init__()
-        self.worker = worker
+        self.worker: "ConversationWorker | None" = None
+        self._search = None
 
         self.setWindowTitle("My English Buddy")
         self.resize(600, 400)
 
-        self.log_view = QTextEdit()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
-        self.setCentralWidget(self.log_view)
+        self.log_view.setMaximumBlockCount(self.MAX_LOG_LINES)
+        self.status_panel = StatusPanel()
+
+        central = QWidget()
+        layout = QVBoxLayout(central)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.status_panel)
+        layout.addWidget(self.log_view, 1)
+        self.setCentralWidget(central)
 
         self._setup_menu()
-        self.statusBar().showMessage("Ready")
 
-        self.worker.log.connect(self.append_log)
+        if worker is None:
+            # The container is still loading in the background.
+            self.calibrate_action.setEnabled(False)
+            self.statusBar().showMessage("Loading...")
+        else:
+            self.attach_worker(worker)
+
+    def attach_worker(self, worker: "ConversationWorker") -> None:
+        self.worker = worker
+
+        self.worker.log_batch.connect(self.append_logs)
         self.worker.calibration_started.connect(self.on_calibration_started)
         self.worker.calibration_finished.connect(self.on_calibration_finished)
         self.worker.calibration_failed.connect(self.on_calibration_failed)
 
+        self.status_panel.set_provider(worker.runner.status_snapshot)
+
+        self.calibrate_action.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+
+    def on_container_loaded(self, container) -> None:
+        # Runs on the UI thread (slot of a QObject), even though the container
+        # was built by ContainerLoader on a background thread.
+        from app.presentation.conversation_worker import ConversationWorker
+
+        if container.conversation_store is not None and hasattr(container.conversation_store, "search"):
+            self._search = container.conversation_store
+            self.search_action.setEnabled(True)
+
+        worker = ConversationWorker(container.conversation_runner)
+        self.attach_worker(worker)
+        worker.start()
+        self.conversation_started.emit()
+
+    def on_initialization_failed(self, message: str) -> None:
+        self.append_log(f"Failed to initialize application: {message}")
+        self.statusBar().showMessage("Initialization failed")
+
     def _setup_menu(self) -> None:
         tools_menu = self.menuBar().addMenu("Tools")
 
@@ -31,7 +85,24 @@ class MainWindow(QMainWindow):
         self.calibrate_action.triggered.connect(self.on_request_calibration)
         tools_menu.addAction(self.calibrate_action)
 
+        # Enabled once the history store is available.
+        self.search_action = QAction("Search history...", self)
+        self.search_action.setShortcut(QKeySequence.StandardKey.Find)
+        self.search_action.setEnabled(False)
+        self.search_action.triggered.connect(self.on_request_search)
+        tools_menu.addAction(self.search_action)
+
+    def on_request_search(self) -> None:
+        if self._search is None:
+            return
+        from app.presentation.search_dialog import SearchDialog
+
+        dialog = SearchDialog(self._search, self)
+        dialog.show()
+
     def on_request_calibration(self) -> None:
+        if self.worker is None:
+            return
         self.calibrate_action.setEnabled(False)
         self.statusBar().showMessage("Calibrating noise level...")
         self.worker.request_noise_calibration()
@@ -52,4 +123,15 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Noise calibration failed ({message})")
 
     def append_log(self, text: str):
-        self.log_view.append(text)
+        self.append_logs([text])
+
+    def append_logs(self, lines: list[str]) -> None:
+        scroll_bar = self.log_view.verticalScrollBar()
+        # Only follow new output if the user has not scrolled up to read.
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
+
+        # One insertion (and one layout pass) per batch instead of per line.
+        self.log_view.appendPlainText("\n".join(lines))
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
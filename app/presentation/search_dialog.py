@@ -0,0 +1,67 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from app.application.port.conversation_store import ConversationSearch, TurnSearchHit
+
+
+class SearchDialog(QDialog):
+    """Search box over the saved conversation history.
+
+    Queries hit the full-text index directly on the UI thread (they take a few
+    milliseconds); typing only re-runs the query once input pauses.
+    """
+
+    DEBOUNCE_MS = 150
+    MAX_RESULTS = 100
+
+    def __init__(self, search: ConversationSearch, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._search = search
+
+        self.setWindowTitle("Search history")
+        self.resize(600, 400)
+
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("Words you said or heard...")
+        self.results = QListWidget()
+        self.results.setWordWrap(True)
+        self.summary_label = QLabel("")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.query_edit)
+        layout.addWidget(self.results, 1)
+        layout.addWidget(self.summary_label)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self.run_search)
+        self.query_edit.textChanged.connect(self._timer.start)
+        self.query_edit.returnPressed.connect(self.run_search)
+
+    def run_search(self) -> None:
+        self._timer.stop()
+        query = self.query_edit.text().strip()
+        self.results.clear()
+        if not query:
+            self.summary_label.setText("")
+            return
+
+        hits = self._search.search(query, limit=self.MAX_RESULTS)
+        self.results.addItems([self._format(hit) for hit in hits])
+        self.summary_label.setText(f"{len(hits)} result(s)")
+
+    @staticmethod
+    def _format(hit: TurnSearchHit) -> str:
+        return (
+            f"{hit.created_at:%Y-%m-%d %H:%M}  {hit.snippet}\n"
+            f"  You: {hit.turn.user_utterance}\n"
+            f"  Buddy: {hit.turn.assistant_reply}"
+        )
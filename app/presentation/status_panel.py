@@ -0,0 +1,91 @@
+from collections.abc import Callable
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QVBoxLayout, QWidget
+
+from app.application.pipeline_status import PipelineStatus
+from app.presentation.status_view_model import StatusViewModel
+
+
+class LevelMeter(QProgressBar):
+    """Level bar with a vertical marker at the speech threshold."""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._threshold_percent: int | None = None
+
+    def set_threshold_percent(self, percent: int | None) -> None:
+        if percent != self._threshold_percent:
+            self._threshold_percent = percent
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self._threshold_percent is None:
+            return
+        x = min(max(round(self.width() * self._threshold_percent / 100), 0), self.width() - 1)
+        painter = QPainter(self)
+        painter.setPen(QPen(QColor("#d33"), 2))
+        painter.drawLine(x, 0, x, self.height())
+        painter.end()
+
+
+class StatusPanel(QWidget):
+    """Live mic level, pipeline stage and last-turn latencies.
+
+    Polls a snapshot provider at a fixed low rate instead of receiving
+    signals from the audio/worker threads, so they never wait on the UI.
+    """
+
+    REFRESH_INTERVAL_MS = 100
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._provider: Callable[[], PipelineStatus] | None = None
+        self._above_threshold: bool | None = None
+
+        self.level_bar = LevelMeter()
+        self.level_bar.setRange(0, 100)
+        self.level_bar.setTextVisible(False)
+        self.level_bar.setMaximumHeight(10)
+        self.level_label = QLabel("Mic -")
+        self.stage_label = QLabel("Loading...")
+        self.latency_label = QLabel("Last turn: -")
+
+        top = QHBoxLayout()
+        top.addWidget(self.stage_label)
+        top.addStretch(1)
+        top.addWidget(self.level_label)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 0)
+        layout.addLayout(top)
+        layout.addWidget(self.level_bar)
+        layout.addWidget(self.latency_label)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def set_provider(self, provider: Callable[[], PipelineStatus]) -> None:
+        self._provider = provider
+        self.refresh()
+        self._timer.start()
+
+    def refresh(self) -> None:
+        if self._provider is None:
+            return
+        view = StatusViewModel.from_status(self._provider())
+
+        self.level_bar.setValue(view.level_percent)
+        self.level_bar.set_threshold_percent(view.threshold_percent)
+        # Green while the input would count as speech, grey otherwise.  Restyling
+        # re-polishes the widget, so only do it when the state flips.
+        if view.above_threshold != self._above_threshold:
+            self._above_threshold = view.above_threshold
+            color = "#3a3" if view.above_threshold else "#888"
+            self.level_bar.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
+        self.level_label.setText(view.level_text)
+        self.stage_label.setText(view.stage_text)
+        self.latency_label.setText(view.latency_text)
@@ -0,0 +1,70 @@
+import math
+from dataclasses import dataclass
+
+from app.application.pipeline_status import PipelineStage, PipelineStatus
+
+# Meter range in dBFS; quieter input pins to the bottom of the bar.
+METER_FLOOR_DB = -80.0
+
+_LATENCY_LABELS = (
+    (PipelineStage.TRANSCRIBING, "STT"),
+    (PipelineStage.THINKING, "Chat"),
+    (PipelineStage.SYNTHESIZING, "TTS"),
+)
+
+
+def level_to_db(level: float) -> float:
+    if level <= 0:
+        return METER_FLOOR_DB
+    return max(METER_FLOOR_DB, 20 * math.log10(level))
+
+
+def db_to_percent(db: float) -> int:
+    return round(100 * (db - METER_FLOOR_DB) / -METER_FLOOR_DB)
+
+
+@dataclass(frozen=True)
+class StatusViewModel:
+    """Display-ready values for the status panel (kept Qt-free for testing)."""
+
+    level_percent: int
+    threshold_percent: int | None
+    above_threshold: bool
+    level_text: str
+    stage_text: str
+    latency_text: str
+
+    @staticmethod
+    def from_status(status: PipelineStatus) -> "StatusViewModel":
+        level_db = level_to_db(status.input_level)
+        if status.threshold is None:
+            threshold_percent = None
+            level_text = f"Mic {level_db:.0f} dBFS (not calibrated)"
+            above = False
+        else:
+            threshold_db = level_to_db(status.threshold)
+            threshold_percent = db_to_percent(threshold_db)
+            level_text = f"Mic {level_db:.0f} dBFS / threshold {threshold_db:.0f} dBFS"
+            above = status.input_level >= status.threshold
+
+        stage_text = str(status.stage).capitalize()
+        if not status.is_awake and status.stage == PipelineStage.LISTENING:
+            stage_text = "Listening for 'Buddy'"
+
+        parts = [
+            f"{label} {status.last_latencies_ms[stage]:.0f} ms"
+            for stage, label in _LATENCY_LABELS
+            if stage in status.last_latencies_ms
+        ]
+        if status.last_response_ms is not None:
+            parts.append(f"response {status.last_response_ms:.0f} ms")
+        latency_text = "Last turn: " + (" · ".join(parts) if parts else "-")
+
+        return StatusViewModel(
+            level_percent=db_to_percent(level_db),
+            threshold_percent=threshold_percent,
+            above_threshold=above,
+            level_text=level_text,
+            stage_text=stage_text,
+            latency_text=latency_text,
+        )
@@ -8,4 +8,20 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=".env",
         help="Path to .env file (default: .env). Use empty to disable.",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without the Qt window; logs go to stdout. Stop with Ctrl+C or SIGTERM.",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="Console log format in headless mode (default: text).",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print an import-time tree and per-component init times to stderr once started.",
+    )
     return parser.parse_args(argv)
@@ -0,0 +1,61 @@
+import json
+from datetime import datetime
+from enum import StrEnum
+from time import perf_counter
+
+from app.utils.session_log_writer import SessionLogWriter
+
+
+class EventType(StrEnum):
+    UTTERANCE_CAPTURED = "utterance_captured"
+    TRANSCRIBED = "transcribed"
+    REPLY_GENERATED = "reply_generated"
+    SYNTHESIZED = "synthesized"
+    PLAYBACK_STARTED = "playback_started"
+    PLAYBACK_ENDED = "playback_ended"
+    INTERRUPTED = "interrupted"
+    CALIBRATION_STARTED = "calibration_started"
+    CALIBRATION_ENDED = "calibration_ended"
+    CALIBRATION_FAILED = "calibration_failed"
+    ERROR = "error"
+
+
+def elapsed_ms(started: float) -> float:
+    """Milliseconds since ``started`` (a ``perf_counter()`` reading), rounded for logs."""
+    return round((perf_counter() - started) * 1000, 1)
+
+
+class EventLog:
+    """Structured per-turn events, one JSON object per line.
+
+    Complements ``Logger``: the text log is for people, this is for offline
+    latency/cost analysis.  Every record has ``ts`` and ``event``; the other
+    fields (``utterance_id``, ``request_id``, ``duration_ms``, ``bytes``,
+    ``chars``, ...) depend on the event.  ``utterance_id`` follows one capture
+    through STT, and ``reply_generated`` links it to the ``request_id`` used by
+    synthesis and playback.
+
+    Without a writer, events are dropped, so callers can emit unconditionally.
+    """
+
+    def __init__(self, *, writer: SessionLogWriter | None = None) -> None:
+        self._writer = writer
+
+    @property
+    def enabled(self) -> bool:
+        return self._writer is not None
+
+    def emit(self, event: EventType, **fields: object) -> None:
+        if self._writer is None:
+            return
+
+        record: dict[str, object] = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "event": str(event),
+        }
+        record.update((key, value) for key, value in fields.items() if value is not None)
+        self._writer.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -1,19 +1,29 @@
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
 
+from app.utils.session_log_writer import SessionLogWriter
+
 
 class Logger:
+    DEFAULT_TAIL_SIZE = 1000
+
     def __init__(
         self,
         *,
         log_dir: Path = Path("logs"),
         on_emit: Callable[[str], None] | None = None,
+        writer: SessionLogWriter | None = None,
+        tail_size: int = DEFAULT_TAIL_SIZE,
     ):
         self.log_dir = log_dir
         self._on_emit: Callable[[str], None] | None = None
+        # When set, every line is streamed to disk; otherwise save() writes the tail.
+        self._writer = writer
 
-        self._lines: list[str] = []
+        # Only a bounded tail is kept in memory (for UI replay).
+        self._lines: deque[str] = deque(maxlen=tail_size)
         self._started_at = datetime.now()
 
         # Set via property to keep replay behavior consistent.
@@ -30,7 +40,7 @@ class Logger:
         self._on_emit = callback
 
         if should_replay:
-            for line in self._lines:
+            for line in list(self._lines):
                 callback(line)
 
     def log(self, message: str) -> None:
@@ -38,11 +48,18 @@ class Logger:
             return
 
         self._lines.append(message)
+        if self._writer:
+            self._writer.write(message)
 
         if self._on_emit:
             self._on_emit(message)
 
     def save(self) -> None:
+        if self._writer:
+            # Lines are already on their way to disk; just drain and sync them.
+            self._writer.close()
+            return
+
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         filename = self._started_at.strftime("%Y-%m-%d_%H-%M-%S.txt")
@@ -0,0 +1,174 @@
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import monotonic
+from typing import IO
+
+
+class SessionLogWriter:
+    """Appends log lines to the session file from a background thread.
+
+    Lines are queued by ``write()`` and the writer thread drains them in
+    batches, so callers never block on disk I/O.  ``fsync`` runs at most once
+    per ``flush_interval`` (and on ``flush()``/``close()``), which bounds what
+    a crash can lose without paying an fsync per line.
+
+    A new file is started when the current one would exceed ``max_bytes`` or
+    is older than ``rotate_interval`` seconds (``0`` disables either limit).
+    Files are named after the session start time: ``2024-01-01_12-00-00.txt``,
+    then ``2024-01-01_12-00-00.1.txt``, ``.2.txt`` and so on.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path = Path("logs"),
+        *,
+        started_at: datetime | None = None,
+        flush_interval: float = 1.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        rotate_interval: float = 0.0,
+        suffix: str = ".txt",
+    ) -> None:
+        self.log_dir = log_dir
+        self.suffix = suffix
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.max_bytes = max(0, int(max_bytes))
+        self.rotate_interval = max(0.0, float(rotate_interval))
+
+        self._stem = (started_at or datetime.now()).strftime("%Y-%m-%d_%H-%M-%S")
+        self._part = 0
+        self._file: IO[bytes] | None = None
+        self._file_bytes = 0
+        self._file_opened_at = 0.0
+        self._last_sync_at = 0.0
+        self._dirty = False
+        self._failed = False
+
+        # Items are encoded lines, or an Event to set once everything before it is synced.
+        self._queue: Queue[bytes | Event | None] = Queue()
+        self._closed = False
+        self._thread = Thread(target=self._run, name="session-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def current_path(self) -> Path:
+        part = f".{self._part}" if self._part else ""
+        return self.log_dir / f"{self._stem}{part}{self.suffix}"
+
+    def write(self, line: str) -> None:
+        if self._closed:
+            return
+        self._queue.put((line + "\n").encode("utf-8"))
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until everything written so far is on disk.  Returns False on timeout."""
+        if self._closed:
+            return True
+        done = Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            timeout = self.flush_interval if self._dirty else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except Empty:
+                self._sync()
+                continue
+
+            batch: list[bytes] = []
+            waiters: list[Event] = []
+            stop = False
+            # Drain whatever is already queued so one write()/fsync covers many lines.
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            self._write_batch(batch)
+            if waiters or stop or monotonic() - self._last_sync_at >= self.flush_interval:
+                self._sync()
+            for waiter in waiters:
+                waiter.set()
+
+            if stop:
+                self._close_file()
+                return
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        if not batch or self._failed:
+            return
+        try:
+            for data in batch:
+                file = self._file_for(len(data))
+                file.write(data)
+                self._file_bytes += len(data)
+            self._dirty = True
+        except OSError as e:
+            # Keep the app running; the in-memory tail still has recent lines.
+            self._failed = True
+            print(f"Session log disabled ({self.current_path}): {e}", file=sys.stderr)
+
+    def _file_for(self, incoming: int) -> IO[bytes]:
+        """Return the file to append ``incoming`` bytes to, rotating first if needed."""
+        if self._file is not None:
+            # A single oversized line still goes into a fresh (empty) file.
+            too_big = (
+                self.max_bytes > 0
+                and self._file_bytes > 0
+                and self._file_bytes + incoming > self.max_bytes
+            )
+            too_old = (
+                self.rotate_interval > 0
+                and monotonic() - self._file_opened_at >= self.rotate_interval
+            )
+            if not (too_big or too_old):
+                return self._file
+            self._close_file()
+            self._part += 1
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.current_path, "ab")
+        self._file_bytes = self._file.tell()
+        self._file_opened_at = monotonic()
+        return self._file
+
+    def _sync(self) -> None:
+        self._last_sync_at = monotonic()
+        if self._file is None or not self._dirty or self._failed:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            self._failed = True
+            print(f"Session log disabled ({self.current_path}): {e}", file=sys.stderr)
+        self._dirty = False
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        self._sync()
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
@@ -0,0 +1,132 @@
+import builtins
+import importlib.util
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from time import perf_counter
+
+
+class _Node:
+    __slots__ = ("name", "kind", "started", "elapsed", "children")
+
+    def __init__(self, name: str, kind: str, started: float) -> None:
+        self.name = name
+        self.kind = kind
+        self.started = started
+        self.elapsed = 0.0
+        self.children: list[_Node] = []
+
+
+class StartupProfiler:
+    """Records a cold-start timeline: named phases plus the imports inside them.
+
+    ``install_import_hook()`` wraps ``builtins.__import__`` so every first-time
+    import is timed and nested under whatever phase or import triggered it.
+    Each thread gets its own tree, because the window and the container are
+    built on different threads.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = perf_counter) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._roots: dict[str, _Node] = {}
+        self._local = threading.local()
+        self._original_import: Callable[..., object] | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        node = self._open(name, "phase")
+        try:
+            yield
+        finally:
+            self._close(node)
+
+    def install_import_hook(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall_import_hook(self) -> None:
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def report(self, *, min_import_ms: float = 1.0) -> str:
+        total_ms = (self._clock() - self._started) * 1000
+        lines = [f"Startup profile ({total_ms:.1f} ms since start)"]
+        with self._lock:
+            roots = list(self._roots.items())
+
+        for thread_name, root in roots:
+            lines.append(f"[{thread_name}]")
+            for child in root.children:
+                self._format(child, depth=1, min_import_ms=min_import_ms, lines=lines)
+        return "\n".join(lines)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        # Fast path: already-loaded modules cost nothing worth reporting.
+        if level == 0 and not fromlist and name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        node = self._open(self._import_label(name, globals, level), "import")
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._close(node)
+
+    @staticmethod
+    def _import_label(name: str, globals: dict | None, level: int) -> str:
+        if level == 0 or not globals:
+            return name
+        # Show relative imports ("from ._models import x") by their absolute name.
+        try:
+            return importlib.util.resolve_name("." * level + name, globals.get("__package__") or "")
+        except (ImportError, ValueError):
+            return name
+
+    def _stack(self) -> list[_Node]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            thread_name = threading.current_thread().name
+            root = _Node(thread_name, "thread", self._clock())
+            with self._lock:
+                self._roots.setdefault(thread_name, root)
+                root = self._roots[thread_name]
+            stack = [root]
+            self._local.stack = stack
+        return stack
+
+    def _open(self, name: str, kind: str) -> _Node:
+        stack = self._stack()
+        node = _Node(name, kind, self._clock())
+        stack[-1].children.append(node)
+        stack.append(node)
+        return node
+
+    def _close(self, node: _Node) -> None:
+        node.elapsed = self._clock() - node.started
+        stack = self._stack()
+        if stack and stack[-1] is node:
+            stack.pop()
+
+    def _format(self, node: _Node, *, depth: int, min_import_ms: float, lines: list[str]) -> None:
+        elapsed_ms = node.elapsed * 1000
+        if node.kind == "import" and elapsed_ms < min_import_ms:
+            return
+
+        label = f"{'  ' * depth}{'import ' if node.kind == 'import' else ''}{node.name}"
+        lines.append(f"{label:<60} {elapsed_ms:9.1f} ms")
+        for child in node.children:
+            self._format(child, depth=depth + 1, min_import_ms=min_import_ms, lines=lines)
+
+
+def profile_phase(profiler: StartupProfiler | None, name: str) -> AbstractContextManager[None]:
+    """``profiler.phase(name)``, or a no-op when profiling is off."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
@@ -0,0 +1,31 @@
+"""Fixtures for the audio hot-path benchmarks.
+
+Run with pytest-benchmark (not a project dependency); each module is skipped
+without it.  Runs are compared against the newest baseline in .benchmarks/::
+
+    uv run --with pytest-benchmark pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:15%
+    uv run --with pytest-benchmark pytest benchmarks --benchmark-save=baseline
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.signals import MIC_RATE, TTS_RATE, speech_like
+
+
+@pytest.fixture(scope="session")
+def mic_chunk() -> np.ndarray:
+    """One 0.1 s capture chunk, shaped like sounddevice's (frames, channels)."""
+    return speech_like(0.1, MIC_RATE).reshape(-1, 1)
+
+
+@pytest.fixture(scope="session")
+def utterance() -> np.ndarray:
+    """A 5 s utterance at the microphone rate."""
+    return speech_like(5.0, MIC_RATE)
+
+
+@pytest.fixture(scope="session")
+def reply_audio() -> np.ndarray:
+    """An 8 s spoken reply at the TTS rate."""
+    return speech_like(8.0, TTS_RATE, seed=1)
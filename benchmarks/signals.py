@@ -0,0 +1,20 @@
+"""Synthetic signals shared by the audio benchmarks."""
+
+import numpy as np
+
+MIC_RATE = 16_000
+TTS_RATE = 24_000
+# Listener.chunk_duration: 0.1 s per read.
+CHUNK_FRAMES = MIC_RATE // 10
+
+
+def speech_like(seconds: float, sample_rate: int, *, seed: int = 0) -> np.ndarray:
+    """Voiced harmonics with a syllable-rate envelope plus a little noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    pitch = 140 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) ** 2
+    signal = 0.2 * envelope * voiced + 0.005 * rng.standard_normal(t.size)
+    return signal.astype(np.float32)
@@ -0,0 +1,29 @@
+"""Denoiser cost per second of audio.
+
+Its effect on STT accuracy is checked in tests/infrastructure/audio/test_denoiser.py.
+"""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.audio.denoiser import StreamingDenoiser
+from benchmarks.signals import CHUNK_FRAMES, MIC_RATE, speech_like
+
+pytest.importorskip("pytest_benchmark")
+
+
+def denoise(denoiser: StreamingDenoiser, audio: np.ndarray) -> np.ndarray:
+    parts = [denoiser.process(audio[i : i + CHUNK_FRAMES]) for i in range(0, len(audio), CHUNK_FRAMES)]
+    return np.concatenate([*parts, denoiser.flush()])
+
+
+def test_denoise_one_second(benchmark):
+    rng = np.random.default_rng(0)
+    denoiser = StreamingDenoiser()
+    for _ in range(10):
+        denoiser.learn_noise((0.02 * rng.standard_normal(CHUNK_FRAMES)).astype(np.float32))
+    noisy = speech_like(1.0, MIC_RATE) + (0.02 * rng.standard_normal(MIC_RATE)).astype(np.float32)
+
+    # The mean is the CPU cost per second of captured speech.
+    out = benchmark(denoise, denoiser, noisy)
+    assert out.shape == noisy.shape
@@ -0,0 +1,42 @@
+"""Listener hot paths: per-chunk level, VAD gate and utterance hand-off."""
+
+from queue import Queue
+
+import numpy as np
+import pytest
+
+from benchmarks.signals import CHUNK_FRAMES, MIC_RATE
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):  # Not installed, or the PortAudio library is missing.
+    pytest.skip("sounddevice is not available", allow_module_level=True)
+
+from app.application.audio_buffer import AudioBuffer  # noqa: E402
+from app.infrastructure.audio.listener import Listener  # noqa: E402
+
+
+def test_chunk_level(benchmark, mic_chunk):
+    level = benchmark(Listener._chunk_level, mic_chunk)
+    assert level > 0
+
+
+def test_is_voice_like_frames(benchmark, utterance):
+    pytest.importorskip("webrtcvad")
+    listener = Listener(sample_rate=MIC_RATE)
+    frames = [utterance[i : i + CHUNK_FRAMES] for i in range(0, len(utterance), CHUNK_FRAMES)]
+
+    benchmark(listener._is_voice_like_frames, frames)
+
+
+def test_put_drop_oldest_on_full_queue(benchmark):
+    queue: Queue[AudioBuffer] = Queue(maxsize=2)
+    buffer = AudioBuffer(np.zeros(CHUNK_FRAMES, dtype=np.float32), sample_rate=MIC_RATE)
+    for _ in range(2):
+        queue.put_nowait(buffer)
+
+    # Every call has to evict the oldest item first.
+    benchmark(Listener._put_drop_oldest, queue, buffer)
+    assert queue.qsize() == 2
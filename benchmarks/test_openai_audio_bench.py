@@ -0,0 +1,32 @@
+"""Sample conversion in the OpenAI STT upload and TTS download paths."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.infrastructure.openai.speech_to_text import SpeechToText
+from app.infrastructure.openai.text_to_speech import TextToSpeech
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_stt_float_to_int16(benchmark, utterance):
+    pcm = benchmark(SpeechToText._to_pcm16, utterance)
+    assert pcm.dtype == np.int16
+
+
+def test_stt_wav_encoding(benchmark, utterance):
+    pcm = SpeechToText._to_pcm16(utterance)
+    wav = benchmark(SpeechToText._to_wav, pcm, sample_rate=16_000)
+    assert wav.getbuffer().nbytes > pcm.nbytes
+
+
+def test_tts_pcm_decoding(benchmark, reply_audio):
+    pcm_bytes = (reply_audio * 32767).astype("<i2").tobytes()
+    client = MagicMock()
+    client.audio.speech.create.return_value.read.return_value = pcm_bytes
+    tts = TextToSpeech(client=client)
+
+    buffer = benchmark(tts.synthesize, "Hello")
+    assert buffer.frames == reply_audio.size
@@ -0,0 +1,32 @@
+"""Resampling cost per second of audio at common device rates."""
+
+import pytest
+
+from app.infrastructure.audio.resampler import StreamingResampler
+from benchmarks.signals import MIC_RATE, TTS_RATE, speech_like
+
+pytest.importorskip("pytest_benchmark")
+
+
+def resample(resampler: StreamingResampler, audio, chunk: int):
+    parts = [resampler.process(audio[i : i + chunk]) for i in range(0, len(audio), chunk)]
+    parts.append(resampler.flush())
+    return parts
+
+
+@pytest.mark.parametrize("device_rate", [44_100, 48_000])
+def test_microphone_to_stt_rate(benchmark, device_rate):
+    audio = speech_like(1.0, device_rate)
+    resampler = StreamingResampler(device_rate, MIC_RATE)
+
+    parts = benchmark(resample, resampler, audio, device_rate // 10)
+    assert sum(len(part) for part in parts) == MIC_RATE
+
+
+@pytest.mark.parametrize("device_rate", [44_100, 48_000])
+def test_tts_to_speaker_rate(benchmark, device_rate):
+    audio = speech_like(1.0, TTS_RATE)
+    resampler = StreamingResampler(TTS_RATE, device_rate)
+
+    parts = benchmark(resample, resampler, audio, 1024)
+    assert sum(len(part) for part in parts) == device_rate
@@ -0,0 +1,41 @@
+"""Speaker.speak chunking overhead, measured against a no-op output stream."""
+
+import pytest
+
+from benchmarks.signals import TTS_RATE
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):  # Not installed, or the PortAudio library is missing.
+    pytest.skip("sounddevice is not available", allow_module_level=True)
+
+from app.application.audio_buffer import AudioBuffer  # noqa: E402
+from app.infrastructure.audio import speaker as speaker_module  # noqa: E402
+
+
+class NullOutputStream:
+    """Accepts writes instantly, so only the Python-side chunk loop is timed."""
+
+    def __init__(self, **kwargs) -> None:
+        self.frames = 0
+
+    def __enter__(self) -> "NullOutputStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def write(self, chunk) -> None:
+        self.frames += len(chunk)
+
+
+def test_speak_chunking(benchmark, monkeypatch, reply_audio):
+    monkeypatch.setattr(speaker_module.sd, "OutputStream", NullOutputStream)
+    # speak() waits 100 ms for the device to settle; that is not what we measure.
+    monkeypatch.setattr(speaker_module.time, "sleep", lambda _: None)
+    speaker = speaker_module.Speaker(sample_rate=TTS_RATE)
+    audio = AudioBuffer(reply_audio, sample_rate=TTS_RATE)
+
+    assert benchmark(speaker.speak, audio) is True
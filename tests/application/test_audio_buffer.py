@@ -0,0 +1,131 @@
+"""Unit tests for AudioBuffer and AudioSlabPool."""
+
+import numpy as np
+import pytest
+
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool, as_audio_buffer
+
+
+class TestAudioBuffer:
+    def test_metadata(self):
+        buffer = AudioBuffer(np.zeros(8000, dtype=np.float32), sample_rate=16_000)
+        assert buffer.sample_rate == 16_000
+        assert buffer.dtype == np.float32
+        assert buffer.channels == 1
+        assert buffer.frames == 8000
+        assert len(buffer) == 8000
+        assert buffer.duration == pytest.approx(0.5)
+        assert buffer.nbytes == 8000 * 4
+
+    def test_samples_are_read_only_view(self):
+        source = np.zeros(4, dtype=np.float32)
+        buffer = AudioBuffer(source, sample_rate=16_000)
+
+        assert np.shares_memory(buffer.samples, source)
+        with pytest.raises(ValueError):
+            buffer.samples[0] = 1.0
+        # The caller's array stays writable.
+        source[0] = 1.0
+
+    def test_rejects_non_positive_sample_rate(self):
+        with pytest.raises(ValueError):
+            AudioBuffer(np.zeros(1, dtype=np.float32), sample_rate=0)
+
+    def test_release_without_pool_is_noop(self):
+        buffer = AudioBuffer(np.zeros(1, dtype=np.float32), sample_rate=16_000)
+        buffer.release()
+        buffer.release()
+
+    def test_as_audio_buffer_wraps_ndarray_without_copy(self):
+        source = np.ones(10, dtype=np.float32)
+        buffer = as_audio_buffer(source, sample_rate=24_000)
+        assert buffer.sample_rate == 24_000
+        assert np.shares_memory(buffer.samples, source)
+        assert as_audio_buffer(buffer, sample_rate=16_000) is buffer
+
+
+class TestAudioSlabPool:
+    def test_writer_publishes_appended_chunks(self):
+        pool = AudioSlabPool(capacity_frames=10)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.array([[0.1], [0.2]], dtype=np.float32))
+        writer.append(np.array([[0.3]], dtype=np.float32))
+
+        buffer = writer.publish()
+
+        np.testing.assert_array_almost_equal(buffer.samples, [0.1, 0.2, 0.3])
+        assert buffer.sample_rate == 16_000
+
+    def test_slab_is_reused_after_release(self):
+        pool = AudioSlabPool(capacity_frames=10)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.ones(3, dtype=np.float32))
+        first = writer.publish()
+        first_base = first.samples.base
+        assert pool.free_slabs == 0
+
+        first.release()
+        assert pool.free_slabs == 1
+
+        second_writer = pool.writer(sample_rate=16_000)
+        second_writer.append(np.zeros(2, dtype=np.float32))
+        second = second_writer.publish()
+        assert np.shares_memory(second.samples, first_base)
+
+    def test_slab_returns_only_after_last_reference(self):
+        pool = AudioSlabPool(capacity_frames=10)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.ones(3, dtype=np.float32))
+        buffer = writer.publish()
+        extra = buffer.retain()
+
+        buffer.release()
+        buffer.release()  # Idempotent per handle.
+        assert pool.free_slabs == 0
+
+        extra.release()
+        assert pool.free_slabs == 1
+
+    def test_retain_after_release_raises(self):
+        buffer = AudioBuffer(np.zeros(1, dtype=np.float32), sample_rate=16_000)
+        buffer.release()
+        with pytest.raises(RuntimeError):
+            buffer.retain()
+
+    def test_writer_grows_beyond_slab_and_returns_slab(self):
+        pool = AudioSlabPool(capacity_frames=4)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.arange(3, dtype=np.float32))
+        writer.append(np.arange(3, 6, dtype=np.float32))
+
+        # The pooled slab was handed back as soon as the writer outgrew it.
+        assert pool.free_slabs == 1
+
+        buffer = writer.publish()
+        np.testing.assert_array_equal(buffer.samples, np.arange(6, dtype=np.float32))
+        buffer.release()
+        assert pool.free_slabs == 1
+
+    def test_discard_returns_slab(self):
+        pool = AudioSlabPool(capacity_frames=4)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.ones(2, dtype=np.float32))
+        writer.discard()
+        assert pool.free_slabs == 1
+        with pytest.raises(RuntimeError):
+            writer.publish()
+
+    def test_multichannel_slab(self):
+        pool = AudioSlabPool(capacity_frames=4, channels=2)
+        writer = pool.writer(sample_rate=48_000)
+        writer.append(np.ones((2, 2), dtype=np.float32))
+        buffer = writer.publish()
+        assert buffer.channels == 2
+        assert buffer.frames == 2
+
+    def test_free_slabs_are_capped(self):
+        pool = AudioSlabPool(capacity_frames=2, max_free_slabs=1)
+        writers = [pool.writer(sample_rate=16_000) for _ in range(3)]
+        for writer in writers:
+            writer.discard()
+        assert pool.free_slabs == 1
@@ -0,0 +1,94 @@
+"""Unit tests for BatchingSpeechToText."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.batching_speech_to_text import BatchingSpeechToText
+from app.application.errors import SpeechToTextError
+
+
+def make_audio(value: float) -> AudioBuffer:
+    return AudioBuffer(np.full(160, value, dtype=np.float32), sample_rate=16_000)
+
+
+class FakeBatchStt:
+    def __init__(self, *, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.single_calls = 0
+        self.batch_sizes: list[int] = []
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        self.single_calls += 1
+        if self.error:
+            raise self.error
+        return f"text-{audio.samples[0]:.1f}"
+
+    def transcribe_batch(self, audios) -> list[str]:
+        self.batch_sizes.append(len(audios))
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [f"text-{audio.samples[0]:.1f}" for audio in audios]
+
+
+def transcribe_concurrently(stt: BatchingSpeechToText, values: list[float]) -> dict[float, object]:
+    results: dict[float, object] = {}
+
+    def worker(value: float) -> None:
+        try:
+            results[value] = stt.transcribe(make_audio(value))
+        except Exception as e:
+            results[value] = e
+
+    threads = [threading.Thread(target=worker, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestBatchingSpeechToText:
+    def test_single_utterance_uses_regular_path(self):
+        inner = FakeBatchStt()
+        stt = BatchingSpeechToText(stt=inner, window=0.0)
+
+        assert stt.transcribe(make_audio(0.1)) == "text-0.1"
+        assert inner.single_calls == 1
+        assert inner.batch_sizes == []
+
+    def test_concurrent_utterances_are_batched_with_per_utterance_results(self):
+        inner = FakeBatchStt()
+        stt = BatchingSpeechToText(stt=inner, window=1.0, max_batch_size=3)
+
+        results = transcribe_concurrently(stt, [0.1, 0.2, 0.3])
+
+        assert results == {0.1: "text-0.1", 0.2: "text-0.2", 0.3: "text-0.3"}
+        assert inner.batch_sizes == [3]
+
+    def test_batch_size_is_capped(self):
+        inner = FakeBatchStt(delay=0.05)
+        stt = BatchingSpeechToText(stt=inner, window=0.2, max_batch_size=2)
+
+        results = transcribe_concurrently(stt, [0.1, 0.2, 0.3, 0.4])
+
+        assert len(results) == 4
+        assert all(isinstance(text, str) for text in results.values())
+        assert max(inner.batch_sizes, default=1) <= 2
+
+    def test_errors_are_delivered_to_every_caller(self):
+        inner = FakeBatchStt(error=SpeechToTextError("boom"))
+        stt = BatchingSpeechToText(stt=inner, window=1.0, max_batch_size=2)
+
+        results = transcribe_concurrently(stt, [0.1, 0.2])
+
+        assert all(isinstance(error, SpeechToTextError) for error in results.values())
+
+    def test_rejects_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            BatchingSpeechToText(stt=FakeBatchStt(), max_batch_size=0)
@@ -0,0 +1,198 @@
+"""Unit tests for ConversationRunner's per-utterance processing."""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool
+from app.application.conversation_runner import ConversationRunner
+from app.application.pipeline_status import PipelineStage
+from app.utils.event_log import EventType
+from app.utils.logger import Logger
+
+
+def make_runner(*, transcript: str = "buddy hello", reply: str = "Hi!"):
+    stt = MagicMock()
+    stt.transcribe.return_value = transcript
+    conversation_service = MagicMock()
+    conversation_service.prepare_reply.return_value = reply
+    event_log = MagicMock()
+
+    runner = ConversationRunner(
+        listener=MagicMock(),
+        stt=stt,
+        conversation_service=conversation_service,
+        tts=MagicMock(),
+        speaker=MagicMock(),
+        logger=Logger(),
+        event_log=event_log,
+    )
+    # _process_utterance releases the slot it was given by run().
+    runner._inflight_semaphore.acquire()
+    return runner, event_log
+
+
+def one_second() -> AudioBuffer:
+    return AudioBuffer(np.zeros(16_000, dtype=np.float32), sample_rate=16_000)
+
+
+def emitted(event_log: MagicMock) -> list[tuple[EventType, dict]]:
+    return [(c.args[0], c.kwargs) for c in event_log.emit.call_args_list]
+
+
+class TestProcessUtteranceEvents:
+    def test_turn_emits_transcribed_and_reply_generated(self):
+        runner, event_log = make_runner()
+
+        runner._process_utterance(one_second(), 7)
+
+        events = emitted(event_log)
+        assert [event for event, _ in events] == [
+            EventType.TRANSCRIBED,
+            EventType.REPLY_GENERATED,
+        ]
+        transcribed = events[0][1]
+        assert transcribed["utterance_id"] == 7
+        assert transcribed["audio_seconds"] == 1.0
+        assert transcribed["chars"] == len("buddy hello")
+        assert transcribed["duration_ms"] >= 0
+
+        reply = events[1][1]
+        assert reply["utterance_id"] == 7
+        assert reply["request_id"] == runner.reply_queue.latest_request_id
+        assert reply["chars"] == len("Hi!")
+
+    def test_ignored_while_asleep_still_records_transcription(self):
+        runner, event_log = make_runner(transcript="just talking")
+
+        runner._process_utterance(one_second(), 1)
+
+        assert [event for event, _ in emitted(event_log)] == [EventType.TRANSCRIBED]
+
+    def test_stt_error_emits_error_event(self):
+        runner, event_log = make_runner()
+        runner.stt.transcribe.side_effect = RuntimeError("boom")
+
+        runner._process_utterance(one_second(), 2)
+
+        event, fields = emitted(event_log)[-1]
+        assert event == EventType.ERROR
+        assert fields["utterance_id"] == 2
+        assert fields["error"] == "boom"
+
+    def test_calibration_events_carry_duration(self):
+        runner, event_log = make_runner()
+
+        runner._on_calibration_start()
+        runner._on_calibration_end(0.01)
+
+        events = emitted(event_log)
+        assert events[0][0] == EventType.CALIBRATION_STARTED
+        assert events[1][0] == EventType.CALIBRATION_ENDED
+        assert events[1][1]["threshold"] == 0.01
+        assert events[1][1]["duration_ms"] >= 0
+
+
+class TestStatusSnapshot:
+    def test_snapshot_combines_listener_level_and_turn_latencies(self):
+        runner, _ = make_runner()
+        runner.listener.get_input_level.return_value = 0.2
+        runner.listener.get_last_threshold.return_value = 0.05
+
+        runner._process_utterance(one_second(), 1)
+        status = runner.status_snapshot()
+
+        assert status.is_awake is True
+        assert status.input_level == 0.2
+        assert status.threshold == 0.05
+        assert PipelineStage.TRANSCRIBING in status.last_latencies_ms
+        assert PipelineStage.THINKING in status.last_latencies_ms
+
+
+class TestSleepScheduling:
+    def test_wake_schedules_sleep_once_the_worker_finishes(self):
+        runner, _ = make_runner()
+        deadlines_during_turn = []
+        runner.stt.transcribe.side_effect = lambda _audio: (
+            deadlines_during_turn.append(runner._sleep_watchdog.deadline) or "buddy hello"
+        )
+
+        runner._process_utterance(one_second(), 1)
+
+        # Nothing is armed while a worker is running.
+        assert deadlines_during_turn == [None]
+        assert runner._sleep_watchdog.deadline == (
+            runner._last_activity_at + ConversationRunner.SLEEP_TIMEOUT_SECONDS
+        )
+
+    def test_asleep_runner_has_no_deadline(self):
+        runner, _ = make_runner(transcript="just talking")
+
+        runner._process_utterance(one_second(), 1)
+
+        assert runner._sleep_watchdog.deadline is None
+
+    def test_sleep_transition_clears_deadline(self):
+        runner, _ = make_runner()
+        runner._process_utterance(one_second(), 1)
+        runner._last_activity_at -= ConversationRunner.SLEEP_TIMEOUT_SECONDS
+
+        assert runner._try_go_to_sleep() is True
+        assert runner.is_awake is False
+        assert runner._sleep_watchdog.deadline is None
+
+    def test_reply_completion_pushes_deadline_back(self):
+        runner, _ = make_runner()
+        runner._process_utterance(one_second(), 1)
+        first = runner._sleep_watchdog.deadline
+
+        runner._on_reply_completed("Hi!")
+
+        assert runner._sleep_watchdog.deadline >= first
+
+
+class TestLowPowerHint:
+    def test_listener_follows_sleep_state(self):
+        runner, _ = make_runner()
+
+        runner._start_listener_thread()
+        runner.listener.set_low_power.assert_called_with(True)
+
+        runner._process_utterance(one_second(), 1)
+        runner.listener.set_low_power.assert_called_with(False)
+
+        runner._last_activity_at -= ConversationRunner.SLEEP_TIMEOUT_SECONDS
+        assert runner._try_go_to_sleep() is True
+        runner.listener.set_low_power.assert_called_with(True)
+
+
+class TestStop:
+    def test_run_returns_and_background_threads_end(self):
+        runner, _ = make_runner()
+        run_thread = threading.Thread(target=runner.run, daemon=True)
+        run_thread.start()
+        for _ in range(100):
+            if runner._sleep_watchdog_thread is not None:
+                break
+            threading.Event().wait(0.01)
+
+        runner.stop()
+        run_thread.join(2.0)
+
+        assert not run_thread.is_alive()
+        assert not runner._speaker_loop._thread.is_alive()
+        assert not runner._sleep_watchdog_thread.is_alive()
+
+    def test_queued_utterances_are_released(self):
+        runner, _ = make_runner()
+        pool = AudioSlabPool(capacity_frames=16_000)
+        for _ in range(ConversationRunner._UTTERANCE_QUEUE_SIZE):
+            writer = pool.writer(sample_rate=16_000)
+            writer.append(np.zeros(160, dtype=np.float32))
+            runner.utterance_queue.put(writer.publish())
+
+        runner.stop()
+
+        assert pool.free_slabs == ConversationRunner._UTTERANCE_QUEUE_SIZE
+        assert runner.utterance_queue.get_nowait() is ConversationRunner._STOP_SENTINEL
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 from app.application.conversation_service import ConversationService
 from app.application.port.chat_client import ChatClient
 from app.domain.entity.conversation import Conversation
+from app.domain.vo.turn import Turn
 
 
 class TestConversationService(unittest.TestCase):
@@ -198,5 +199,80 @@ class TestConversationService(unittest.TestCase):
         self.assertEqual(self.service.conversation.turn_count, 0)
 
 
+    def test_commit_assistant_reply_appends_turn_to_store(self):
+        """Test that committed turns are handed to the store."""
+        store = MagicMock()
+        service = ConversationService(chat_client=self.mock_chat_client, store=store)
+        self.mock_chat_client.complete_messages.return_value = "Hi!"
+
+        service.prepare_reply("Hello")
+        service.commit_assistant_reply("Hi!")
+
+        store.append_turn.assert_called_once_with(Turn(user_utterance="Hello", assistant_reply="Hi!"))
+
+    def test_uncommitted_reply_is_not_stored(self):
+        """Test that nothing is stored without a pending turn."""
+        store = MagicMock()
+        service = ConversationService(chat_client=self.mock_chat_client, store=store)
+
+        service.commit_assistant_reply("Hi!")
+
+        store.append_turn.assert_not_called()
+
+    def test_resume_history_restores_turns_in_background(self):
+        """Test that stored turns are loaded off-thread and used as context."""
+        store = MagicMock()
+        store.load_recent.return_value = [Turn(user_utterance="Yesterday", assistant_reply="Nice")]
+        service = ConversationService(chat_client=self.mock_chat_client, store=store)
+
+        thread = service.resume_history(5)
+        thread.join(2.0)
+
+        store.load_recent.assert_called_once_with(5)
+        self.assertEqual(service.conversation.turn_count, 1)
+
+    def test_recalled_turns_are_sent_as_system_message(self):
+        """Test that long-term memories are injected after the system prompt."""
+        memory = MagicMock()
+        memory.recall.return_value = [Turn(user_utterance="I love hiking", assistant_reply="Great!")]
+        service = ConversationService(chat_client=self.mock_chat_client, memory=memory)
+        self.mock_chat_client.complete_messages.return_value = "Sure"
+
+        service.prepare_reply("Any weekend ideas?")
+
+        memory.recall.assert_called_once_with("Any weekend ideas?")
+        messages = self.mock_chat_client.complete_messages.call_args.kwargs["messages"]
+        self.assertEqual([m.role for m in messages], ["system", "system", "user"])
+        self.assertIn("I love hiking", messages[1].content)
+
+    def test_recalled_turns_already_in_context_are_skipped(self):
+        """Test that memories duplicating the recent context are dropped."""
+        memory = MagicMock()
+        memory.recall.return_value = [Turn(user_utterance="Hello", assistant_reply="Hi!")]
+        service = ConversationService(chat_client=self.mock_chat_client, memory=memory)
+        service.conversation.add_turn("Hello", "Hi!")
+        self.mock_chat_client.complete_messages.return_value = "Sure"
+
+        service.prepare_reply("Again")
+
+        messages = self.mock_chat_client.complete_messages.call_args.kwargs["messages"]
+        self.assertEqual([m.role for m in messages], ["system", "user", "assistant", "user"])
+
+    def test_committed_turn_is_remembered(self):
+        """Test that committed turns are handed to long-term memory."""
+        memory = MagicMock()
+        memory.recall.return_value = []
+        service = ConversationService(chat_client=self.mock_chat_client, memory=memory)
+        self.mock_chat_client.complete_messages.return_value = "Hi!"
+
+        service.reply("Hello")
+
+        memory.remember.assert_called_once_with(Turn(user_utterance="Hello", assistant_reply="Hi!"))
+
+    def test_resume_history_without_store_is_noop(self):
+        """Test that resuming does nothing when persistence is off."""
+        self.assertIsNone(self.service.resume_history(5))
+
+
 if __name__ == "__main__":
     unittest.main()
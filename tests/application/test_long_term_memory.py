@@ -0,0 +1,104 @@
+"""Unit tests for LongTermMemory."""
+
+import threading
+
+import numpy as np
+
+from app.application.errors import EmbeddingError
+from app.application.long_term_memory import LongTermMemory, format_memory_prompt
+from app.domain.vo.turn import Turn
+from app.infrastructure.local.vector_index import MemmapVectorIndex
+
+
+class KeywordEmbedder:
+    """Embeds text as keyword counts, so similarity is easy to reason about."""
+
+    KEYWORDS = ("hiking", "coffee", "travel")
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.block = threading.Event()
+        self.block.set()
+
+    def embed(self, texts):
+        self.block.wait(5)
+        self.calls.append(list(texts))
+        return np.array(
+            [[text.lower().count(word) for word in self.KEYWORDS] for text in texts],
+            dtype=np.float32,
+        ) + 0.01
+
+
+class FailingEmbedder:
+    def embed(self, texts):
+        raise EmbeddingError("offline")
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def log(self, message: str) -> None:
+        self.lines.append(message)
+
+
+def make_memory(tmp_path, embedder, **kwargs) -> LongTermMemory:
+    return LongTermMemory(embedder=embedder, index=MemmapVectorIndex(tmp_path), **kwargs)
+
+
+class TestLongTermMemory:
+    def test_recalls_relevant_turns(self, tmp_path):
+        memory = make_memory(tmp_path, KeywordEmbedder(), top_k=1)
+        memory.remember(Turn(user_utterance="I went hiking", assistant_reply="Fun!"))
+        memory.remember(Turn(user_utterance="I drink coffee", assistant_reply="Nice."))
+        assert memory.flush() is True
+
+        assert memory.recall("More hiking tips?") == [
+            Turn(user_utterance="I went hiking", assistant_reply="Fun!")
+        ]
+        memory.close()
+
+    def test_burst_is_embedded_in_one_request(self, tmp_path):
+        embedder = KeywordEmbedder()
+        embedder.block.clear()
+        memory = make_memory(tmp_path, embedder)
+        memory.remember(Turn(user_utterance="first", assistant_reply="a"))
+        # The indexer is now blocked on the first turn; the rest queue up.
+        memory.remember(Turn(user_utterance="second", assistant_reply="b"))
+        memory.remember(Turn(user_utterance="third", assistant_reply="c"))
+        embedder.block.set()
+        memory.flush()
+
+        assert sum(len(call) for call in embedder.calls) == 3
+        assert len(embedder.calls) <= 2
+        memory.close()
+
+    def test_recall_gives_up_after_budget(self, tmp_path):
+        embedder = KeywordEmbedder()
+        logger = RecordingLogger()
+        memory = make_memory(tmp_path, embedder, latency_budget=0.05, logger=logger)
+        embedder.block.clear()
+
+        assert memory.recall("hiking") == []
+        assert any("budget" in line for line in logger.lines)
+        embedder.block.set()
+        memory.close()
+
+    def test_embedding_failures_are_logged_not_raised(self, tmp_path):
+        logger = RecordingLogger()
+        memory = make_memory(tmp_path, FailingEmbedder(), logger=logger)
+        memory.remember(Turn(user_utterance="hello", assistant_reply="hi"))
+        memory.flush()
+
+        assert memory.recall("hello") == []
+        assert len(logger.lines) == 2
+        memory.close()
+
+
+class TestFormatMemoryPrompt:
+    def test_no_turns_gives_no_prompt(self):
+        assert format_memory_prompt([]) is None
+
+    def test_lists_each_turn(self):
+        prompt = format_memory_prompt([Turn(user_utterance="I like tea", assistant_reply="Me too")])
+        assert "I like tea" in prompt and "Me too" in prompt
@@ -0,0 +1,95 @@
+"""Unit tests for ModelResidencyManager."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.model_residency import ModelResidencyManager
+from app.application.port.resident_model import ModelResidency
+
+
+class FakeModel:
+    def __init__(self, *, fail: bool = False):
+        self.residency = ModelResidency.FULL
+        self.history: list[ModelResidency] = []
+        self.fail = fail
+        self.changed = threading.Event()
+
+    def set_residency(self, residency: ModelResidency) -> None:
+        if self.fail:
+            raise RuntimeError("load failed")
+        self.residency = residency
+        self.history.append(residency)
+        self.changed.set()
+
+
+def wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def make_manager(models, sleep_residency, release_after=0.0):
+    return ModelResidencyManager(
+        models=models,
+        sleep_residency=sleep_residency,
+        release_after=release_after,
+        logger=MagicMock(),
+    )
+
+
+class TestModelResidencyManager:
+    def test_sleep_reduces_models_after_timeout(self):
+        stt, tts = FakeModel(), FakeModel()
+        manager = make_manager(
+            {"stt": stt, "tts": tts},
+            {"stt": ModelResidency.REDUCED, "tts": ModelResidency.RELEASED},
+        )
+
+        manager.on_sleep()
+
+        assert wait_until(lambda: tts.residency == ModelResidency.RELEASED)
+        assert stt.residency == ModelResidency.REDUCED
+
+    def test_wake_before_timeout_cancels_release(self):
+        model = FakeModel()
+        manager = make_manager({"m": model}, {"m": ModelResidency.RELEASED}, release_after=0.2)
+
+        manager.on_sleep()
+        manager.on_wake()
+        time.sleep(0.3)
+
+        assert model.history == []
+
+    def test_wake_restores_models_in_background(self):
+        model = FakeModel()
+        manager = make_manager({"m": model}, {"m": ModelResidency.RELEASED})
+        manager.on_sleep()
+        assert wait_until(lambda: model.residency == ModelResidency.RELEASED)
+
+        manager.on_wake()
+
+        assert wait_until(lambda: model.residency == ModelResidency.FULL)
+
+    def test_failures_are_logged_not_raised(self):
+        logger = MagicMock()
+        manager = ModelResidencyManager(
+            models={"m": FakeModel(fail=True)},
+            sleep_residency={"m": ModelResidency.RELEASED},
+            release_after=0.0,
+            logger=logger,
+        )
+
+        manager.on_sleep()
+
+        assert wait_until(lambda: logger.log.called)
+        assert "Failed" in logger.log.call_args.args[0]
+
+    def test_unknown_sleep_residency_model_raises(self):
+        with pytest.raises(ValueError):
+            make_manager({}, {"missing": ModelResidency.RELEASED})
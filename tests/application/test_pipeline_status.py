@@ -0,0 +1,58 @@
+"""Unit tests for PipelineStatusTracker."""
+
+from time import perf_counter
+
+from app.application.pipeline_status import PipelineStage, PipelineStatusTracker
+
+
+class TestPipelineStatusTracker:
+    def test_idle_is_listening(self):
+        status = PipelineStatusTracker().snapshot()
+        assert status.stage == PipelineStage.LISTENING
+        assert status.last_latencies_ms == {}
+
+    def test_stage_is_active_inside_context_and_records_latency(self):
+        tracker = PipelineStatusTracker()
+
+        with tracker.stage(PipelineStage.TRANSCRIBING):
+            assert tracker.snapshot().stage == PipelineStage.TRANSCRIBING
+
+        status = tracker.snapshot()
+        assert status.stage == PipelineStage.LISTENING
+        assert status.last_latencies_ms[PipelineStage.TRANSCRIBING] >= 0
+
+    def test_overlapping_turns_report_stage_closest_to_playback(self):
+        tracker = PipelineStatusTracker()
+
+        with tracker.stage(PipelineStage.TRANSCRIBING):
+            with tracker.stage(PipelineStage.SPEAKING):
+                assert tracker.snapshot().stage == PipelineStage.SPEAKING
+            assert tracker.snapshot().stage == PipelineStage.TRANSCRIBING
+
+    def test_snapshots_are_immutable_copies(self):
+        tracker = PipelineStatusTracker()
+        before = tracker.snapshot()
+
+        with tracker.stage(PipelineStage.THINKING):
+            pass
+
+        assert before.last_latencies_ms == {}
+        assert tracker.snapshot() is not before
+
+    def test_response_latency_from_capture_to_playback(self):
+        tracker = PipelineStatusTracker()
+        tracker.turn_captured(3, perf_counter() - 0.5)
+
+        tracker.playback_started(3)
+
+        assert tracker.snapshot().last_response_ms >= 500
+
+    def test_playback_of_unknown_request_is_ignored(self):
+        tracker = PipelineStatusTracker()
+        tracker.playback_started(42)
+        assert tracker.snapshot().last_response_ms is None
+
+    def test_set_awake(self):
+        tracker = PipelineStatusTracker()
+        tracker.set_awake(True)
+        assert tracker.snapshot().is_awake is True
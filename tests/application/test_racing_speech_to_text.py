@@ -0,0 +1,121 @@
+"""Unit tests for RacingSpeechToText."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool
+from app.application.errors import SpeechToTextError
+from app.application.racing_speech_to_text import RacingSpeechToText
+
+
+class FakeSTT:
+    def __init__(self, text: str, *, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.text = text
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def transcribe(self, audio: AudioBuffer) -> str:
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.text
+
+
+def one_second() -> AudioBuffer:
+    return AudioBuffer(np.zeros(16_000, dtype=np.float32), sample_rate=16_000)
+
+
+class TestRacingSpeechToText:
+    def test_first_result_wins(self):
+        slow = FakeSTT("slow", delay=5.0)
+        fast = FakeSTT("fast")
+        stt = RacingSpeechToText(providers={"local": slow, "openai": fast})
+
+        assert stt.transcribe(one_second()) == "fast"
+        assert slow.calls == 1
+        slow.release.set()
+
+    def test_failed_provider_loses_to_the_other(self):
+        broken = FakeSTT("", error=SpeechToTextError("offline"))
+        slower = FakeSTT("hello", delay=0.05)
+        stt = RacingSpeechToText(providers={"openai": broken, "local": slower})
+
+        assert stt.transcribe(one_second()) == "hello"
+
+    def test_empty_transcript_does_not_win(self):
+        quick = FakeSTT("")
+        slower = FakeSTT("hello", delay=0.05)
+        stt = RacingSpeechToText(providers={"openai": quick, "local": slower})
+
+        assert stt.transcribe(one_second()) == "hello"
+
+    def test_empty_only_when_every_provider_is_empty(self):
+        stt = RacingSpeechToText(providers={"a": FakeSTT(""), "b": FakeSTT(" ", delay=0.05)})
+
+        assert stt.transcribe(one_second()) == ""
+
+    def test_all_failures_raise(self):
+        stt = RacingSpeechToText(
+            providers={
+                "a": FakeSTT("", error=SpeechToTextError("a down")),
+                "b": FakeSTT("", error=SpeechToTextError("b down")),
+            }
+        )
+
+        with pytest.raises(SpeechToTextError, match="a down"):
+            stt.transcribe(one_second())
+
+    def test_learns_to_run_the_faster_provider_alone(self):
+        slow = FakeSTT("slow", delay=0.05)
+        fast = FakeSTT("fast")
+        stt = RacingSpeechToText(providers={"slow": slow, "fast": fast}, min_samples=3)
+
+        for _ in range(3):
+            stt.transcribe(one_second())
+        # Let the losing requests finish so their latencies are recorded.
+        for _ in range(100):
+            if stt.preferred_provider(0) is not None:
+                break
+            threading.Event().wait(0.02)
+
+        assert stt.preferred_provider(0) == "fast"
+        calls_before = slow.calls
+        assert stt.transcribe(one_second()) == "fast"
+        assert slow.calls == calls_before
+
+    def test_preference_is_per_length_bucket(self):
+        stt = RacingSpeechToText(
+            providers={"a": FakeSTT("a"), "b": FakeSTT("b")}, bucket_edges=(1.5,), min_samples=1
+        )
+        assert stt.preferred_provider(0) is None
+        assert stt.preferred_provider(1) is None
+
+    def test_loser_keeps_pooled_audio_alive(self):
+        pool = AudioSlabPool(capacity_frames=16_000)
+        writer = pool.writer(sample_rate=16_000)
+        writer.append(np.ones(1600, dtype=np.float32))
+        audio = writer.publish()
+        slow = FakeSTT("slow", delay=5.0)
+        stt = RacingSpeechToText(providers={"slow": slow, "fast": FakeSTT("fast")})
+
+        assert stt.transcribe(audio) == "fast"
+        audio.release()
+        # The losing request still holds the slab, so it is not recycled yet.
+        assert pool.free_slabs == 0
+
+        slow.release.set()
+        for _ in range(100):
+            if pool.free_slabs:
+                break
+            threading.Event().wait(0.01)
+        assert pool.free_slabs == 1
+
+    def test_needs_two_providers(self):
+        with pytest.raises(ValueError):
+            RacingSpeechToText(providers={"only": FakeSTT("x")})
@@ -59,6 +59,17 @@ class TestLatestReplyQueue(unittest.TestCase):
         self.assertFalse(t.is_alive(), "get() did not unblock after publish")
         self.assertEqual(result[0].text, "unblocked")
 
+    def test_close_wakes_a_blocked_consumer(self):
+        result = []
+        t = threading.Thread(target=lambda: result.append(self.queue.get()))
+        t.start()
+
+        self.queue.close()
+        t.join(timeout=2)
+
+        self.assertFalse(t.is_alive(), "get() did not unblock after close")
+        self.assertEqual(result, [None])
+
     def test_is_latest_reflects_current_id(self):
         id1 = self.queue.next_request_id()
         self.assertTrue(self.queue.is_latest(id1))
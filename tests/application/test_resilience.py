@@ -0,0 +1,219 @@
+"""Unit tests for the resilience layer."""
+
+import threading
+import time
+
+import pytest
+
+from app.application.errors import (
+    DeadlineExceededError,
+    ExternalServiceError,
+    SpeechToTextError,
+)
+from app.application.resilience import (
+    CallPolicy,
+    CircuitBreaker,
+    CircuitState,
+    Failover,
+    LatencyWindow,
+    ResilientCall,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class Flaky:
+    """Fails ``failures`` times with SpeechToTextError, then returns "ok"."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise SpeechToTextError(f"failure {self.calls}")
+        return "ok"
+
+
+def make_call(policy: CallPolicy, **kwargs) -> tuple[ResilientCall, list[float]]:
+    sleeps: list[float] = []
+    call = ResilientCall("test", policy, sleep=sleeps.append, jitter=lambda: 1.0, **kwargs)
+    return call, sleeps
+
+
+class TestResilientCall:
+    def test_retries_with_exponential_backoff(self):
+        call, sleeps = make_call(CallPolicy(retries=2, backoff_base=0.1, backoff_max=1.0))
+        flaky = Flaky(failures=2)
+
+        assert call(flaky) == "ok"
+        assert flaky.calls == 3
+        assert sleeps == pytest.approx([0.1, 0.2])
+
+    def test_backoff_is_jittered_and_capped(self):
+        sleeps: list[float] = []
+        call = ResilientCall(
+            "test",
+            CallPolicy(retries=3, backoff_base=1.0, backoff_max=1.5),
+            sleep=sleeps.append,
+            jitter=lambda: 0.5,
+        )
+
+        call(Flaky(failures=3))
+
+        assert sleeps == pytest.approx([0.5, 0.75, 0.75])
+
+    def test_gives_up_after_retries(self):
+        call, _ = make_call(CallPolicy(retries=1))
+        flaky = Flaky(failures=5)
+
+        with pytest.raises(SpeechToTextError, match="failure 2"):
+            call(flaky)
+        assert flaky.calls == 2
+
+    def test_other_errors_are_not_retried(self):
+        call, _ = make_call(CallPolicy(retries=3))
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise KeyError("bug")
+
+        with pytest.raises(KeyError):
+            call(broken)
+        assert len(calls) == 1
+
+    def test_deadline_bounds_a_hanging_call(self):
+        call, _ = make_call(CallPolicy(deadline=0.05, retries=3))
+        release = threading.Event()
+
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            call(lambda: release.wait(5))
+        assert time.monotonic() - started < 1.0
+        release.set()
+
+    def test_hedges_after_the_latency_quantile(self):
+        call, _ = make_call(CallPolicy(hedge=True, hedge_min_samples=1, retries=0))
+        call.latencies.record(0.01)
+        first_started = threading.Event()
+        release_first = threading.Event()
+        calls = []
+        lock = threading.Lock()
+
+        def request():
+            with lock:
+                calls.append(1)
+                is_first = len(calls) == 1
+            if is_first:
+                first_started.set()
+                release_first.wait(5)
+                return "slow"
+            return "hedged"
+
+        assert call(request) == "hedged"
+        assert len(calls) == 2
+        release_first.set()
+
+    def test_no_hedge_without_enough_samples(self):
+        call, _ = make_call(CallPolicy(hedge=True, hedge_min_samples=5))
+        flaky = Flaky(failures=0)
+
+        call(flaky)
+
+        assert flaky.calls == 1
+
+
+class TestLatencyWindow:
+    def test_quantile(self):
+        window = LatencyWindow(size=100)
+        for i in range(1, 101):
+            window.record(i / 100)
+        assert window.quantile(0.95) == pytest.approx(0.96)
+
+    def test_empty_window_has_no_quantile(self):
+        assert LatencyWindow().quantile(0.95) is None
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_half_opens_later(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_after=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow() is False
+
+        clock.advance(10)
+        assert breaker.allow() is True
+        # Only one trial call while half-open.
+        assert breaker.allow() is False
+        breaker.record_success(0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_after=5, clock=clock)
+        breaker.record_failure()
+        clock.advance(5)
+
+        assert breaker.allow() is True
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_slow_successes_count_as_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_seconds=1.0)
+        breaker.record_success(2.0)
+        breaker.record_success(3.0)
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestFailover:
+    def test_uses_fallback_on_failure_and_skips_primary_while_open(self):
+        call, _ = make_call(CallPolicy(retries=0))
+        breaker = CircuitBreaker(failure_threshold=1, reset_after=60)
+        failover = Failover(call, breaker=breaker)
+        primary = Flaky(failures=10)
+
+        assert failover(primary, lambda: "local") == "local"
+        assert failover(primary, lambda: "local") == "local"
+        assert primary.calls == 1
+
+    def test_without_fallback_errors_propagate(self):
+        call, _ = make_call(CallPolicy(retries=0))
+        failover = Failover(call, breaker=CircuitBreaker())
+
+        with pytest.raises(ExternalServiceError):
+            failover(Flaky(failures=1))
+
+    def test_unexpected_error_in_a_trial_does_not_wedge_the_breaker(self):
+        clock = FakeClock()
+        call, _ = make_call(CallPolicy(retries=0))
+        breaker = CircuitBreaker(failure_threshold=1, reset_after=5, clock=clock)
+        failover = Failover(call, breaker=breaker)
+        assert failover(Flaky(failures=1), lambda: "local") == "local"
+        clock.advance(5)
+
+        def broken() -> str:
+            raise RuntimeError("bug")
+
+        with pytest.raises(RuntimeError):
+            failover(broken, lambda: "local")
+
+        assert breaker.state == CircuitState.OPEN
+        clock.advance(5)
+        assert failover(lambda: "ok", lambda: "local") == "ok"
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,90 @@
+"""Unit tests for the resilient service wrappers."""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.application.audio_buffer import AudioBuffer, AudioSlabPool
+from app.application.errors import (
+    ChatClientError,
+    DeadlineExceededError,
+    TextToSpeechError,
+)
+from app.application.resilience import (
+    CallPolicy,
+    CircuitBreaker,
+    Failover,
+    ResilientCall,
+)
+from app.application.resilient_clients import (
+    ResilientChatClient,
+    ResilientSpeechToText,
+    ResilientTextToSpeech,
+)
+
+
+def failover(*, breaker: CircuitBreaker | None = None) -> Failover:
+    call = ResilientCall("test", CallPolicy(retries=1), sleep=lambda _: None)
+    return Failover(call, breaker=breaker)
+
+
+def test_chat_client_retries_transient_errors():
+    client = MagicMock()
+    client.complete_messages.side_effect = [ChatClientError("busy"), "Hello!"]
+
+    resilient = ResilientChatClient(client=client, failover=failover())
+
+    assert resilient.complete_messages(messages=[]) == "Hello!"
+    assert client.complete_messages.call_count == 2
+
+
+def test_speech_to_text_passes_audio_through():
+    stt = MagicMock()
+    stt.transcribe.return_value = "hi"
+    audio = AudioBuffer(np.zeros(160, dtype=np.float32), sample_rate=16_000)
+
+    resilient = ResilientSpeechToText(stt=stt, failover=failover())
+
+    assert resilient.transcribe(audio) == "hi"
+    stt.transcribe.assert_called_once_with(audio)
+
+
+def test_text_to_speech_fails_over_to_fallback():
+    primary = MagicMock()
+    primary.synthesize.side_effect = TextToSpeechError("down")
+    fallback = MagicMock()
+    fallback.synthesize.return_value = "local audio"
+
+    resilient = ResilientTextToSpeech(
+        tts=primary,
+        failover=failover(breaker=CircuitBreaker()),
+        fallback=fallback,
+    )
+
+    assert resilient.synthesize("Hello") == "local audio"
+    fallback.synthesize.assert_called_once_with("Hello")
+
+
+def test_abandoned_transcription_keeps_pooled_audio_alive():
+    pool = AudioSlabPool(capacity_frames=1600)
+    writer = pool.writer(sample_rate=16_000)
+    writer.append(np.ones(160, dtype=np.float32))
+    audio = writer.publish()
+    release = threading.Event()
+    stt = MagicMock()
+    stt.transcribe.side_effect = lambda _: release.wait(5) and "late"
+    call = ResilientCall("test", CallPolicy(deadline=0.05, retries=0))
+
+    with pytest.raises(DeadlineExceededError):
+        ResilientSpeechToText(stt=stt, failover=Failover(call)).transcribe(audio)
+    audio.release()
+    assert pool.free_slabs == 0
+
+    release.set()
+    for _ in range(100):
+        if pool.free_slabs:
+            break
+        threading.Event().wait(0.01)
+    assert pool.free_slabs == 1
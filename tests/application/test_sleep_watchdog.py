@@ -0,0 +1,94 @@
+"""Unit tests for the deadline-driven SleepWatchdog."""
+
+import threading
+import time
+
+from app.application.sleep_watchdog import SleepWatchdog
+from app.utils.logger import Logger
+
+
+def make_watchdog(*, slept: bool = True, clock=time.monotonic):
+    attempted = threading.Event()
+    calls = []
+
+    def attempt_sleep() -> bool:
+        calls.append(time.monotonic())
+        attempted.set()
+        return slept
+
+    logger = Logger()
+    watchdog = SleepWatchdog(attempt_sleep=attempt_sleep, logger=logger, clock=clock)
+    return watchdog, attempted, calls, logger
+
+
+class TestSleepWatchdog:
+    def test_fires_once_at_deadline(self):
+        watchdog, attempted, calls, logger = make_watchdog()
+        watchdog.start()
+        deadline = time.monotonic() + 0.05
+
+        watchdog.schedule(deadline)
+
+        assert attempted.wait(1.0)
+        time.sleep(0.05)
+        watchdog.stop()
+        assert len(calls) == 1
+        assert calls[0] >= deadline
+        assert watchdog.deadline is None
+        assert list(logger._lines) == ["Sleeping (idle timeout). Say 'Buddy' to start."]
+
+    def test_failed_attempt_is_not_logged(self):
+        watchdog, attempted, _, logger = make_watchdog(slept=False)
+        watchdog.start()
+
+        watchdog.schedule(time.monotonic())
+
+        assert attempted.wait(1.0)
+        watchdog.stop()
+        assert list(logger._lines) == []
+
+    def test_cancelled_deadline_never_fires(self):
+        watchdog, attempted, _, _ = make_watchdog()
+        watchdog.start()
+
+        watchdog.schedule(time.monotonic() + 0.05)
+        watchdog.schedule(None)
+
+        assert not attempted.wait(0.15)
+        watchdog.stop()
+
+    def test_rescheduling_postpones_the_deadline(self):
+        watchdog, attempted, calls, _ = make_watchdog()
+        watchdog.start()
+
+        watchdog.schedule(time.monotonic() + 0.05)
+        later = time.monotonic() + 0.2
+        watchdog.schedule(later)
+
+        assert attempted.wait(1.0)
+        watchdog.stop()
+        assert calls[0] >= later
+
+    def test_idle_watchdog_does_not_wake_up(self):
+        reads = []
+
+        def clock() -> float:
+            reads.append(None)
+            return time.monotonic()
+
+        watchdog, _, _, _ = make_watchdog(clock=clock)
+        watchdog.start()
+
+        time.sleep(0.1)
+        watchdog.stop()
+        assert reads == []
+
+    def test_stop_ends_the_thread(self):
+        watchdog, _, _, _ = make_watchdog()
+        thread = watchdog.start()
+        watchdog.schedule(time.monotonic() + 60)
+
+        watchdog.stop()
+
+        thread.join(1.0)
+        assert not thread.is_alive()
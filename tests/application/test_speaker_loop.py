@@ -0,0 +1,85 @@
+"""Unit tests for SpeakerLoop."""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.reply_queue import LatestReplyQueue
+from app.application.speaker_loop import SpeakerLoop
+from app.utils.event_log import EventType
+from app.utils.logger import Logger
+
+
+def run_one_reply(*, completed: bool):
+    tts = MagicMock()
+    tts.synthesize.return_value = AudioBuffer(np.zeros(24_000, dtype=np.float32), sample_rate=24_000)
+    speaker = MagicMock()
+    speaker.speak.return_value = completed
+    event_log = MagicMock()
+    done = threading.Event()
+    logger = Logger(on_emit=lambda _line: done.set())
+
+    reply_queue = LatestReplyQueue()
+    loop = SpeakerLoop(
+        tts=tts,
+        speaker=speaker,
+        reply_queue=reply_queue,
+        on_reply_completed=lambda _text: done.set(),
+        logger=logger,
+        event_log=event_log,
+    )
+    loop.start()
+    request_id = reply_queue.next_request_id()
+    reply_queue.publish(request_id=request_id, text="Hello there")
+
+    assert done.wait(2.0)
+    return request_id, [(c.args[0], c.kwargs) for c in event_log.emit.call_args_list]
+
+
+class TestSpeakerLoopEvents:
+    def test_completed_playback(self):
+        request_id, events = run_one_reply(completed=True)
+
+        assert [event for event, _ in events] == [
+            EventType.SYNTHESIZED,
+            EventType.PLAYBACK_STARTED,
+            EventType.PLAYBACK_ENDED,
+        ]
+        synthesized = events[0][1]
+        assert synthesized["request_id"] == request_id
+        assert synthesized["chars"] == len("Hello there")
+        assert synthesized["audio_seconds"] == 1.0
+        assert synthesized["bytes"] == 24_000 * 4
+
+    def test_interrupted_playback(self):
+        _, events = run_one_reply(completed=False)
+
+        assert events[-1][0] == EventType.INTERRUPTED
+        assert events[-1][1]["duration_ms"] >= 0
+
+
+class TestSpeakingEndHook:
+    def test_called_after_speaking_state_is_cleared(self):
+        tts = MagicMock()
+        tts.synthesize.return_value = AudioBuffer(np.zeros(240, dtype=np.float32), sample_rate=24_000)
+        speaker = MagicMock()
+        speaker.speak.return_value = False
+        ended = threading.Event()
+        speaking_at_end = []
+
+        reply_queue = LatestReplyQueue()
+        loop = SpeakerLoop(
+            tts=tts,
+            speaker=speaker,
+            reply_queue=reply_queue,
+            on_reply_completed=lambda _text: None,
+            logger=Logger(),
+            on_speaking_end=lambda: (speaking_at_end.append(loop.is_speaking), ended.set()),
+        )
+        loop.start()
+        reply_queue.publish(request_id=reply_queue.next_request_id(), text="Hello")
+
+        assert ended.wait(2.0)
+        assert speaking_at_end == [False]
@@ -0,0 +1,61 @@
+"""Memory and thread budgets for long sessions (see app/devtools/soak.py).
+
+A short soak always runs; set MY_ENGLISH_BUDDY_SOAK_TURNS to run a long one.
+"""
+
+import os
+import threading
+
+import pytest
+
+from app.application.conversation_runner import ConversationRunner
+from app.devtools.soak import main, run_soak
+from app.utils.logger import Logger
+
+_LONG_SOAK_TURNS = int(os.getenv("MY_ENGLISH_BUDDY_SOAK_TURNS", "0") or 0)
+# Utterance workers are capped by the runner's in-flight limit.
+_MAX_EXTRA_THREADS = ConversationRunner._MAX_INFLIGHT_REQUESTS
+
+
+def test_short_soak_stays_within_budget():
+    # A small log tail fills up during warm-up, so the baseline is steady state.
+    logger = Logger(tail_size=50)
+
+    report = run_soak(400, warmup=200, logger=logger)
+
+    assert len(logger._lines) == 50
+    assert report.growth_bytes < 32 * 1024, report.format()
+    assert report.extra_threads <= _MAX_EXTRA_THREADS, report.format()
+    assert report.top_sites
+
+
+@pytest.mark.skipif(not _LONG_SOAK_TURNS, reason="set MY_ENGLISH_BUDDY_SOAK_TURNS to run")
+def test_long_soak_stays_within_budget():
+    report = run_soak(_LONG_SOAK_TURNS)
+    print(report.format())
+
+    # Bounded caches are full after warm-up; what remains is interpreter noise.
+    assert report.growth_bytes < 64 * 1024, report.format()
+    assert report.extra_threads <= _MAX_EXTRA_THREADS, report.format()
+
+
+def test_runner_threads_are_stopped():
+    before = threading.active_count()
+
+    run_soak(10)
+
+    assert threading.active_count() <= before
+
+
+def test_report_format_lists_allocation_sites():
+    report = run_soak(20, top=3)
+    text = report.format()
+
+    assert text.startswith("Soak: 20 turns")
+    assert "Top growth since warm-up:" in text
+    assert len(report.top_sites) <= 3
+
+
+def test_cli_fails_when_budget_is_exceeded(capsys):
+    assert main(["--turns", "10", "--max-growth-kib", "-1"]) == 1
+    assert "Memory grew" in capsys.readouterr().err
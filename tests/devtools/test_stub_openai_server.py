@@ -0,0 +1,108 @@
+"""End-to-end tests of the OpenAI adapters against the stub server."""
+
+import random
+import time
+
+import numpy as np
+import pytest
+from openai import OpenAI
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.errors import ChatClientError
+from app.devtools.stub_openai_server import (
+    EndpointBehavior,
+    LatencyDistribution,
+    StubBehavior,
+    StubOpenAIServer,
+)
+from app.domain.vo.chat_message import ChatMessage, ChatRole
+from app.infrastructure.openai.chat_client import OpenAIChatClient
+from app.infrastructure.openai.embedder import Embedder
+from app.infrastructure.openai.speech_to_text import SpeechToText
+from app.infrastructure.openai.text_to_speech import TextToSpeech
+
+
+@pytest.fixture
+def server():
+    with StubOpenAIServer(StubBehavior(tokens_per_second=0, seed=1)) as stub:
+        yield stub
+
+
+def client_for(stub: StubOpenAIServer) -> OpenAI:
+    return OpenAI(api_key="stub", base_url=stub.base_url, max_retries=0)
+
+
+class TestStubOpenAIServer:
+    def test_chat_completion_echoes_the_user(self, server):
+        chat = OpenAIChatClient(client=client_for(server), model="stub")
+
+        reply = chat.complete_messages(messages=[ChatMessage(role=ChatRole.USER, content="Hi there")])
+
+        assert reply == "You said: Hi there"
+
+    def test_streaming_chat_completion(self, server):
+        stream = client_for(server).chat.completions.create(
+            model="stub",
+            messages=[{"role": "user", "content": "one two three"}],
+            stream=True,
+        )
+
+        text = "".join(chunk.choices[0].delta.content or "" for chunk in stream)
+
+        assert text == "You said: one two three"
+
+    def test_transcription(self, server):
+        stt = SpeechToText(client=client_for(server))
+        audio = AudioBuffer(np.full(16_000, 0.1, dtype=np.float32), sample_rate=16_000)
+
+        assert stt.transcribe(audio) == "Hello, buddy."
+        assert server.request_counts["transcription"] == 1
+
+    def test_speech_returns_pcm_scaled_to_input(self, server):
+        tts = TextToSpeech(client=client_for(server))
+
+        audio = tts.synthesize("Hello")
+
+        assert audio.sample_rate == 24_000
+        assert audio.frames == int(24_000 * 0.06 * 5)
+        assert 0 < np.abs(audio.samples).max() <= 0.11
+
+    def test_embeddings_are_deterministic(self, server):
+        embedder = Embedder(client=client_for(server))
+
+        first, second, other = embedder.embed(["I like tea", "I like tea", "Trains are fast"])
+
+        np.testing.assert_allclose(first, second)
+        assert first @ other < first @ second
+
+    def test_injected_errors_surface_as_service_errors(self):
+        behavior = StubBehavior(chat=EndpointBehavior(error_rate=1.0, error_status=503))
+        with StubOpenAIServer(behavior) as stub:
+            chat = OpenAIChatClient(client=client_for(stub), model="stub")
+            with pytest.raises(ChatClientError):
+                chat.complete_messages(messages=[ChatMessage(role=ChatRole.USER, content="Hi")])
+
+    def test_latency_is_applied(self):
+        behavior = StubBehavior(chat=EndpointBehavior(latency=LatencyDistribution(median_ms=100)))
+        with StubOpenAIServer(behavior) as stub:
+            chat = OpenAIChatClient(client=client_for(stub), model="stub")
+            started = time.monotonic()
+            chat.complete_messages(messages=[ChatMessage(role=ChatRole.USER, content="Hi")])
+            assert time.monotonic() - started >= 0.1
+
+
+class TestLatencyDistribution:
+    def test_parse(self):
+        assert LatencyDistribution.parse("300:900") == LatencyDistribution(300, 900)
+        assert LatencyDistribution.parse("50") == LatencyDistribution(50, None)
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse("fast")
+
+    def test_samples_match_median_and_p95(self):
+        rng = random.Random(0)
+        latency = LatencyDistribution(median_ms=200, p95_ms=600)
+
+        samples = np.array([latency.sample(rng) for _ in range(20_000)])
+
+        assert np.median(samples) == pytest.approx(0.2, rel=0.05)
+        assert np.quantile(samples, 0.95) == pytest.approx(0.6, rel=0.1)
@@ -1,6 +1,8 @@
 """Unit tests for Conversation aggregate root."""
 
 from app.domain.entity.conversation import Conversation
+from app.domain.vo.chat_message import ChatMessage, ChatRole
+from app.domain.vo.turn import Turn
 
 
 class TestConversation:
@@ -43,6 +45,14 @@ class TestConversation:
         assert self.conv.recent_context(1)[0].user_utterance == "Hello"
         assert self.conv.recent_context(1)[0].assistant_reply == "Hi!"
 
+    def test_complete_turn_returns_committed_turn(self):
+        self.conv.start_turn("Hello")
+        turn = self.conv.complete_turn("  Hi!  ")
+        assert turn == Turn(user_utterance="Hello", assistant_reply="Hi!")
+
+    def test_complete_turn_without_pending_returns_none(self):
+        assert self.conv.complete_turn("Hi!") is None
+
     def test_cancel_turn(self):
         self.conv.start_turn("Hello")
         utterance = self.conv.cancel_turn()
@@ -119,6 +129,32 @@ class TestConversation:
         assert messages[2].role == "user"
         assert messages[2].content == "Next question"
 
+    def test_build_messages_follows_trim_restore_and_clear(self):
+        conv = Conversation(max_turns=3)
+        for i in range(5):
+            conv.add_turn(f"User {i}", f"Bot {i}")
+        conv.restore([Turn(user_utterance="Old", assistant_reply="Older")])
+        conv.start_turn("Pending")
+        conv.complete_turn("Done")
+
+        expected = [m for t in conv.recent_context(10) for m in t.to_messages()]
+        assert conv.build_messages(10) == expected
+        assert [m.content for m in conv.build_messages(1)] == ["Pending", "Done"]
+
+        conv.clear()
+        assert conv.build_messages(10) == []
+
+    def test_build_messages_returns_a_fresh_list(self):
+        self.conv.add_turn("Hello", "Hi")
+        messages = self.conv.build_messages(1)
+        messages.append(ChatMessage(role=ChatRole.USER, content="extra"))
+        assert len(self.conv.build_messages(1)) == 2
+
+    def test_cancel_turn_drops_pending_message(self):
+        self.conv.start_turn("Hello")
+        self.conv.cancel_turn()
+        assert self.conv.build_messages(5) == []
+
     # --- max_turns limit ---
 
     def test_max_turns_trims_oldest(self):
@@ -129,6 +165,21 @@ class TestConversation:
         assert turns[0].user_utterance == "User 5"
         assert turns[-1].user_utterance == "User 9"
 
+    # --- restore ---
+
+    def test_restore_inserts_before_current_turns(self):
+        self.conv.add_turn("New", "Fresh")
+        self.conv.restore([Turn("Old 1", "A"), Turn("Old 2", "B")])
+        assert [t.user_utterance for t in self.conv.recent_context(5)] == ["Old 1", "Old 2", "New"]
+
+    def test_restore_respects_max_turns_keeping_newest(self):
+        self.conv.add_turn("New", "Fresh")
+        self.conv.restore([Turn(f"Old {i}", "x") for i in range(10)])
+        turns = self.conv.recent_context(5)
+        assert self.conv.turn_count == 5
+        assert turns[0].user_utterance == "Old 6"
+        assert turns[-1].user_utterance == "New"
+
     def test_no_max_turns_limit(self):
         conv = Conversation(max_turns=None)
         for i in range(100):
@@ -43,6 +43,10 @@ class TestChatMessage:
         assert msg1 == msg2
         assert msg1 != msg3
 
+    def test_message_has_no_instance_dict(self):
+        """Test that ChatMessage uses slots (no per-instance __dict__)."""
+        assert not hasattr(ChatMessage(role="user", content="Hi"), "__dict__")
+
     def test_message_with_empty_content(self):
         """Test creating message with empty content."""
         message = ChatMessage(role="user", content="")
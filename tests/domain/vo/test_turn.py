@@ -31,3 +31,10 @@ class TestTurn:
         assert messages[0].content == "Hello"
         assert messages[1].role == "assistant"
         assert messages[1].content == "Hi"
+
+    def test_to_messages_is_built_once(self):
+        turn = Turn(user_utterance="Hello", assistant_reply="Hi")
+        assert turn.to_messages() is turn.to_messages()
+
+    def test_turn_has_no_instance_dict(self):
+        assert not hasattr(Turn(user_utterance="Hello", assistant_reply="Hi"), "__dict__")
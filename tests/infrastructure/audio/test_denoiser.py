@@ -0,0 +1,144 @@
+"""Unit tests for the streaming Wiener-filter denoiser.
+
+``test_does_not_hurt_stt_accuracy`` needs a recorded corpus: a directory of
+16 kHz mono 16-bit ``*.wav`` files, each with a ``.txt`` reference transcript
+and about half a second of background noise before speech starts::
+
+    MY_ENGLISH_BUDDY_STT_CORPUS=path/to/corpus uv run --extra local-stt \\
+        pytest tests/infrastructure/audio/test_denoiser.py -s
+"""
+
+import os
+import re
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.infrastructure.audio.denoiser import StreamingDenoiser
+
+RATE = 16_000
+CHUNK = 1600
+
+_CORPUS = os.getenv("MY_ENGLISH_BUDDY_STT_CORPUS")
+_NOISE_LEAD_SECONDS = 0.5
+
+
+def stream(denoiser: StreamingDenoiser, audio: np.ndarray, chunk: int = CHUNK) -> np.ndarray:
+    parts = [denoiser.process(audio[i : i + chunk]) for i in range(0, len(audio), chunk)]
+    return np.concatenate([*parts, denoiser.flush()])
+
+
+def snr_db(clean: np.ndarray, audio: np.ndarray) -> float:
+    return float(10 * np.log10(np.sum(clean**2) / np.sum((audio - clean) ** 2)))
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+class TestStreamingDenoiser:
+    @pytest.mark.parametrize("chunk", [1600, 100, 777])
+    def test_passes_audio_through_without_a_noise_profile(self, rng, chunk):
+        audio = (0.1 * rng.standard_normal(RATE)).astype(np.float32)
+
+        out = stream(StreamingDenoiser(), audio, chunk)
+
+        assert out.shape == audio.shape
+        np.testing.assert_allclose(out, audio, atol=1e-5)
+
+    def test_improves_snr_of_a_tone_in_noise(self, rng):
+        denoiser = StreamingDenoiser()
+        for _ in range(10):
+            denoiser.learn_noise((0.02 * rng.standard_normal(CHUNK)).astype(np.float32))
+        t = np.arange(RATE) / RATE
+        clean = (0.2 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+        noisy = clean + (0.02 * rng.standard_normal(RATE)).astype(np.float32)
+
+        out = stream(denoiser, noisy)
+
+        assert out.shape == noisy.shape
+        assert snr_db(clean, out) > snr_db(clean, noisy) + 6
+
+    def test_accepts_sounddevice_shaped_chunks(self, rng):
+        audio = (0.1 * rng.standard_normal((RATE, 1))).astype(np.float32)
+
+        out = stream(StreamingDenoiser(), audio)
+
+        np.testing.assert_allclose(out, audio[:, 0], atol=1e-5)
+
+    def test_track_noise_follows_a_louder_background(self, rng):
+        denoiser = StreamingDenoiser(noise_smoothing=0.5)
+        denoiser.learn_noise((0.01 * rng.standard_normal(CHUNK)).astype(np.float32))
+        quiet = denoiser._noise_power.mean()
+
+        for _ in range(10):
+            denoiser.track_noise((0.05 * rng.standard_normal(CHUNK)).astype(np.float32))
+
+        assert denoiser._noise_power.mean() > 20 * quiet
+
+    def test_short_chunks_do_not_change_the_profile(self):
+        denoiser = StreamingDenoiser()
+
+        denoiser.learn_noise(np.zeros(100, dtype=np.float32))
+
+        assert not denoiser.has_noise_profile
+
+    def test_rejects_odd_frame_size(self):
+        with pytest.raises(ValueError):
+            StreamingDenoiser(frame_size=511)
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref = re.findall(r"[\w']+", reference.lower())
+    hyp = re.findall(r"[\w']+", hypothesis.lower())
+    # Levenshtein distance over words, one row at a time.
+    row = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, hyp_word in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (ref_word != hyp_word))
+    return row[-1] / max(1, len(ref))
+
+
+def read_wav(path: Path) -> np.ndarray | None:
+    with wave.open(str(path), "rb") as wav:
+        if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (RATE, 1, 2):
+            return None
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    return pcm.astype(np.float32) / 32767.0
+
+
+def test_word_error_rate():
+    assert word_error_rate("I'd like a coffee", "i'd like a coffee.") == 0.0
+    assert word_error_rate("I'd like a coffee", "I like coffee please") == pytest.approx(3 / 4)
+
+
+@pytest.mark.skipif(not _CORPUS, reason="set MY_ENGLISH_BUDDY_STT_CORPUS to a recorded corpus")
+def test_does_not_hurt_stt_accuracy():
+    pytest.importorskip("faster_whisper")
+    from app.infrastructure.local.speech_to_text import SpeechToText
+
+    stt = SpeechToText(model="base.en", device="cpu", compute_type="int8")
+    raw_errors = denoised_errors = 0.0
+    clips = 0
+    for wav_path in sorted(Path(_CORPUS).glob("*.wav")):
+        reference_path = wav_path.with_suffix(".txt")
+        audio = read_wav(wav_path)
+        if audio is None or not reference_path.exists():
+            continue
+        reference = reference_path.read_text(encoding="utf-8")
+
+        denoiser = StreamingDenoiser()
+        denoiser.learn_noise(audio[: int(_NOISE_LEAD_SECONDS * RATE)])
+        raw_errors += word_error_rate(reference, stt.transcribe(audio))
+        denoised_errors += word_error_rate(reference, stt.transcribe(stream(denoiser, audio)))
+        clips += 1
+
+    if not clips:
+        pytest.skip(f"No usable 16 kHz mono clips with transcripts in {_CORPUS}")
+    raw_wer, denoised_wer = raw_errors / clips, denoised_errors / clips
+    print(f"\nWER over {clips} clips: raw {raw_wer:.3f}, denoised {denoised_wer:.3f}")
+    assert denoised_wer <= raw_wer + 0.02
@@ -0,0 +1,262 @@
+"""Unit tests for the microphone Listener, driven by a scripted input stream."""
+
+from queue import Queue
+from threading import Event
+
+import numpy as np
+import pytest
+
+try:
+    import sounddevice
+except (ImportError, OSError):  # Not installed, or the PortAudio library is missing.
+    pytest.skip("sounddevice is not available", allow_module_level=True)
+
+from app.infrastructure.audio import listener as listener_module  # noqa: E402
+from app.infrastructure.audio import stream_supervisor as stream_supervisor_module  # noqa: E402
+from app.infrastructure.audio.listener import Listener  # noqa: E402
+from app.utils.logger import Logger  # noqa: E402
+
+RATE = 16_000
+
+
+class ScriptedInputStream:
+    """Plays back segments (arrays or (level, seconds)); records the block sizes asked for."""
+
+    def __init__(self, segments, stop_event: Event, samplerate: int = RATE, **kwargs) -> None:
+        self.samplerate = samplerate
+        self._samples = np.concatenate(
+            [
+                segment
+                if isinstance(segment, np.ndarray)
+                else np.full(int(segment[1] * samplerate), segment[0], dtype=np.float32)
+                for segment in segments
+            ]
+        ).reshape(-1, 1)
+        self._position = 0
+        self._stop_event = stop_event
+        self.reads: list[int] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def read(self, frames: int):
+        self.reads.append(frames)
+        chunk = self._samples[self._position : self._position + frames]
+        self._position += frames
+        if self._position >= len(self._samples):
+            self._stop_event.set()
+        if len(chunk) < frames:
+            chunk = np.concatenate([chunk, np.zeros((frames - len(chunk), 1), dtype=np.float32)])
+        return chunk, False
+
+
+def run_listener(monkeypatch, segments, *, low_power: bool = False, **listener_kwargs):
+    stop_event = Event()
+    streams: list[ScriptedInputStream] = []
+
+    def input_stream(**kwargs):
+        streams.append(ScriptedInputStream(segments, stop_event, **kwargs))
+        return streams[-1]
+
+    monkeypatch.setattr(listener_module.sd, "InputStream", input_stream)
+    listener = Listener(sample_rate=RATE, voice_gate_enabled=False, **listener_kwargs)
+    listener.set_low_power(low_power)
+    queue: Queue = Queue(maxsize=3)
+
+    thread = listener.listen(utterance_queue=queue, stop_event=stop_event)
+    thread.join(5.0)
+    assert not thread.is_alive()
+    return listener, streams[0], [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+# 1 s of quiet calibration, 3 s of quiet, 1 s of "speech", then 2 s of quiet.
+SESSION = [(0.001, 1.0), (0.001, 3.0), (0.2, 1.0), (0.001, 2.0)]
+
+
+class TestLowPowerListening:
+    def test_idle_reads_use_long_blocks(self, monkeypatch):
+        listener, stream, _ = run_listener(monkeypatch, SESSION, low_power=True)
+
+        idle_block = int(RATE * listener.low_power_block_duration)
+        chunk = int(RATE * listener.chunk_duration)
+        assert stream.reads.count(idle_block) == 6 + 1 + 1
+        # Full rate only for calibration and the rest of the promoted capture
+        # (0.5 s of speech plus the 1.5 s silence tail).
+        assert stream.reads.count(chunk) == 10 + 5 + 15
+
+    def test_full_rate_when_awake(self, monkeypatch):
+        listener, stream, _ = run_listener(monkeypatch, SESSION, low_power=False)
+
+        chunk = int(RATE * listener.chunk_duration)
+        assert set(stream.reads) == {chunk}
+
+    def test_candidate_is_captured_with_preroll(self, monkeypatch):
+        _, _, utterances = run_listener(monkeypatch, SESSION, low_power=True)
+        _, _, awake_utterances = run_listener(monkeypatch, SESSION, low_power=False)
+
+        assert len(utterances) == 1
+        speech = np.abs(utterances[0].samples) >= 0.1
+        # The whole loud second is kept, preceded by quiet pre-roll.
+        assert int(speech.sum()) == RATE
+        assert not speech[0]
+        assert utterances[0].frames > awake_utterances[0].frames
+
+
+class TestAdaptiveThreshold:
+    def test_threshold_follows_a_louder_background(self, monkeypatch):
+        # Calibrate in a quiet room, then a fan turns on for 12 s.
+        listener, _, _ = run_listener(monkeypatch, [(0.001, 1.0), (0.01, 12.0)], low_power=False)
+
+        assert listener.get_last_threshold() == pytest.approx(0.03)
+        history = listener.get_noise_floor_history()
+        assert history[0].floor == pytest.approx(0.001)
+        assert history[-1].floor == pytest.approx(0.01)
+
+    def test_fixed_threshold_when_disabled(self, monkeypatch):
+        stop_event = Event()
+        monkeypatch.setattr(
+            listener_module.sd,
+            "InputStream",
+            lambda **kwargs: ScriptedInputStream([(0.001, 1.0), (0.01, 12.0)], stop_event),
+        )
+        listener = Listener(sample_rate=RATE, voice_gate_enabled=False, adaptive_threshold=False)
+
+        listener.listen(utterance_queue=Queue(maxsize=3), stop_event=stop_event).join(5.0)
+
+        assert listener.get_last_threshold() == pytest.approx(0.003)
+        assert listener.get_noise_floor_history() == []
+
+
+class TestDenoise:
+    def test_captured_speech_keeps_its_length_with_less_noise(self, monkeypatch):
+        rng = np.random.default_rng(0)
+
+        def noise(seconds):
+            return (0.02 * rng.standard_normal(int(seconds * RATE))).astype(np.float32)
+
+        t = np.arange(RATE) / RATE
+        tone = (0.2 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+        session = [noise(1.0), noise(1.0), tone + noise(1.0), noise(2.0)]
+
+        _, _, [plain] = run_listener(monkeypatch, session)
+        _, _, [denoised] = run_listener(monkeypatch, session, denoise=True)
+
+        assert denoised.frames == plain.frames
+        # The trailing silence is noise only.
+        tail = slice(RATE + RATE // 10, None)
+        assert np.mean(denoised.samples[tail] ** 2) < 0.25 * np.mean(plain.samples[tail] ** 2)
+
+
+class TestDeviceSampleRate:
+    @pytest.mark.parametrize("device_rate", [48_000, 44_100])
+    def test_stream_opens_at_the_device_rate(self, monkeypatch, device_rate):
+        listener, stream, [utterance] = run_listener(monkeypatch, SESSION, device_sample_rate=device_rate)
+
+        assert stream.samplerate == device_rate
+        assert set(stream.reads) == {int(device_rate * listener.chunk_duration)}
+        assert utterance.sample_rate == RATE
+        speech = np.abs(utterance.samples) >= 0.1
+        assert int(speech.sum()) == pytest.approx(RATE, abs=RATE // 100)
+
+    def test_low_power_candidate_is_resampled(self, monkeypatch):
+        _, stream, [utterance] = run_listener(monkeypatch, SESSION, low_power=True, device_sample_rate=48_000)
+
+        assert 24_000 in stream.reads  # 0.5 s idle blocks at 48 kHz
+        assert utterance.sample_rate == RATE
+        speech = np.abs(utterance.samples) >= 0.1
+        assert int(speech.sum()) == pytest.approx(RATE, abs=RATE // 100)
+        assert not speech[0]
+
+    def test_native_rate_comes_from_the_default_device(self, monkeypatch):
+        monkeypatch.setattr(
+            listener_module,
+            "default_sample_rate",
+            lambda kind, *, device=None, fallback: 48_000 if kind == "input" else fallback,
+        )
+
+        _, stream, [utterance] = run_listener(monkeypatch, SESSION, native_sample_rate=True)
+
+        assert stream.samplerate == 48_000
+        assert utterance.sample_rate == RATE
+
+
+class UnpluggedInputStream(ScriptedInputStream):
+    """Fails like a disconnected device after ``fail_after`` reads."""
+
+    def __init__(self, *args, fail_after: int, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._fail_after = fail_after
+
+    def read(self, frames: int):
+        if len(self.reads) >= self._fail_after:
+            raise sounddevice.PortAudioError("Stream is stopped")
+        return super().read(frames)
+
+
+class TestStreamRecovery:
+    def test_reopens_without_recalibrating(self, monkeypatch):
+        stop_event = Event()
+        opened: list[ScriptedInputStream] = []
+        attempts: list[dict] = []
+
+        def input_stream(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                # Calibration, then 1 s of quiet before the headset is unplugged.
+                opened.append(UnpluggedInputStream([(0.001, 5.0)], stop_event, fail_after=20, **kwargs))
+            elif len(attempts) == 2:
+                raise sounddevice.PortAudioError("Device unavailable")
+            else:
+                opened.append(ScriptedInputStream(SESSION[1:], stop_event, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(listener_module.sd, "InputStream", input_stream)
+        monkeypatch.setattr(stream_supervisor_module, "rescan_devices", lambda: True)
+        lines: list[str] = []
+        calibrations: list[float] = []
+        listener = Listener(sample_rate=RATE, voice_gate_enabled=False, logger=Logger(on_emit=lines.append))
+        listener._supervisor.backoff_base = 0.01
+        queue: Queue = Queue(maxsize=3)
+
+        thread = listener.listen(utterance_queue=queue, stop_event=stop_event, on_calibration_end=calibrations.append)
+        thread.join(5.0)
+
+        assert not thread.is_alive()
+        assert len(attempts) == 3
+        assert calibrations == [pytest.approx(0.003)]
+        assert queue.qsize() == 1
+        assert any("input stream recovered after" in line and "2 failure(s)" in line for line in lines)
+
+    def test_calibration_cut_off_by_unplugging_is_closed_and_rerun(self, monkeypatch):
+        stop_event = Event()
+        attempts: list[dict] = []
+
+        def input_stream(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                # Unplugged 0.3 s into the 1 s calibration.
+                return UnpluggedInputStream(SESSION, stop_event, fail_after=3, **kwargs)
+            return ScriptedInputStream(SESSION, stop_event, **kwargs)
+
+        monkeypatch.setattr(listener_module.sd, "InputStream", input_stream)
+        monkeypatch.setattr(stream_supervisor_module, "rescan_devices", lambda: True)
+        events: list[str] = []
+        listener = Listener(sample_rate=RATE, voice_gate_enabled=False)
+        listener._supervisor.backoff_base = 0.01
+
+        thread = listener.listen(
+            utterance_queue=Queue(maxsize=3),
+            stop_event=stop_event,
+            on_calibration_start=lambda: events.append("start"),
+            on_calibration_end=lambda threshold: events.append("end"),
+            on_calibration_error=lambda error: events.append("error"),
+        )
+        thread.join(5.0)
+
+        assert not thread.is_alive()
+        assert len(attempts) == 2
+        assert events == ["start", "error", "start", "end"]
+        assert listener.get_last_threshold() == pytest.approx(0.003)
@@ -0,0 +1,70 @@
+"""Unit tests for the minimum-statistics NoiseFloorTracker."""
+
+import pytest
+
+from app.infrastructure.audio.noise_floor import NoiseFloorTracker
+
+CHUNK = 0.1
+
+
+def feed(tracker: NoiseFloorTracker, level: float, seconds: float) -> float:
+    threshold = tracker.threshold
+    for _ in range(round(seconds / CHUNK)):
+        threshold = tracker.update(level, CHUNK)
+    return threshold
+
+
+class TestNoiseFloorTracker:
+    def test_reset_seeds_floor_and_threshold(self):
+        tracker = NoiseFloorTracker(multiplier=3.0)
+
+        assert tracker.reset(0.01) == pytest.approx(0.03)
+        assert tracker.floor == pytest.approx(0.01)
+
+    def test_louder_background_is_picked_up_after_one_window(self):
+        tracker = NoiseFloorTracker(window=4.0, subwindows=4)
+        tracker.reset(0.01)
+
+        assert feed(tracker, 0.05, 2.0) == pytest.approx(0.03)
+        assert feed(tracker, 0.05, 2.5) == pytest.approx(0.15)
+
+    def test_quieter_background_is_picked_up_immediately(self):
+        tracker = NoiseFloorTracker()
+        tracker.reset(0.05)
+
+        assert tracker.update(0.01, CHUNK) == pytest.approx(0.03)
+
+    def test_speech_bursts_do_not_raise_the_floor(self):
+        tracker = NoiseFloorTracker(window=4.0, subwindows=4)
+        tracker.reset(0.01)
+
+        for _ in range(5):
+            feed(tracker, 0.2, 2.0)  # talking
+            feed(tracker, 0.01, 0.5)  # pause
+
+        assert tracker.floor == pytest.approx(0.01)
+
+    def test_floor_never_drops_below_minimum(self):
+        tracker = NoiseFloorTracker(min_floor=1e-4)
+        tracker.reset(0.01)
+
+        tracker.update(0.0, CHUNK)
+
+        assert tracker.floor == pytest.approx(1e-4)
+
+    def test_history_has_one_sample_per_subwindow(self):
+        now = iter(range(1000))
+        tracker = NoiseFloorTracker(window=4.0, subwindows=4, history_size=3, clock=lambda: next(now))
+        tracker.reset(0.01)
+
+        feed(tracker, 0.02, 5.0)
+
+        history = tracker.history()
+        assert len(history) == 3
+        assert [sample.at for sample in history] == [3, 4, 5]
+        assert history[-1].floor == pytest.approx(0.02)
+        assert history[-1].threshold == pytest.approx(0.06)
+
+    def test_rejects_empty_window(self):
+        with pytest.raises(ValueError):
+            NoiseFloorTracker(window=0)
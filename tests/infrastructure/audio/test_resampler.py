@@ -0,0 +1,58 @@
+"""Unit tests for the streaming polyphase resampler."""
+
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from app.infrastructure.audio.resampler import StreamingResampler
+
+
+def stream(resampler: StreamingResampler, audio: np.ndarray, chunk: int) -> np.ndarray:
+    parts = [resampler.process(audio[i : i + chunk]) for i in range(0, len(audio), chunk)]
+    return np.concatenate([*parts, resampler.flush()])
+
+
+def dominant_frequency(audio: np.ndarray, rate: int) -> float:
+    spectrum = np.abs(np.fft.rfft(audio * np.hanning(len(audio))))
+    return float(np.fft.rfftfreq(len(audio), 1 / rate)[np.argmax(spectrum)])
+
+
+@pytest.mark.parametrize(
+    ("from_rate", "to_rate", "chunk"),
+    [(48_000, 16_000, 4800), (44_100, 16_000, 4410), (24_000, 48_000, 1024), (24_000, 44_100, 1000)],
+)
+class TestStreamingResampler:
+    def test_chunked_stream_matches_whole_signal(self, from_rate, to_rate, chunk):
+        rng = np.random.default_rng(0)
+        audio = (0.1 * rng.standard_normal(from_rate + 123)).astype(np.float32)
+
+        out = stream(StreamingResampler(from_rate, to_rate), audio, chunk)
+
+        expected = resample_poly(audio, to_rate, from_rate)
+        assert out.shape == expected.shape
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+
+    def test_tone_keeps_its_pitch(self, from_rate, to_rate, chunk):
+        t = np.arange(from_rate) / from_rate
+        tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+        out = stream(StreamingResampler(from_rate, to_rate), tone, chunk)
+
+        assert len(out) == to_rate
+        assert dominant_frequency(out, to_rate) == pytest.approx(440, abs=2)
+
+
+class TestCarryOver:
+    def test_partial_input_waits_for_a_whole_step(self):
+        resampler = StreamingResampler(48_000, 16_000)
+
+        assert len(resampler.process(np.zeros(2, dtype=np.float32))) == 0
+        assert len(resampler.flush()) == 1
+
+    def test_same_rate_passes_through(self):
+        audio = np.arange(10, dtype=np.float32)
+        resampler = StreamingResampler(16_000, 16_000)
+
+        assert resampler.is_identity
+        np.testing.assert_array_equal(resampler.process(audio), audio)
+        assert len(resampler.flush()) == 0
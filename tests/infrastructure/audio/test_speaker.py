@@ -0,0 +1,111 @@
+"""Unit tests for the Speaker, with a recording output stream."""
+
+import numpy as np
+import pytest
+
+try:
+    import sounddevice
+except (ImportError, OSError):  # Not installed, or the PortAudio library is missing.
+    pytest.skip("sounddevice is not available", allow_module_level=True)
+
+from app.application.audio_buffer import AudioBuffer  # noqa: E402
+from app.infrastructure.audio import speaker as speaker_module  # noqa: E402
+from app.infrastructure.audio import stream_supervisor as stream_supervisor_module  # noqa: E402
+from app.infrastructure.audio.speaker import Speaker  # noqa: E402
+
+
+class RecordingOutputStream:
+    def __init__(self, *, samplerate: int, fail_after: int | None = None, **kwargs) -> None:
+        self.samplerate = samplerate
+        self.written: list[np.ndarray] = []
+        self._fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def write(self, chunk: np.ndarray) -> None:
+        if self._fail_after is not None and len(self.written) >= self._fail_after:
+            raise sounddevice.PortAudioError("Device unavailable")
+        assert chunk.ndim == 2
+        self.written.append(chunk[:, 0].copy())
+
+
+@pytest.fixture
+def streams(monkeypatch) -> list[RecordingOutputStream]:
+    opened: list[RecordingOutputStream] = []
+
+    def output_stream(**kwargs):
+        opened.append(RecordingOutputStream(**kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(speaker_module.sd, "OutputStream", output_stream)
+    monkeypatch.setattr(speaker_module.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(stream_supervisor_module, "sleep", lambda seconds: None)
+    monkeypatch.setattr(stream_supervisor_module, "rescan_devices", lambda: True)
+    return opened
+
+
+def tone(rate: int, seconds: float = 1.0) -> AudioBuffer:
+    t = np.arange(int(rate * seconds)) / rate
+    return AudioBuffer((0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), sample_rate=rate)
+
+
+class TestSpeaker:
+    def test_matching_rate_is_played_unchanged(self, streams):
+        audio = tone(24_000)
+
+        assert Speaker(sample_rate=24_000).speak(audio)
+
+        [stream] = streams
+        assert stream.samplerate == 24_000
+        np.testing.assert_array_equal(np.concatenate(stream.written), audio.samples)
+
+    def test_other_rates_are_resampled_to_the_device_rate(self, streams):
+        audio = tone(24_000)
+
+        assert Speaker(sample_rate=24_000, device_sample_rate=48_000).speak(audio)
+
+        [stream] = streams
+        assert stream.samplerate == 48_000
+        played = np.concatenate(stream.written)
+        assert len(played) == 48_000
+        spectrum = np.abs(np.fft.rfft(played * np.hanning(len(played))))
+        assert np.fft.rfftfreq(len(played), 1 / 48_000)[np.argmax(spectrum)] == pytest.approx(440, abs=2)
+
+    def test_multichannel_audio_is_rejected(self, streams):
+        audio = AudioBuffer(np.zeros((100, 2), dtype=np.float32), sample_rate=24_000)
+
+        with pytest.raises(ValueError, match="mono"):
+            Speaker().speak(audio)
+        assert streams == []
+
+
+class TestStreamRecovery:
+    def test_playback_resumes_on_a_reopened_stream(self, monkeypatch, streams):
+        def output_stream(**kwargs):
+            # The first stream dies after three chunks, as if the headset was unplugged.
+            streams.append(RecordingOutputStream(fail_after=None if streams else 3, **kwargs))
+            return streams[-1]
+
+        monkeypatch.setattr(speaker_module.sd, "OutputStream", output_stream)
+        audio = tone(24_000)
+
+        assert Speaker(sample_rate=24_000).speak(audio)
+
+        assert len(streams) == 2
+        played = np.concatenate([*streams[0].written, *streams[1].written])
+        np.testing.assert_array_equal(played, audio.samples)
+
+    def test_gives_up_after_the_retries(self, monkeypatch, streams):
+        def unavailable(**kwargs):
+            streams.append(RecordingOutputStream(fail_after=0, **kwargs))
+            return streams[-1]
+
+        monkeypatch.setattr(speaker_module.sd, "OutputStream", unavailable)
+
+        with pytest.raises(OSError, match="Device unavailable"):
+            Speaker(max_stream_retries=2).speak(tone(24_000))
+        assert len(streams) == 3
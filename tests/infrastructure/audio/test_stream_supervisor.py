@@ -0,0 +1,120 @@
+"""Unit tests for audio device selection and stream recovery pacing."""
+
+from threading import Event
+
+import pytest
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):  # Not installed, or the PortAudio library is missing.
+    pytest.skip("sounddevice is not available", allow_module_level=True)
+
+from app.infrastructure.audio import devices  # noqa: E402
+from app.infrastructure.audio import stream_supervisor as supervisor_module  # noqa: E402
+from app.infrastructure.audio.stream_supervisor import StreamSupervisor  # noqa: E402
+from app.utils.logger import Logger  # noqa: E402
+
+DEVICES = [
+    {"index": 0, "name": "Built-in Microphone", "max_input_channels": 1, "max_output_channels": 0},
+    {"index": 1, "name": "Built-in Output", "max_input_channels": 0, "max_output_channels": 2},
+    {"index": 2, "name": "USB Headset", "max_input_channels": 1, "max_output_channels": 2},
+]
+
+
+@pytest.fixture
+def present(monkeypatch) -> list[dict]:
+    listed = list(DEVICES)
+    monkeypatch.setattr(devices.sd, "query_devices", lambda *args, **kwargs: listed)
+    return listed
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFindDevice:
+    def test_matches_index_or_name(self, present):
+        assert devices.find_device("input", "usb headset") == 2
+        assert devices.find_device("output", 1) == 1
+        assert devices.find_device("input", None) is None
+
+    def test_direction_must_match(self, present):
+        assert devices.find_device("input", "Built-in Output") is None
+        assert devices.find_device("output", 0) is None
+
+
+class TestRescanDevices:
+    def test_reinitializes_portaudio(self, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(devices.sd, "_terminate", lambda: calls.append("terminate"), raising=False)
+        monkeypatch.setattr(devices.sd, "_initialize", lambda: calls.append("initialize"), raising=False)
+
+        assert devices.rescan_devices()
+        assert calls == ["terminate", "initialize"]
+
+    def test_skipped_while_a_stream_is_open(self, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(devices.sd, "_terminate", lambda: calls.append("terminate"), raising=False)
+        monkeypatch.setattr(devices.sd, "_initialize", lambda: calls.append("initialize"), raising=False)
+
+        with devices.stream_in_use():
+            assert not devices.rescan_devices()
+        assert calls == []
+
+    def test_no_rescan_without_the_private_api(self, monkeypatch):
+        monkeypatch.delattr(devices.sd, "_terminate", raising=False)
+        monkeypatch.delattr(devices.sd, "_initialize", raising=False)
+
+        assert not devices.rescan_devices()
+
+
+class TestStreamSupervisor:
+    @pytest.fixture(autouse=True)
+    def no_rescan(self, monkeypatch):
+        self.rescans = 0
+
+        def rescan() -> bool:
+            self.rescans += 1
+            return True
+
+        monkeypatch.setattr(supervisor_module, "rescan_devices", rescan)
+
+    def test_falls_back_to_default_while_device_is_missing(self, present):
+        lines: list[str] = []
+        supervisor = StreamSupervisor(kind="input", device="USB", logger=Logger(on_emit=lines.append))
+
+        assert supervisor.device() == 2
+        present.pop()
+        assert supervisor.device() is None
+        assert supervisor.device() is None
+        assert len([line for line in lines if "not found" in line]) == 1
+
+    def test_backoff_is_bounded_and_recovery_is_timed(self, monkeypatch, present):
+        clock = FakeClock()
+        delays: list[float] = []
+        monkeypatch.setattr(supervisor_module, "sleep", delays.append)
+        lines: list[str] = []
+        supervisor = StreamSupervisor(kind="input", logger=Logger(on_emit=lines.append), clock=clock)
+
+        for _ in range(6):
+            assert supervisor.wait_to_retry(OSError("unplugged"))
+            clock.now += 1.0
+
+        assert delays == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+        assert self.rescans == 6
+        assert supervisor.recovered() == pytest.approx(6.0)
+        assert supervisor.failures == 0
+        assert supervisor.recovered() is None
+        assert "recovered after 6.00s" in lines[-1]
+
+    def test_stop_interrupts_the_wait(self, present):
+        stop_event = Event()
+        stop_event.set()
+        supervisor = StreamSupervisor(kind="output", backoff_base=60.0)
+
+        assert not supervisor.wait_to_retry(OSError("unplugged"), stop_event)
+        assert self.rescans == 0
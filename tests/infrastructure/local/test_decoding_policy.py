@@ -0,0 +1,53 @@
+"""Unit tests for the local STT decoding policy layer."""
+
+from app.infrastructure.local.decoding_policy import (
+    FULL_POLICY,
+    SHORT_POLICY,
+    WAKE_POLICY,
+    DecodingPolicySelector,
+    DecodingPolicyStats,
+)
+
+
+class TestDecodingPolicySelector:
+    def test_asleep_uses_wake_policy(self):
+        selector = DecodingPolicySelector(short_clip_seconds=1.5)
+        assert selector.select(duration=5.0, is_awake=False) is WAKE_POLICY
+
+    def test_short_clip_uses_greedy(self):
+        selector = DecodingPolicySelector(short_clip_seconds=1.5)
+        policy = selector.select(duration=1.0, is_awake=True)
+        assert policy is SHORT_POLICY
+        assert policy.beam_size == 1
+
+    def test_long_clip_uses_full_policy(self):
+        selector = DecodingPolicySelector(short_clip_seconds=1.5)
+        policy = selector.select(duration=4.0, is_awake=True)
+        assert policy is FULL_POLICY
+        assert policy.beam_size == 5
+
+    def test_zero_threshold_disables_adaptation(self):
+        selector = DecodingPolicySelector(short_clip_seconds=0)
+        assert not selector.enabled
+        assert selector.select(duration=0.5, is_awake=False) is FULL_POLICY
+
+
+class TestDecodingPolicyStats:
+    def test_summary_reports_mean_latency_and_logprob(self):
+        stats = DecodingPolicyStats()
+        stats.record(SHORT_POLICY, latency=0.1, audio_seconds=1.0, avg_logprob=-0.2)
+        count = stats.record(SHORT_POLICY, latency=0.3, audio_seconds=1.0, avg_logprob=-0.4)
+
+        summary = stats.summary(SHORT_POLICY)
+
+        assert count == 2
+        assert "policy=short" in summary
+        assert "n=2" in summary
+        assert "mean_latency=200ms" in summary
+        assert "rtf=0.20" in summary
+        assert "mean_avg_logprob=-0.300" in summary
+
+    def test_summary_without_scores(self):
+        stats = DecodingPolicyStats()
+        stats.record(FULL_POLICY, latency=0.5, audio_seconds=2.0, avg_logprob=None)
+        assert "mean_avg_logprob=n/a" in stats.summary(FULL_POLICY)
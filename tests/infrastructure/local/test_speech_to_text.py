@@ -0,0 +1,208 @@
+"""Unit tests for local faster-whisper STT implementation."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.application.audio_buffer import AudioBuffer
+from app.application.errors import SpeechToTextError
+from app.application.port.resident_model import ModelResidency
+
+
+@pytest.fixture(autouse=True)
+def mock_faster_whisper(monkeypatch):
+    """faster-whisper が未インストールの環境でもテストできるよう sys.modules にモックを差し込む。"""
+    mock = MagicMock()
+    monkeypatch.setitem(sys.modules, "faster_whisper", mock)
+    sys.modules.pop("app.infrastructure.local.speech_to_text", None)
+    yield mock
+    sys.modules.pop("app.infrastructure.local.speech_to_text", None)
+
+
+def make_sut(**kwargs):
+    from app.infrastructure.local.speech_to_text import SpeechToText
+    return SpeechToText(device="cpu", compute_type="int8", **kwargs)
+
+
+def segment(text: str, start: float) -> SimpleNamespace:
+    return SimpleNamespace(text=text, start=start)
+
+
+def audio(seconds: float, sample_rate: int = 16_000) -> AudioBuffer:
+    return AudioBuffer(np.full(int(seconds * sample_rate), 0.1, dtype=np.float32), sample_rate=sample_rate)
+
+
+class TestTranscribe:
+    def test_joins_segments(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([segment(" Hello", 0.0), segment(" world ", 0.5)], None)
+
+        assert sut.transcribe(audio(1.0)) == "Hello world"
+
+    def test_passes_listener_audio_without_copy(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([], None)
+        buffer = audio(0.5)
+
+        sut.transcribe(buffer)
+
+        passed = sut._model.transcribe.call_args.args[0]
+        assert np.shares_memory(passed, buffer.samples)
+
+    def test_rejects_wrong_sample_rate(self, mock_faster_whisper):
+        sut = make_sut()
+
+        with pytest.raises(SpeechToTextError, match="16000 Hz"):
+            sut.transcribe(audio(0.5, sample_rate=48_000))
+
+
+class TestDecodingPolicy:
+    def test_short_clip_is_decoded_greedily(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([], None)
+
+        sut.transcribe(audio(1.0))
+
+        assert sut._model.transcribe.call_args.kwargs["beam_size"] == 1
+
+    def test_long_clip_uses_beam_search(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([], None)
+
+        sut.transcribe(audio(3.0))
+
+        assert sut._model.transcribe.call_args.kwargs["beam_size"] == 5
+
+    def test_fast_model_handles_wake_word_while_asleep(self, mock_faster_whisper):
+        main_model, fast_model = MagicMock(), MagicMock()
+        mock_faster_whisper.WhisperModel.side_effect = [main_model, fast_model]
+        fast_model.transcribe.return_value = ([segment(" buddy", 0.0)], None)
+        sut = make_sut(fast_model="tiny.en")
+        sut.is_awake = lambda: False
+
+        assert sut.transcribe(audio(3.0)) == "buddy"
+        main_model.transcribe.assert_not_called()
+        assert mock_faster_whisper.WhisperModel.call_args.args[0] == "tiny.en"
+
+    def test_fast_model_load_failure_falls_back_to_main_model(self, mock_faster_whisper):
+        main_model = MagicMock()
+        main_model.transcribe.return_value = ([segment(" yes", 0.0)], None)
+        mock_faster_whisper.WhisperModel.side_effect = [main_model, RuntimeError("no such model")]
+        sut = make_sut(fast_model="missing")
+
+        assert sut.transcribe(audio(0.5)) == "yes"
+        assert sut.transcribe(audio(0.5)) == "yes"
+        assert mock_faster_whisper.WhisperModel.call_count == 2
+
+
+class TestTranscribeBatch:
+    def test_maps_segments_back_to_utterances(self, mock_faster_whisper):
+        sut = make_sut()
+        pipeline = mock_faster_whisper.BatchedInferencePipeline.return_value
+        # Utterances: [0.0, 2.0), [2.0, 4.5), [4.5, 7.5)
+        pipeline.transcribe.return_value = (
+            [
+                segment(" first", 0.0),
+                segment(" second", 1.9995),
+                segment(" third", 4.5),
+                segment(" third again", 6.0),
+            ],
+            None,
+        )
+
+        texts = sut.transcribe_batch([audio(2.0), audio(2.5), audio(3.0)])
+
+        assert texts == ["first", "second", "third third again"]
+        kwargs = pipeline.transcribe.call_args.kwargs
+        assert kwargs["batch_size"] == 3
+        assert kwargs["beam_size"] == 5
+        assert kwargs["clip_timestamps"] == [
+            {"start": 0.0, "end": 2.0},
+            {"start": 2.0, "end": 4.5},
+            {"start": 4.5, "end": 7.5},
+        ]
+
+    def test_empty_utterance_yields_empty_text(self, mock_faster_whisper):
+        sut = make_sut()
+        pipeline = mock_faster_whisper.BatchedInferencePipeline.return_value
+        pipeline.transcribe.return_value = ([segment(" one", 0.0), segment(" two", 2.0)], None)
+
+        texts = sut.transcribe_batch([audio(0.0), audio(2.0), audio(2.0)])
+
+        assert texts == ["", "one", "two"]
+
+    def test_short_clips_keep_their_greedy_policy(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([segment(" yes", 0.0)], None)
+        pipeline = mock_faster_whisper.BatchedInferencePipeline.return_value
+        pipeline.transcribe.return_value = ([segment(" long", 0.0), segment(" longer", 2.0)], None)
+
+        texts = sut.transcribe_batch([audio(2.0), audio(0.5), audio(3.0)])
+
+        assert texts == ["long", "yes", "longer"]
+        assert sut._model.transcribe.call_args.kwargs["beam_size"] == 1
+        assert pipeline.transcribe.call_args.kwargs["batch_size"] == 2
+
+    def test_wake_word_checks_are_not_batched(self, mock_faster_whisper):
+        main_model, fast_model = MagicMock(), MagicMock()
+        mock_faster_whisper.WhisperModel.side_effect = [main_model, fast_model]
+        fast_model.transcribe.return_value = ([segment(" buddy", 0.0)], None)
+        sut = make_sut(fast_model="tiny.en")
+        sut.is_awake = lambda: False
+
+        assert sut.transcribe_batch([audio(3.0), audio(3.0)]) == ["buddy", "buddy"]
+        mock_faster_whisper.BatchedInferencePipeline.assert_not_called()
+        main_model.transcribe.assert_not_called()
+        assert fast_model.transcribe.call_args.kwargs["beam_size"] == 1
+
+    def test_single_utterance_uses_regular_transcribe(self, mock_faster_whisper):
+        sut = make_sut()
+        sut._model.transcribe.return_value = ([segment(" solo", 0.0)], None)
+
+        assert sut.transcribe_batch([audio(1.0)]) == ["solo"]
+        mock_faster_whisper.BatchedInferencePipeline.assert_not_called()
+
+    def test_wraps_pipeline_errors(self, mock_faster_whisper):
+        sut = make_sut()
+        pipeline = mock_faster_whisper.BatchedInferencePipeline.return_value
+        pipeline.transcribe.side_effect = RuntimeError("decode failed")
+
+        with pytest.raises(SpeechToTextError, match="decode failed"):
+            sut.transcribe_batch([audio(2.0), audio(2.0)])
+
+
+class TestResidency:
+    def test_release_drops_model_and_transcribe_reloads(self, mock_faster_whisper):
+        sut = make_sut()
+        sut.set_residency(ModelResidency.RELEASED)
+        assert sut._model is None
+        assert sut.residency == ModelResidency.RELEASED
+
+        reloaded = MagicMock()
+        reloaded.transcribe.return_value = ([segment(" back", 0.0)], None)
+        mock_faster_whisper.WhisperModel.return_value = reloaded
+
+        assert sut.transcribe(audio(3.0)) == "back"
+        assert sut.residency == ModelResidency.FULL
+
+    def test_reduce_without_fast_model_reloads_as_int8(self, mock_faster_whisper):
+        sut = make_sut()
+        sut.set_residency(ModelResidency.REDUCED)
+
+        assert mock_faster_whisper.WhisperModel.call_args.kwargs["compute_type"] == "int8"
+        assert sut._model is not None
+
+    def test_reduce_with_fast_model_keeps_only_fast_model(self, mock_faster_whisper):
+        main_model, fast_model = MagicMock(), MagicMock()
+        mock_faster_whisper.WhisperModel.side_effect = [main_model, fast_model]
+        fast_model.transcribe.return_value = ([segment(" buddy", 0.0)], None)
+        sut = make_sut(fast_model="tiny.en")
+
+        sut.set_residency(ModelResidency.REDUCED)
+
+        assert sut._model is None
+        # Long clips are answered by the fast model instead of blocking on a reload.
+        assert sut.transcribe(audio(3.0)) == "buddy"
@@ -29,12 +29,14 @@ def make_sut(voice: str = "af_heart", lang_code: str = "a"):
 
 class TestSynthesize:
     def test_returns_float32_array(self, mock_kokoro):
-        """synthesize() は float32 の np.ndarray を返す。"""
+        """synthesize() は 24 kHz の float32 音声を返す。"""
         sut = make_sut()
         sut._pipeline.return_value = [("", "", np.array([0.1, 0.2, 0.3], dtype=np.float32))]
 
-        result = sut.synthesize("Hello")
+        buffer = sut.synthesize("Hello")
+        result = buffer.samples
 
+        assert buffer.sample_rate == 24_000
         assert isinstance(result, np.ndarray)
         assert result.dtype == np.float32
 
@@ -46,7 +48,7 @@ class TestSynthesize:
             ("", "", np.array([0.3, 0.4], dtype=np.float32)),
         ]
 
-        result = sut.synthesize("Hello world")
+        result = sut.synthesize("Hello world").samples
 
         np.testing.assert_array_almost_equal(result, [0.1, 0.2, 0.3, 0.4])
 
@@ -64,7 +66,7 @@ class TestSynthesize:
         sut = make_sut()
         sut._pipeline.return_value = []
 
-        result = sut.synthesize("Hello")
+        result = sut.synthesize("Hello").samples
 
         assert len(result) == 0
         assert result.dtype == np.float32
@@ -94,3 +96,28 @@ class TestInit:
                 from app.infrastructure.local.text_to_speech import TextToSpeech
                 TextToSpeech()
             assert "uv sync --extra local-tts" in str(exc_info.value)
+
+
+class TestResidency:
+    def test_release_and_lazy_reload(self, mock_kokoro):
+        from app.application.port.resident_model import ModelResidency
+
+        sut = make_sut()
+        sut.set_residency(ModelResidency.RELEASED)
+        assert sut.residency == ModelResidency.RELEASED
+
+        mock_kokoro.KPipeline.return_value.return_value = [
+            ("", "", np.array([0.5], dtype=np.float32))
+        ]
+        result = sut.synthesize("Hello").samples
+
+        np.testing.assert_array_almost_equal(result, [0.5])
+        assert sut.residency == ModelResidency.FULL
+        assert mock_kokoro.KPipeline.call_count == 2
+
+    def test_reduced_is_treated_as_released(self, mock_kokoro):
+        from app.application.port.resident_model import ModelResidency
+
+        sut = make_sut()
+        sut.set_residency(ModelResidency.REDUCED)
+        assert sut.residency == ModelResidency.RELEASED
@@ -0,0 +1,59 @@
+"""Unit tests for MemmapVectorIndex."""
+
+import numpy as np
+import pytest
+
+from app.domain.vo.turn import Turn
+from app.infrastructure.local.vector_index import MemmapVectorIndex
+
+
+def turn(i: int) -> Turn:
+    return Turn(user_utterance=f"User {i}", assistant_reply=f"Bot {i}")
+
+
+class TestMemmapVectorIndex:
+    def test_search_returns_most_similar_first(self, tmp_path):
+        index = MemmapVectorIndex(tmp_path)
+        index.add([turn(0), turn(1), turn(2)], np.array([[1, 0], [0, 1], [1, 1]], dtype=np.float32))
+
+        hits = index.search(np.array([1.0, 0.1]), k=2)
+
+        assert [t for _, t in hits] == [turn(0), turn(2)]
+        assert hits[0][0] == pytest.approx(1 / np.hypot(1, 0.1))
+
+    def test_index_survives_reopen_and_keeps_appending(self, tmp_path):
+        index = MemmapVectorIndex(tmp_path)
+        index.add([turn(0)], np.array([[1, 0]], dtype=np.float32))
+        index.close()
+
+        reopened = MemmapVectorIndex(tmp_path)
+        reopened.add([turn(1)], np.array([[0, 2]], dtype=np.float32))
+
+        assert len(reopened) == 2
+        assert reopened.search(np.array([0.0, 1.0]), k=1)[0][1] == turn(1)
+        assert reopened.search(np.array([1.0, 0.0]), k=1)[0][1] == turn(0)
+
+    def test_interrupted_append_is_dropped_on_open(self, tmp_path):
+        index = MemmapVectorIndex(tmp_path)
+        index.add([turn(0), turn(1)], np.eye(2, dtype=np.float32))
+        # Simulate a crash after the vector was written but before its turn.
+        with open(tmp_path / "vectors.f32", "ab") as f:
+            f.write(np.ones(2, dtype=np.float32).tobytes())
+        with open(tmp_path / "turns.jsonl", "ab") as f:
+            f.write(b'{"user": "half')
+
+        reopened = MemmapVectorIndex(tmp_path)
+        reopened.add([turn(2)], np.array([[1, 1]], dtype=np.float32))
+
+        assert len(reopened) == 3
+        assert reopened.search(np.array([1.0, 1.0]), k=1)[0][1] == turn(2)
+
+    def test_dimension_mismatch_is_rejected(self, tmp_path):
+        index = MemmapVectorIndex(tmp_path)
+        index.add([turn(0)], np.ones((1, 3), dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            index.add([turn(1)], np.ones((1, 4), dtype=np.float32))
+
+    def test_empty_index_returns_nothing(self, tmp_path):
+        assert MemmapVectorIndex(tmp_path).search(np.ones(3), k=3) == []
@@ -0,0 +1,33 @@
+"""Unit tests for the OpenAI Embedder."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from openai import OpenAIError
+
+from app.application.errors import EmbeddingError
+from app.infrastructure.openai.embedder import Embedder
+
+
+class TestEmbedder:
+    def test_embeddings_are_returned_in_input_order(self, mock_openai_client):
+        mock_openai_client.embeddings.create.return_value = SimpleNamespace(
+            data=[
+                SimpleNamespace(index=1, embedding=[0.0, 1.0]),
+                SimpleNamespace(index=0, embedding=[1.0, 0.0]),
+            ]
+        )
+        embedder = Embedder(client=mock_openai_client, model="test-embed")
+
+        vectors = embedder.embed(["a", "b"])
+
+        mock_openai_client.embeddings.create.assert_called_once_with(model="test-embed", input=["a", "b"])
+        assert vectors.dtype == np.float32
+        np.testing.assert_array_equal(vectors, [[1.0, 0.0], [0.0, 1.0]])
+
+    def test_api_error_is_wrapped(self, mock_openai_client):
+        mock_openai_client.embeddings.create.side_effect = OpenAIError("down")
+
+        with pytest.raises(EmbeddingError):
+            Embedder(client=mock_openai_client).embed(["a"])
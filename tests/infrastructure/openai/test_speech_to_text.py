@@ -1,5 +1,6 @@
 """Unit tests for OpenAI SpeechToText."""
 
+import wave
 from unittest.mock import Mock
 
 import numpy as np
@@ -113,3 +114,20 @@ class TestSpeechToText:
         
         # Just verify it was called (WAV format encodes sample rate)
         assert mock_openai_client.audio.transcriptions.create.called
+
+    def test_transcribe_uploads_pcm16_wav(self, mock_openai_client):
+        """Test that the upload is a mono 16-bit WAV at the buffer's sample rate."""
+        mock_response = Mock()
+        mock_response.text = "Test"
+        mock_openai_client.audio.transcriptions.create.return_value = mock_response
+
+        stt = SpeechToText(client=mock_openai_client, sample_rate=48000)
+        stt.transcribe(np.full(480, 0.5, dtype=np.float32))
+
+        _, wav_buffer = mock_openai_client.audio.transcriptions.create.call_args.kwargs["file"]
+        with wave.open(wav_buffer, "rb") as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 2
+            assert wav.getframerate() == 48000
+            frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        np.testing.assert_array_equal(frames, np.full(480, 16383, dtype=np.int16))
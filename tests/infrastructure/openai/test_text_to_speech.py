@@ -25,9 +25,11 @@ class TestTextToSpeech:
         
         tts = TextToSpeech(client=mock_openai_client)
         
-        result = tts.synthesize("Hello world")
+        buffer = tts.synthesize("Hello world")
+        result = buffer.samples
         
-        # Should return float32 array normalized to [-1, 1]
+        # Should return float32 24 kHz audio normalized to [-1, 1]
+        assert buffer.sample_rate == 24_000
         assert isinstance(result, np.ndarray)
         assert result.dtype == np.float32
         assert len(result) == 4
@@ -96,7 +98,7 @@ class TestTextToSpeech:
         
         tts = TextToSpeech(client=mock_openai_client)
         
-        result = tts.synthesize("")
+        result = tts.synthesize("").samples
         
         # Should return empty array
         assert isinstance(result, np.ndarray)
@@ -114,7 +116,7 @@ class TestTextToSpeech:
         
         tts = TextToSpeech(client=mock_openai_client)
         
-        result = tts.synthesize("Test")
+        result = tts.synthesize("Test").samples
         
         # Check that values are approximately in range [-1, 1]
         # Allow small tolerance for floating point precision
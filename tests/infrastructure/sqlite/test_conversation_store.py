@@ -0,0 +1,113 @@
+"""Unit tests for SqliteConversationStore."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from app.domain.vo.turn import Turn
+from app.infrastructure.sqlite.conversation_store import SqliteConversationStore
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "history" / "buddy.sqlite3"
+
+
+class TestSqliteConversationStore:
+    def test_appended_turns_are_loaded_oldest_first(self, db_path):
+        store = SqliteConversationStore(db_path)
+        for i in range(5):
+            store.append_turn(Turn(user_utterance=f"User {i}", assistant_reply=f"Bot {i}"))
+
+        assert store.flush() is True
+        turns = store.load_recent(3)
+
+        assert [t.user_utterance for t in turns] == ["User 2", "User 3", "User 4"]
+        store.close()
+
+    def test_history_survives_reopen(self, db_path):
+        store = SqliteConversationStore(db_path, session_id="first")
+        store.append_turn(Turn(user_utterance="Hello", assistant_reply="Hi"))
+        store.close()
+
+        reopened = SqliteConversationStore(db_path, session_id="second")
+        assert reopened.load_recent(10) == [Turn(user_utterance="Hello", assistant_reply="Hi")]
+        reopened.close()
+
+    def test_uses_wal_and_records_session(self, db_path):
+        store = SqliteConversationStore(db_path, session_id="abc")
+        store.append_turn(Turn(user_utterance="Hello", assistant_reply="Hi"))
+        store.close()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("SELECT session_id FROM turns").fetchall() == [("abc",)]
+        finally:
+            conn.close()
+
+    def test_load_recent_non_positive_limit(self, db_path):
+        store = SqliteConversationStore(db_path)
+        assert store.load_recent(0) == []
+        store.close()
+
+    def test_append_after_close_is_ignored(self, db_path):
+        store = SqliteConversationStore(db_path)
+        store.close()
+        store.append_turn(Turn(user_utterance="late", assistant_reply="reply"))
+        assert store.flush() is True
+
+
+class TestSearch:
+    def test_finds_turns_by_word_prefix_best_first(self, db_path):
+        store = SqliteConversationStore(db_path)
+        store.append_turn(Turn(user_utterance="I travelled to Kyoto", assistant_reply="Nice trip!"))
+        store.append_turn(Turn(user_utterance="I like coffee", assistant_reply="Me too."))
+        store.append_turn(Turn(user_utterance="Travel travel travel", assistant_reply="Where to?"))
+        store.flush()
+
+        hits = store.search("trav")
+
+        assert [h.turn.user_utterance for h in hits] == ["Travel travel travel", "I travelled to Kyoto"]
+        assert "[" in hits[0].snippet
+        assert hits[0].session_id == store.session_id
+        store.close()
+
+    def test_all_words_must_match(self, db_path):
+        store = SqliteConversationStore(db_path)
+        store.append_turn(Turn(user_utterance="I went to Kyoto", assistant_reply="By train?"))
+        store.append_turn(Turn(user_utterance="I went to Osaka", assistant_reply="Fun!"))
+        store.flush()
+
+        assert [h.turn.user_utterance for h in store.search("went kyoto")] == ["I went to Kyoto"]
+        store.close()
+
+    def test_query_syntax_is_treated_as_text(self, db_path):
+        store = SqliteConversationStore(db_path)
+        store.append_turn(Turn(user_utterance="What does NEAR mean?", assistant_reply="Close by."))
+        store.flush()
+
+        assert len(store.search('near" (mean')) == 1
+        assert store.search("   ") == []
+        assert store.search('"*()') == []
+        store.close()
+
+    def test_indexes_turns_saved_before_the_index_existed(self, db_path):
+        db_path.parent.mkdir(parents=True)
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            "CREATE TABLE turns (id INTEGER PRIMARY KEY, session_id TEXT NOT NULL,"
+            " created_at REAL NOT NULL, user_utterance TEXT NOT NULL, assistant_reply TEXT NOT NULL);"
+            "INSERT INTO turns VALUES (1, 'old', 0, 'An old sentence', 'Indeed');"
+        )
+        conn.close()
+
+        store = SqliteConversationStore(db_path)
+        store.append_turn(Turn(user_utterance="A new sentence", assistant_reply="Yes"))
+        store.flush()
+
+        assert {h.session_id for h in store.search("sentence")} == {"old", store.session_id}
+        store.close()
@@ -0,0 +1,101 @@
+"""Unit tests for the headless (Qt-free) entry point."""
+
+import io
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.presentation.headless import ConsoleLogSink, HeadlessApp
+from app.utils.logger import Logger
+
+
+def make_runner(run=None) -> MagicMock:
+    runner = MagicMock()
+    runner.logger = Logger()
+    if run is not None:
+        runner.run.side_effect = run
+    return runner
+
+
+class TestConsoleLogSink:
+    def test_text_format_writes_plain_lines(self):
+        stream = io.StringIO()
+        sink = ConsoleLogSink(stream=stream)
+
+        sink("User: hello")
+
+        assert stream.getvalue() == "User: hello\n"
+
+    def test_jsonl_format_writes_one_object_per_line(self):
+        stream = io.StringIO()
+        sink = ConsoleLogSink(stream=stream, log_format="jsonl")
+
+        sink("Buddy: こんにちは")
+        sink.write("boom", event="error")
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records[0]["event"] == "log"
+        assert records[0]["message"] == "Buddy: こんにちは"
+        assert "ts" in records[0]
+        assert records[1]["event"] == "error"
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            ConsoleLogSink(stream=io.StringIO(), log_format="xml")
+
+
+class TestHeadlessApp:
+    def test_logger_is_routed_to_stream_with_replay(self):
+        stream = io.StringIO()
+        runner = make_runner()
+        runner.logger.log("buffered before start")
+
+        HeadlessApp(runner, stream=stream)
+        runner.logger.log("after start")
+
+        assert stream.getvalue().splitlines() == ["buffered before start", "after start"]
+
+    def test_request_stop_returns_and_calls_shutdown(self):
+        started = threading.Event()
+        stopped = threading.Event()
+        runner = make_runner(run=lambda: (started.set(), stopped.wait()))
+        runner.stop.side_effect = lambda *args: stopped.set()
+        on_shutdown = MagicMock()
+        app = HeadlessApp(runner, on_shutdown=on_shutdown, stream=io.StringIO())
+
+        threading.Thread(target=lambda: (started.wait(2), app.request_stop())).start()
+
+        assert app.run() == 0
+        on_shutdown.assert_called_once()
+
+    def test_runner_is_stopped_before_shutdown(self):
+        events: list[str] = []
+        stopped = threading.Event()
+
+        def run():
+            events.append("running")
+            stopped.wait()
+            events.append("runner returned")
+
+        runner = make_runner(run=run)
+        runner.stop.side_effect = lambda *args: (events.append("stop"), stopped.set())
+        app = HeadlessApp(runner, on_shutdown=lambda: events.append("shutdown"), stream=io.StringIO())
+
+        threading.Timer(0.1, app.request_stop).start()
+
+        assert app.run() == 0
+        assert events == ["running", "stop", "runner returned", "shutdown"]
+        assert not any(thread.name == "conversation-runner" for thread in threading.enumerate())
+
+    def test_runner_crash_exits_with_error(self):
+        stream = io.StringIO()
+
+        def crash():
+            raise RuntimeError("device lost")
+
+        app = HeadlessApp(make_runner(run=crash), stream=stream)
+
+        assert app.run() == 1
+        assert "Unexpected error: device lost" in stream.getvalue()
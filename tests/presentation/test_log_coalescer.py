@@ -0,0 +1,54 @@
+"""Unit tests for LogCoalescer."""
+
+import threading
+
+import pytest
+
+from app.presentation.log_coalescer import LogCoalescer
+
+
+class TestLogCoalescer:
+    def test_only_first_line_of_a_batch_requests_a_flush(self):
+        coalescer = LogCoalescer()
+
+        assert coalescer.add("a") is True
+        assert coalescer.add("b") is False
+        assert coalescer.drain() == ["a", "b"]
+
+        assert coalescer.add("c") is True
+
+    def test_drain_on_empty_returns_nothing(self):
+        assert LogCoalescer().drain() == []
+
+    def test_overflow_keeps_newest_lines_and_marks_skipped(self):
+        coalescer = LogCoalescer(max_pending=3)
+        for i in range(10):
+            coalescer.add(f"line {i}")
+
+        lines = coalescer.drain()
+
+        assert lines[0].startswith("... (7 earlier lines not shown")
+        assert lines[1:] == ["line 7", "line 8", "line 9"]
+        assert coalescer.drain() == []
+
+    def test_concurrent_adds_are_all_delivered(self):
+        coalescer = LogCoalescer(max_pending=10_000)
+        flush_requests = []
+
+        def produce(worker: int) -> None:
+            for i in range(500):
+                if coalescer.add(f"{worker}:{i}"):
+                    flush_requests.append(1)
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(coalescer.drain()) == 2000
+        assert len(flush_requests) == 1
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            LogCoalescer(max_pending=0)
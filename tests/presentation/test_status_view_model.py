@@ -0,0 +1,55 @@
+"""Unit tests for StatusViewModel."""
+
+from types import MappingProxyType
+
+from app.application.pipeline_status import PipelineStage, PipelineStatus
+from app.presentation.status_view_model import (
+    StatusViewModel,
+    db_to_percent,
+    level_to_db,
+)
+
+
+class TestLevelScale:
+    def test_level_to_db(self):
+        assert level_to_db(1.0) == 0.0
+        assert level_to_db(0.01) == -40.0
+        assert level_to_db(0.0) == -80.0
+        assert level_to_db(1e-9) == -80.0
+
+    def test_db_to_percent(self):
+        assert db_to_percent(-80.0) == 0
+        assert db_to_percent(-40.0) == 50
+        assert db_to_percent(0.0) == 100
+
+
+class TestStatusViewModel:
+    def test_uncalibrated_asleep(self):
+        view = StatusViewModel.from_status(PipelineStatus())
+
+        assert view.threshold_percent is None
+        assert view.above_threshold is False
+        assert "not calibrated" in view.level_text
+        assert view.stage_text == "Listening for 'Buddy'"
+        assert view.latency_text == "Last turn: -"
+
+    def test_awake_turn_with_latencies(self):
+        status = PipelineStatus(
+            stage=PipelineStage.SPEAKING,
+            is_awake=True,
+            input_level=0.1,
+            threshold=0.01,
+            last_latencies_ms=MappingProxyType(
+                {PipelineStage.TRANSCRIBING: 310.2, PipelineStage.THINKING: 820.0}
+            ),
+            last_response_ms=1700.4,
+        )
+
+        view = StatusViewModel.from_status(status)
+
+        assert view.stage_text == "Speaking"
+        assert view.above_threshold is True
+        assert view.level_percent == 75
+        assert view.threshold_percent == 50
+        assert view.level_text == "Mic -20 dBFS / threshold -40 dBFS"
+        assert view.latency_text == "Last turn: STT 310 ms · Chat 820 ms · response 1700 ms"
@@ -37,6 +37,9 @@ class TestSpeechToTextConfig:
         config = SpeechToTextConfig()
         assert config.provider == "openai"
         assert config.local_model == "distil-large-v3"
+        assert config.local_batch_window_ms == 0
+        assert config.local_fast_model is None
+        assert config.local_short_clip_seconds == 1.5
 
     def test_custom_config(self):
         """Test custom STT config."""
@@ -147,6 +150,242 @@ class TestAppConfig:
             del os.environ["OPENAI_MODEL"]
             del os.environ["MY_ENGLISH_BUDDY_STT_PROVIDER"]
 
+    def test_from_env_with_local_stt_batch_window(self):
+        """Test reading the local STT batching window."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_BATCH_WINDOW_MS"] = "40"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.stt.local_batch_window_ms == 40
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_BATCH_WINDOW_MS"]
+
+    def test_from_env_with_local_stt_decoding_policy(self):
+        """Test reading the local STT fast model and short-clip threshold."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_FAST_MODEL"] = "tiny.en"
+        os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_SHORT_CLIP_SECONDS"] = "2.5"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.stt.local_fast_model == "tiny.en"
+            assert config.stt.local_short_clip_seconds == 2.5
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_FAST_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_SHORT_CLIP_SECONDS"]
+
+    def test_from_env_invalid_local_stt_batch_window_raises_error(self):
+        """Test that a negative or non-numeric batching window raises ValueError."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+
+        try:
+            for raw in ("-1", "fast"):
+                os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_BATCH_WINDOW_MS"] = raw
+                with pytest.raises(ValueError, match="LOCAL_STT_BATCH_WINDOW_MS"):
+                    AppConfig.from_env()
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_LOCAL_STT_BATCH_WINDOW_MS"]
+
+    def test_from_env_with_model_residency(self):
+        """Test reading the model residency settings."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_MODEL_RELEASE_AFTER_SECONDS"] = "600"
+        os.environ["MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY"] = "released"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.residency.release_after_seconds == 600
+            assert config.residency.stt_sleep_residency == "released"
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_MODEL_RELEASE_AFTER_SECONDS"]
+            del os.environ["MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY"]
+
+    def test_from_env_invalid_stt_sleep_residency_raises_error(self):
+        """Test that an unknown STT sleep residency raises ValueError."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY"] = "frozen"
+
+        try:
+            with pytest.raises(ValueError, match="STT_SLEEP_RESIDENCY"):
+                AppConfig.from_env()
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_STT_SLEEP_RESIDENCY"]
+
+    def test_from_env_with_logging(self):
+        """Test reading the session log settings."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_LOG_DIR"] = "/tmp/buddy-logs"
+        os.environ["MY_ENGLISH_BUDDY_LOG_MAX_FILE_MB"] = "2.5"
+        os.environ["MY_ENGLISH_BUDDY_LOG_ROTATE_HOURS"] = "24"
+        os.environ["MY_ENGLISH_BUDDY_LOG_EVENTS"] = "off"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.logging.log_dir == "/tmp/buddy-logs"
+            assert config.logging.max_file_mb == 2.5
+            assert config.logging.rotate_hours == 24
+            assert config.logging.events is False
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_LOG_DIR"]
+            del os.environ["MY_ENGLISH_BUDDY_LOG_MAX_FILE_MB"]
+            del os.environ["MY_ENGLISH_BUDDY_LOG_ROTATE_HOURS"]
+            del os.environ["MY_ENGLISH_BUDDY_LOG_EVENTS"]
+
+    def test_from_env_with_history(self):
+        """Test reading the conversation history settings."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_HISTORY_DB"] = "data/history.sqlite3"
+        os.environ["MY_ENGLISH_BUDDY_HISTORY_RESUME_TURNS"] = "4"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.history.db_path == "data/history.sqlite3"
+            assert config.history.resume_turns == 4
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_HISTORY_DB"]
+            del os.environ["MY_ENGLISH_BUDDY_HISTORY_RESUME_TURNS"]
+
+    def test_from_env_with_memory(self):
+        """Test reading the long-term memory settings."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_DIR"] = "data/memory"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_MODEL"] = "nomic-embed-text"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_BASE_URL"] = "http://localhost:11434/v1"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_TOP_K"] = "5"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_BUDGET_MS"] = "150"
+        os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_TIMEOUT_SECONDS"] = "2.5"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.memory.index_dir == "data/memory"
+            assert config.memory.embedding_model == "nomic-embed-text"
+            assert config.memory.embedding_base_url == "http://localhost:11434/v1"
+            assert config.memory.top_k == 5
+            assert config.memory.budget_ms == 150
+            assert config.memory.embedding_timeout_seconds == 2.5
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_DIR"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_BASE_URL"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_TOP_K"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_BUDGET_MS"]
+            del os.environ["MY_ENGLISH_BUDDY_MEMORY_EMBEDDING_TIMEOUT_SECONDS"]
+
+    def test_from_env_with_resilience(self):
+        """Test reading the timeout/retry/failover settings."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_CHAT_TIMEOUT_SECONDS"] = "20"
+        os.environ["MY_ENGLISH_BUDDY_STT_TIMEOUT_SECONDS"] = "8"
+        os.environ["MY_ENGLISH_BUDDY_TTS_TIMEOUT_SECONDS"] = "0"
+        os.environ["MY_ENGLISH_BUDDY_RETRIES"] = "1"
+        os.environ["MY_ENGLISH_BUDDY_HEDGE_REQUESTS"] = "true"
+        os.environ["MY_ENGLISH_BUDDY_FAILOVER_TO_LOCAL"] = "yes"
+        os.environ["MY_ENGLISH_BUDDY_FAILOVER_SLOW_SECONDS"] = "3.5"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.resilience.chat_timeout_seconds == 20
+            assert config.resilience.stt_timeout_seconds == 8
+            assert config.resilience.tts_timeout_seconds == 0
+            assert config.resilience.retries == 1
+            assert config.resilience.hedge_requests is True
+            assert config.resilience.failover_to_local is True
+            assert config.resilience.failover_slow_seconds == 3.5
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_CHAT_TIMEOUT_SECONDS"]
+            del os.environ["MY_ENGLISH_BUDDY_STT_TIMEOUT_SECONDS"]
+            del os.environ["MY_ENGLISH_BUDDY_TTS_TIMEOUT_SECONDS"]
+            del os.environ["MY_ENGLISH_BUDDY_RETRIES"]
+            del os.environ["MY_ENGLISH_BUDDY_HEDGE_REQUESTS"]
+            del os.environ["MY_ENGLISH_BUDDY_FAILOVER_TO_LOCAL"]
+            del os.environ["MY_ENGLISH_BUDDY_FAILOVER_SLOW_SECONDS"]
+
+    def test_memory_is_off_by_default(self):
+        """Test that long-term memory needs an index directory."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+
+        try:
+            config = AppConfig.from_env()
+            assert config.memory.index_dir is None
+            assert config.memory.top_k == 3
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+
+    def test_from_env_with_denoise(self):
+        """Test enabling noise suppression from env."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_DENOISE"] = "true"
+
+        try:
+            assert AppConfig.from_env().audio.denoise is True
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_DENOISE"]
+
+    def test_from_env_with_native_sample_rate(self):
+        """Test opening audio devices at their native rate from env."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_NATIVE_SAMPLE_RATE"] = "true"
+
+        try:
+            audio = AppConfig.from_env().audio
+            assert audio.native_sample_rate is True
+            assert audio.denoise is False
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_NATIVE_SAMPLE_RATE"]
+
+    def test_from_env_with_audio_devices(self):
+        """Test selecting audio devices by index or by name from env."""
+        os.environ["OPENAI_API_KEY"] = "test-key"
+        os.environ["OPENAI_MODEL"] = "gpt-4"
+        os.environ["MY_ENGLISH_BUDDY_INPUT_DEVICE"] = " USB Headset "
+        os.environ["MY_ENGLISH_BUDDY_OUTPUT_DEVICE"] = "3"
+
+        try:
+            audio = AppConfig.from_env().audio
+            assert audio.input_device == "USB Headset"
+            assert audio.output_device == 3
+        finally:
+            del os.environ["OPENAI_API_KEY"]
+            del os.environ["OPENAI_MODEL"]
+            del os.environ["MY_ENGLISH_BUDDY_INPUT_DEVICE"]
+            del os.environ["MY_ENGLISH_BUDDY_OUTPUT_DEVICE"]
+
     def test_from_env_with_system_prompt(self):
         """Test creating config with system prompt from env."""
         os.environ["OPENAI_API_KEY"] = "test-key"
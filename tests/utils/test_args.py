@@ -25,3 +25,20 @@ class TestParseArgs:
         """Test parsing with env file path."""
         args = parse_args(["--env-file", "/path/to/.env"])
         assert args.env_file == "/path/to/.env"
+
+    def test_parse_args_defaults_to_gui_text_logs(self):
+        """Test that headless mode is off by default."""
+        args = parse_args([])
+        assert args.headless is False
+        assert args.log_format == "text"
+
+    def test_parse_args_headless_jsonl(self):
+        """Test parsing headless mode with JSONL logs."""
+        args = parse_args(["--headless", "--log-format", "jsonl"])
+        assert args.headless is True
+        assert args.log_format == "jsonl"
+
+    def test_parse_args_profile_startup(self):
+        """Test parsing the startup profiling flag."""
+        assert parse_args([]).profile_startup is False
+        assert parse_args(["--profile-startup"]).profile_startup is True
@@ -0,0 +1,54 @@
+"""Unit tests for EventLog."""
+
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+from app.utils.event_log import EventLog, EventType
+from app.utils.session_log_writer import SessionLogWriter
+
+
+class TestEventLog:
+    """Test cases for EventLog."""
+
+    def test_emit_writes_compact_json_and_drops_none_fields(self):
+        """Test that each event is one JSON object with ts and event."""
+        writer = Mock()
+        event_log = EventLog(writer=writer)
+
+        event_log.emit(EventType.TRANSCRIBED, utterance_id=3, duration_ms=120.5, error=None)
+
+        record = json.loads(writer.write.call_args.args[0])
+        assert record["event"] == "transcribed"
+        assert record["utterance_id"] == 3
+        assert record["duration_ms"] == 120.5
+        assert "error" not in record
+        assert "ts" in record
+
+    def test_emit_without_writer_is_noop(self):
+        """Test that events are dropped when no writer is configured."""
+        event_log = EventLog()
+        assert event_log.enabled is False
+        event_log.emit(EventType.ERROR, error="ignored")
+        event_log.close()
+
+    def test_events_land_in_jsonl_file(self):
+        """Test end-to-end writing through SessionLogWriter."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(
+                Path(temp_dir),
+                started_at=datetime(2024, 1, 2, 3, 4, 5),
+                suffix=".events.jsonl",
+            )
+            event_log = EventLog(writer=writer)
+            event_log.emit(EventType.PLAYBACK_STARTED, request_id=1)
+            event_log.emit(EventType.PLAYBACK_ENDED, request_id=1, duration_ms=900.0)
+            event_log.close()
+
+            lines = (Path(temp_dir) / "2024-01-02_03-04-05.events.jsonl").read_text().splitlines()
+            assert [json.loads(line)["event"] for line in lines] == [
+                "playback_started",
+                "playback_ended",
+            ]
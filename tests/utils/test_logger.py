@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock
 
 from app.utils.logger import Logger
 
@@ -118,3 +119,26 @@ class TestLogger:
         logger.log("Message 2")
         
         assert len(logger._lines) == 2
+
+    def test_in_memory_tail_is_bounded(self):
+        """Test that only the most recent lines are kept for replay."""
+        logger = Logger(tail_size=2)
+        for i in range(5):
+            logger.log(f"Message {i}")
+
+        emitted = []
+        logger.on_emit = emitted.append
+
+        assert emitted == ["Message 3", "Message 4"]
+
+    def test_writer_receives_every_line_and_save_closes_it(self):
+        """Test that lines stream to the writer even beyond the tail size."""
+        writer = Mock()
+        logger = Logger(writer=writer, tail_size=1)
+
+        logger.log("Message 1")
+        logger.log("Message 2")
+        logger.save()
+
+        assert [c.args[0] for c in writer.write.call_args_list] == ["Message 1", "Message 2"]
+        writer.close.assert_called_once()
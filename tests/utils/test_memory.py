@@ -0,0 +1,23 @@
+"""Unit tests for memory helpers."""
+
+import sys
+
+from app.utils.memory import current_rss_bytes, format_bytes, release_unused_memory
+
+
+class TestMemory:
+    def test_current_rss_bytes(self):
+        rss = current_rss_bytes()
+        if sys.platform.startswith("linux"):
+            assert rss is not None and rss > 0
+        else:
+            assert rss is None or rss > 0
+
+    def test_format_bytes(self):
+        assert format_bytes(None) == "n/a"
+        assert format_bytes(512) == "512 B"
+        assert format_bytes(1536) == "1.5 KiB"
+        assert format_bytes(3 * 1024**3) == "3.00 GiB"
+
+    def test_release_unused_memory_does_not_raise(self):
+        release_unused_memory()
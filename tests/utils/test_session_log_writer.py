@@ -0,0 +1,77 @@
+"""Unit tests for SessionLogWriter."""
+
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.utils.session_log_writer import SessionLogWriter
+
+STARTED_AT = datetime(2024, 1, 2, 3, 4, 5)
+
+
+class TestSessionLogWriter:
+    """Test cases for SessionLogWriter."""
+
+    def test_lines_are_on_disk_after_flush(self):
+        """Test that flush() makes queued lines visible without closing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(Path(temp_dir), started_at=STARTED_AT)
+            writer.write("Message 1")
+            writer.write("Message 2")
+
+            assert writer.flush() is True
+
+            path = Path(temp_dir) / "2024-01-02_03-04-05.txt"
+            assert path.read_text(encoding="utf-8") == "Message 1\nMessage 2\n"
+            writer.close()
+
+    def test_lines_are_synced_periodically_without_flush(self):
+        """Test that the writer thread syncs on its own within flush_interval."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(Path(temp_dir), started_at=STARTED_AT, flush_interval=0.01)
+            writer.write("Crash-safe line")
+
+            path = Path(temp_dir) / "2024-01-02_03-04-05.txt"
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if path.exists() and path.read_text(encoding="utf-8"):
+                    break
+                time.sleep(0.01)
+
+            assert path.read_text(encoding="utf-8") == "Crash-safe line\n"
+            writer.close()
+
+    def test_rotates_by_size(self):
+        """Test that a new numbered file is started when max_bytes would be exceeded."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(Path(temp_dir), started_at=STARTED_AT, max_bytes=10)
+            for line in ["aaaa", "bbbb", "cccc"]:
+                writer.write(line)
+            writer.close()
+
+            files = sorted(p.name for p in Path(temp_dir).glob("*.txt"))
+            assert files == ["2024-01-02_03-04-05.1.txt", "2024-01-02_03-04-05.txt"]
+            assert (Path(temp_dir) / "2024-01-02_03-04-05.txt").read_text() == "aaaa\nbbbb\n"
+            assert (Path(temp_dir) / "2024-01-02_03-04-05.1.txt").read_text() == "cccc\n"
+
+    def test_rotates_by_time(self):
+        """Test that a new file is started once rotate_interval has elapsed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(Path(temp_dir), started_at=STARTED_AT, rotate_interval=0.05)
+            writer.write("first")
+            writer.flush()
+            time.sleep(0.1)
+            writer.write("second")
+            writer.close()
+
+            assert len(list(Path(temp_dir).glob("*.txt"))) == 2
+
+    def test_write_after_close_is_ignored(self):
+        """Test that writing to a closed writer does nothing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = SessionLogWriter(Path(temp_dir), started_at=STARTED_AT)
+            writer.close()
+            writer.write("late")
+            assert writer.flush() is True
+            assert list(Path(temp_dir).glob("*.txt")) == []
@@ -0,0 +1,91 @@
+"""Unit tests for StartupProfiler."""
+
+import builtins
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from app.utils.startup_profiler import StartupProfiler, profile_phase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStartupProfiler:
+    def test_nested_phases_are_reported_with_durations(self):
+        clock = FakeClock()
+        profiler = StartupProfiler(clock=clock)
+
+        with profiler.phase("container"):
+            with profiler.phase("stt"):
+                clock.now += 0.25
+            clock.now += 0.05
+
+        report = profiler.report()
+
+        assert "container" in report
+        assert "300.0 ms" in report
+        assert "    stt" in report
+        assert "250.0 ms" in report
+
+    def test_import_hook_times_first_imports_only(self):
+        profiler = StartupProfiler()
+        sys.modules.pop("json.tool", None)
+
+        profiler.install_import_hook()
+        try:
+            with profiler.phase("imports"):
+                import json.tool  # noqa: F401
+                import os  # noqa: F401  # Already loaded; not reported.
+        finally:
+            profiler.uninstall_import_hook()
+
+        report = profiler.report(min_import_ms=0.0)
+        assert "import json.tool" in report
+        assert "import os" not in report
+        assert builtins.__import__ is not profiler._timed_import
+
+    def test_threads_get_separate_trees(self):
+        profiler = StartupProfiler()
+
+        with profiler.phase("window"):
+            pass
+
+        def build() -> None:
+            with profiler.phase("container"):
+                pass
+
+        thread = threading.Thread(target=build, name="loader")
+        thread.start()
+        thread.join()
+
+        report = profiler.report()
+        assert f"[{threading.current_thread().name}]" in report
+        assert "[loader]" in report
+
+    def test_profile_phase_without_profiler_is_noop(self):
+        with profile_phase(None, "anything"):
+            pass
+
+
+class TestLazyImports:
+    def test_di_container_import_does_not_load_heavy_modules(self):
+        code = (
+            "import sys, app.di_container; "
+            "print(','.join(m for m in ('openai', 'sounddevice', 'PySide6') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == ""